@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """AIS message validation and compliance testing."""
 
+import mmap
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -12,11 +14,13 @@ from nmea_lib.types import Position, create_vessel_state
 from nmea_lib.types.vessel import VesselClass, ShipType, NavigationStatus
 from nmea_lib.sentences.aivdm import AISMessageGenerator, validate_aivdm_sentence, extract_message_type
 from nmea_lib.ais.encoder import AIS6BitEncoder
+from nmea_lib.validator import SentenceValidator
 
 
 def test_message_type_1():
     """Test AIS Type 1 message generation and validation."""
-    print("Testing AIS Type 1 (Position Report Class A):")
+    out = []
+    out.append("Testing AIS Type 1 (Position Report Class A):")
     
     # Create test vessel
     vessel = create_vessel_state(
@@ -33,31 +37,34 @@ def test_message_type_1():
     generator = AISMessageGenerator()
     sentences, input_data = generator.generate_type_1(vessel)
     
-    print(f"  Generated {len(sentences)} sentence(s)")
+    out.append(f"  Generated {len(sentences)} sentence(s)")
     for i, sentence in enumerate(sentences):
-        print(f"    Sentence {i+1}: {sentence}")
+        out.append(f"    Sentence {i+1}: {sentence}")
         
         # Validate sentence
         is_valid = validate_aivdm_sentence(sentence)
-        print(f"    Valid: {is_valid}")
+        out.append(f"    Valid: {is_valid}")
         
         # Extract message type
         msg_type = extract_message_type(sentence)
-        print(f"    Message Type: {msg_type}")
+        out.append(f"    Message Type: {msg_type}")
         
         # Check format compliance
         if sentence.startswith('!AIVDM,1,1,,A,') and sentence.count(',') == 6:
-            print(f"    Format: ✅ Single-part AIVDM")
+            out.append(f"    Format: ✅ Single-part AIVDM")
         else:
-            print(f"    Format: ❌ Unexpected format")
+            out.append(f"    Format: ❌ Unexpected format")
     
-    print(f"  Input data: {input_data}")
-    print()
+    out.append(f"  Input data: {input_data}")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_message_type_5():
     """Test AIS Type 5 message generation and validation."""
-    print("Testing AIS Type 5 (Static and Voyage Data):")
+    out = []
+    out.append("Testing AIS Type 5 (Static and Voyage Data):")
     
     # Create test vessel with voyage data
     vessel = create_vessel_state(
@@ -76,27 +83,30 @@ def test_message_type_5():
     generator = AISMessageGenerator()
     sentences, input_data = generator.generate_type_5(vessel)
     
-    print(f"  Generated {len(sentences)} sentence(s)")
+    out.append(f"  Generated {len(sentences)} sentence(s)")
     for i, sentence in enumerate(sentences):
-        print(f"    Sentence {i+1}: {sentence}")
+        out.append(f"    Sentence {i+1}: {sentence}")
         
         # Validate sentence
         is_valid = validate_aivdm_sentence(sentence)
-        print(f"    Valid: {is_valid}")
+        out.append(f"    Valid: {is_valid}")
         
         # Check multi-part format
         if '!AIVDM,2,' in sentence:
-            print(f"    Format: ✅ Multi-part AIVDM")
+            out.append(f"    Format: ✅ Multi-part AIVDM")
         else:
-            print(f"    Format: ❌ Expected multi-part")
+            out.append(f"    Format: ❌ Expected multi-part")
     
-    print(f"  Input data keys: {list(input_data.keys())}")
-    print()
+    out.append(f"  Input data keys: {list(input_data.keys())}")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_message_type_18():
     """Test AIS Type 18 message generation and validation."""
-    print("Testing AIS Type 18 (Class B Position Report):")
+    out = []
+    out.append("Testing AIS Type 18 (Class B Position Report):")
     
     # Create Class B vessel
     vessel = create_vessel_state(
@@ -112,31 +122,34 @@ def test_message_type_18():
     generator = AISMessageGenerator()
     sentences, input_data = generator.generate_type_18(vessel, channel='B')
     
-    print(f"  Generated {len(sentences)} sentence(s)")
+    out.append(f"  Generated {len(sentences)} sentence(s)")
     for i, sentence in enumerate(sentences):
-        print(f"    Sentence {i+1}: {sentence}")
+        out.append(f"    Sentence {i+1}: {sentence}")
         
         # Validate sentence
         is_valid = validate_aivdm_sentence(sentence)
-        print(f"    Valid: {is_valid}")
+        out.append(f"    Valid: {is_valid}")
         
         # Check channel
         if ',B,' in sentence:
-            print(f"    Channel: ✅ Channel B")
+            out.append(f"    Channel: ✅ Channel B")
         else:
-            print(f"    Channel: ❌ Expected Channel B")
+            out.append(f"    Channel: ❌ Expected Channel B")
         
         # Extract message type
         msg_type = extract_message_type(sentence)
-        print(f"    Message Type: {msg_type}")
+        out.append(f"    Message Type: {msg_type}")
     
-    print(f"  Input data: {input_data}")
-    print()
+    out.append(f"  Input data: {input_data}")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_6bit_encoding():
     """Test 6-bit ASCII encoding compliance."""
-    print("Testing 6-bit ASCII Encoding:")
+    out = []
+    out.append("Testing 6-bit ASCII Encoding:")
     
     # Test various binary patterns
     test_cases = [
@@ -148,69 +161,81 @@ def test_6bit_encoding():
     
     for binary, expected in test_cases:
         encoded = AIS6BitEncoder.encode_binary_to_6bit(binary)
-        print(f"  Binary: {binary} -> Encoded: '{encoded}' (Expected: '{expected}')")
+        out.append(f"  Binary: {binary} -> Encoded: '{encoded}' (Expected: '{expected}')")
         
         if encoded == expected:
-            print(f"    ✅ Correct")
+            out.append(f"    ✅ Correct")
         else:
-            print(f"    ❌ Incorrect")
+            out.append(f"    ❌ Incorrect")
         
         # Test round-trip
         decoded = AIS6BitEncoder.decode_6bit_to_binary(encoded)
         if decoded.startswith(binary):
-            print(f"    ✅ Round-trip successful")
+            out.append(f"    ✅ Round-trip successful")
         else:
-            print(f"    ❌ Round-trip failed: {decoded}")
+            out.append(f"    ❌ Round-trip failed: {decoded}")
     
-    print()
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_nmea_sample_compliance():
     """Test compliance with nmea-sample format."""
-    print("Testing NMEA Sample Format Compliance:")
+    out = []
+    out.append("Testing NMEA Sample Format Compliance:")
     
     # Load reference sample if available
     sample_file = Path(__file__).parent.parent / "upload" / "nmea-sample"
     
     if sample_file.exists():
-        print(f"  Loading reference samples from: {sample_file}")
-        
-        with open(sample_file, 'r') as f:
-            lines = f.readlines()
+        out.append(f"  Loading reference samples from: {sample_file}")
         
-        # Find AIVDM sentences
-        aivdm_samples = [line.strip() for line in lines if line.startswith('!AIVDM')]
+        # Scan the mapped file as bytes; only AIVDM lines become objects
+        aivdm_samples = []
+        with open(sample_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    aivdm_samples = [line.rstrip() for line in iter(mm.readline, b'')
+                                     if line.startswith(b'!AIVDM')]
         
-        print(f"  Found {len(aivdm_samples)} AIVDM sentences in reference")
+        out.append(f"  Found {len(aivdm_samples)} AIVDM sentences in reference")
         
         if aivdm_samples:
             # Test first few samples
-            for i, sample in enumerate(aivdm_samples[:5]):
-                print(f"    Sample {i+1}: {sample}")
+            for i, raw_sample in enumerate(aivdm_samples[:5]):
+                sample = raw_sample.decode('ascii', 'replace')
+                out.append(f"    Sample {i+1}: {sample}")
                 
                 # Validate
-                is_valid = validate_aivdm_sentence(sample)
-                print(f"      Valid: {is_valid}")
+                is_valid = validate_aivdm_sentence(raw_sample)
+                out.append(f"      Valid: {is_valid}")
                 
                 # Extract message type
                 msg_type = extract_message_type(sample)
-                print(f"      Message Type: {msg_type}")
+                out.append(f"      Message Type: {msg_type}")
+                
+                # Check format: locate the six header commas and slice between them
+                commas = []
+                pos = sample.find(',')
+                while pos >= 0 and len(commas) < 6:
+                    commas.append(pos)
+                    pos = sample.find(',', pos + 1)
                 
-                # Check format
-                parts = sample.split(',')
-                if len(parts) >= 7:
-                    total_parts = parts[1]
-                    part_num = parts[2]
-                    channel = parts[4]
-                    payload = parts[5]
-                    fill_bits = parts[6].split('*')[0]
+                if len(commas) == 6:
+                    c0, c1, c2, c3, c4, c5 = commas
+                    total_parts = sample[c0 + 1:c1]
+                    part_num = sample[c1 + 1:c2]
+                    channel = sample[c3 + 1:c4]
+                    payload = sample[c4 + 1:c5]
+                    fill_bits = sample[c5 + 1:].partition('*')[0]
                     
-                    print(f"      Parts: {part_num}/{total_parts}, Channel: {channel}, Payload: {len(payload)} chars, Fill: {fill_bits}")
+                    out.append(f"      Parts: {part_num}/{total_parts}, Channel: {channel}, Payload: {len(payload)} chars, Fill: {fill_bits}")
                 
-                print()
+                out.append("")
     else:
-        print(f"  ❌ Reference file not found: {sample_file}")
-        print("  Generating our own samples for format validation...")
+        out.append(f"  ❌ Reference file not found: {sample_file}")
+        out.append("  Generating our own samples for format validation...")
         
         # Generate our own samples and validate format
         vessel = create_vessel_state(
@@ -231,25 +256,28 @@ def test_nmea_sample_compliance():
                 
                 sentences, _ = generator.generate_message(msg_type, vessel)
                 
-                print(f"    Type {msg_type} format check:")
+                out.append(f"    Type {msg_type} format check:")
                 for sentence in sentences:
-                    print(f"      {sentence}")
+                    out.append(f"      {sentence}")
                     
                     # Check NMEA format
                     if sentence.startswith('!AIVDM,') and '*' in sentence:
-                        print(f"      ✅ Valid NMEA format")
+                        out.append(f"      ✅ Valid NMEA format")
                     else:
-                        print(f"      ❌ Invalid NMEA format")
+                        out.append(f"      ❌ Invalid NMEA format")
                 
-                print()
+                out.append("")
                 
             except Exception as e:
-                print(f"    ❌ Error generating Type {msg_type}: {e}")
+                out.append(f"    ❌ Error generating Type {msg_type}: {e}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_checksum_validation():
     """Test NMEA checksum validation."""
-    print("Testing NMEA Checksum Validation:")
+    out = []
+    out.append("Testing NMEA Checksum Validation:")
     
     # Test cases with known checksums
     test_sentences = [
@@ -259,31 +287,29 @@ def test_checksum_validation():
     ]
     
     for sentence in test_sentences:
-        print(f"  Testing: {sentence}")
+        out.append(f"  Testing: {sentence}")
         
         # Manual checksum calculation
         if '*' in sentence:
             body, checksum_part = sentence.split('*')
             body = body[1:]  # Remove '!'
             
-            calculated_checksum = 0
-            for char in body:
-                calculated_checksum ^= ord(char)
-            
             expected_checksum = checksum_part[:2]
-            calculated_hex = f"{calculated_checksum:02X}"
+            calculated_hex = SentenceValidator.calculate_checksum(body)
             
-            print(f"    Expected: {expected_checksum}, Calculated: {calculated_hex}")
+            out.append(f"    Expected: {expected_checksum}, Calculated: {calculated_hex}")
             
-            if expected_checksum.upper() == calculated_hex.upper():
-                print(f"    ✅ Checksum valid")
+            if expected_checksum.upper() == calculated_hex:
+                out.append(f"    ✅ Checksum valid")
             else:
-                print(f"    ❌ Checksum invalid")
+                out.append(f"    ❌ Checksum invalid")
         
         # Validate using our function
         is_valid = validate_aivdm_sentence(sentence)
-        print(f"    Validation result: {is_valid}")
-        print()
+        out.append(f"    Validation result: {is_valid}")
+        out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -19,6 +19,7 @@ from simulator.generators.scenario_generator import (
     CompleteScenarioGenerator,
     generate_complete_scenario
 )
+from simulator.utils.json_io import read_json
 
 
 def main():
@@ -144,31 +145,30 @@ def main():
         nmea_file = files['nmea_file']
         if Path(nmea_file).exists():
             print("Sample NMEA output (first 10 lines):")
-            with open(nmea_file, 'r') as f:
-                for i, line in enumerate(f):
-                    if i >= 10:
-                        break
-                    print(f"  {line.strip()}")
+            # One bounded read is plenty for ten ~80-byte sentences
+            with open(nmea_file, 'rb') as f:
+                head = f.read(4096)
+            for line in head.split(b'\n')[:10]:
+                if line.strip():
+                    print(f"  {line.strip().decode('ascii', 'replace')}")
             print()
         
         # Show statistics
         reference_file = files['reference_file']
         if Path(reference_file).exists():
-            import json
-            with open(reference_file, 'r') as f:
-                data = json.load(f)
-                stats = data.get('statistics', {})
-                
-                print("Generation statistics:")
-                print(f"  Total messages: {stats.get('total_messages', 0):,}")
-                print(f"  GPS messages: {stats.get('gps_messages', 0):,}")
-                print(f"  AIS messages: {stats.get('ais_messages', 0):,}")
-                
-                msg_types = stats.get('message_types', {})
-                if msg_types:
-                    print("  AIS message types:")
-                    for msg_type, count in sorted(msg_types.items()):
-                        print(f"    Type {msg_type}: {count:,} messages")
+            data = read_json(reference_file)
+            stats = data.get('statistics', {})
+            
+            print("Generation statistics:")
+            print(f"  Total messages: {stats.get('total_messages', 0):,}")
+            print(f"  GPS messages: {stats.get('gps_messages', 0):,}")
+            print(f"  AIS messages: {stats.get('ais_messages', 0):,}")
+            
+            msg_types = stats.get('message_types', {})
+            if msg_types:
+                print("  AIS message types:")
+                for msg_type, count in sorted(msg_types.items()):
+                    print(f"    Type {msg_type}: {count:,} messages")
         
         print()
         print("Usage for decoder validation:")
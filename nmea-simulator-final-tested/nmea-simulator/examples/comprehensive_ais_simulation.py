@@ -2,8 +2,8 @@
 """Comprehensive AIS and GPS simulation example."""
 
 import sys
-import time
 import signal
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,21 +15,25 @@ from simulator.core.trace_logger import create_trace_logger
 from simulator.config.multi_vessel import (
     MultiVesselConfigManager, create_san_francisco_bay_scenario
 )
+from simulator.config.parser import OutputConfig
 from simulator.outputs.factory import OutputFactory
 from nmea_lib.types import Position
+from nmea_lib.types.vessel import BaseStationData
+
+
+# Set by Ctrl+C or when the engine finishes; wakes the monitor loop immediately
+stop_event = threading.Event()
 
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully."""
     print("\nReceived interrupt signal. Stopping simulation...")
-    global simulation_running
-    simulation_running = False
+    stop_event.set()
 
 
 def main():
     """Run comprehensive AIS simulation."""
-    global simulation_running
-    simulation_running = True
+    global stop_event
     
     # Setup signal handler
     signal.signal(signal.SIGINT, signal_handler)
@@ -61,6 +65,7 @@ def main():
     
     # Create enhanced simulation engine
     engine = EnhancedSimulationEngine(config)
+    stop_event = engine.stop_event
     
     # Setup trace logging
     trace_logger = create_trace_logger(
@@ -96,10 +101,8 @@ def main():
     
     # Add base stations
     if scenario.base_stations:
-        print("\\nAdding base stations:")
+        print("\nAdding base stations:")
         for bs_config in scenario.base_stations:
-            from nmea_lib.types.vessel import BaseStationData
-            from datetime import datetime
             base_station = BaseStationData(
                 mmsi=bs_config['mmsi'],
                 position=Position(
@@ -144,7 +147,6 @@ def main():
     print("Setting up output handlers:")
     for output_config in output_configs:
         try:
-            from simulator.config.parser import OutputConfig
             config_obj = OutputConfig(
                 type=output_config['type'],
                 enabled=True,
@@ -165,43 +167,37 @@ def main():
     print("Simulation running. Press Ctrl+C to stop.")
     print()
     
-    # Monitor simulation
-    start_time = datetime.now()
-    last_stats_time = start_time
+    # Monitor simulation, waking only to print statistics or when stopped
     stats_interval = 30  # seconds
     
     try:
-        while simulation_running and engine.is_running():
-            time.sleep(1)
-            
+        while not stop_event.wait(stats_interval):
             current_time = datetime.now()
             
-            # Print statistics periodically
-            if (current_time - last_stats_time).total_seconds() >= stats_interval:
-                stats = engine.get_statistics()
-                trace_stats = trace_logger.get_statistics()
-                
-                print(f"\\n--- Statistics at {current_time.strftime('%H:%M:%S')} ---")
-                print(f"Runtime: {stats['runtime_seconds']:.1f}s")
-                print(f"Sentences sent: {stats['sentences_sent']} ({stats['sentences_per_second']:.1f}/s)")
-                print(f"  GPS: {stats['gps_sentences']}")
-                print(f"  AIS: {stats['ais_sentences']}")
-                print(f"Active vessels: {stats['vessels_active']}")
-                print(f"Errors: {stats['errors']}")
-                print(f"Trace entries: {trace_stats['entries_logged']} ({trace_stats.get('entries_per_second', 0):.1f}/s)")
-                
-                # AIS scheduler statistics
-                ais_stats = stats.get('ais_scheduler_stats', {})
-                if ais_stats.get('message_types'):
-                    print("AIS Message Types:")
-                    for msg_type, type_stats in ais_stats['message_types'].items():
-                        print(f"  Type {msg_type}: {type_stats['total_sent']} sent ({type_stats['description']})")
-                
-                print()
-                last_stats_time = current_time
+            # Print statistics
+            stats = engine.get_statistics()
+            trace_stats = trace_logger.get_statistics()
+            
+            print(f"\n--- Statistics at {current_time.strftime('%H:%M:%S')} ---")
+            print(f"Runtime: {stats['runtime_seconds']:.1f}s")
+            print(f"Sentences sent: {stats['sentences_sent']} ({stats['sentences_per_second']:.1f}/s)")
+            print(f"  GPS: {stats['gps_sentences']}")
+            print(f"  AIS: {stats['ais_sentences']}")
+            print(f"Active vessels: {stats['vessels_active']}")
+            print(f"Errors: {stats['errors']}")
+            print(f"Trace entries: {trace_stats['entries_logged']} ({trace_stats.get('entries_per_second', 0):.1f}/s)")
+            
+            # AIS scheduler statistics
+            ais_stats = stats.get('ais_scheduler_stats', {})
+            if ais_stats.get('message_types'):
+                print("AIS Message Types:")
+                for msg_type, type_stats in ais_stats['message_types'].items():
+                    print(f"  Type {msg_type}: {type_stats['total_sent']} sent ({type_stats['description']})")
+            
+            print()
     
     except KeyboardInterrupt:
-        print("\\nInterrupt received.")
+        print("\nInterrupt received.")
     
     # Stop simulation
     print("Stopping simulation...")
@@ -212,7 +208,7 @@ def main():
     final_stats = engine.get_statistics()
     final_trace_stats = trace_logger.get_statistics()
     
-    print("\\n" + "=" * 80)
+    print("\n" + "=" * 80)
     print("SIMULATION COMPLETE")
     print("=" * 80)
     print(f"Total runtime: {final_stats['runtime_seconds']:.1f} seconds")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Enhanced NMEA simulation example showing original NMEA messages."""
 
+import os
 import sys
 import time
 from pathlib import Path
@@ -16,18 +17,24 @@ from simulator.outputs.base import OutputHandler
 
 
 class ConsoleOutput(OutputHandler):
-    """Output handler that displays NMEA sentences to console."""
+    """
+    Output handler that keeps the most recent NMEA sentences for display.
+    
+    Sentences are not printed as they arrive; the status loop in main()
+    shows them periodically, so stdout is not written once per sentence.
+    """
     
     def __init__(self, max_display=5):
         """Initialize console output handler."""
         super().__init__()
         self.max_display = max_display
+        # (talker, type, sentence, sequence number) of the last few sentences
         self.recent_sentences = deque(maxlen=max_display)
     
     def start(self) -> None:
         """Start console output."""
         self.is_running = True
-        print("Console output started - showing NMEA sentences:")
+        print("Console output started - recent NMEA sentences shown with each status update:")
         print("-" * 80)
     
     def stop(self) -> None:
@@ -37,39 +44,26 @@ class ConsoleOutput(OutputHandler):
         print("Console output stopped")
     
     def send_sentence(self, sentence: str) -> bool:
-        """Display NMEA sentence to console."""
+        """Record NMEA sentence for the next status display."""
         if not self.is_running:
             return False
         
-        try:
-            # Parse sentence type from NMEA string
-            sentence_clean = sentence.strip()
-            if sentence_clean.startswith('$') and ',' in sentence_clean:
-                # Extract sentence type (e.g., GPGGA, GPRMC)
-                parts = sentence_clean.split(',')
-                sentence_type = parts[0][1:]  # Remove $ prefix
-                talker_id = sentence_type[:2]  # First 2 chars (GP, GL, etc.)
-                msg_type = sentence_type[2:]   # Last 3 chars (GGA, RMC, etc.)
-                
-                # Store for recent display
-                self.recent_sentences.append({
-                    'sentence': sentence_clean,
-                    'type': msg_type,
-                    'talker': talker_id,
-                    'timestamp': time.time()
-                })
-                
-                # Display immediately
-                print(f"[{msg_type}] {sentence_clean}")
-                
-                self.sentences_sent += 1
-                return True
-            
-        except Exception as e:
-            print(f"Error displaying sentence: {e}")
+        # Parse sentence type from NMEA string; anything else is skipped
+        sentence_clean = sentence.strip()
+        if not sentence_clean.startswith('$') or ',' not in sentence_clean:
             return False
         
-        return False
+        # Extract sentence type (e.g., GPGGA, GPRMC); partition stops at the first comma
+        head, _, _ = sentence_clean.partition(',')
+        sentence_type = head[1:]  # Remove $ prefix
+        talker_id = sentence_type[:2]  # First 2 chars (GP, GL, etc.)
+        msg_type = sentence_type[2:]   # Last 3 chars (GGA, RMC, etc.)
+        
+        # Store for recent display, stamped with the send counter rather than the clock
+        self.recent_sentences.append((talker_id, msg_type, sentence_clean, self.sentences_sent))
+        
+        self.sentences_sent += 1
+        return True
     
     def get_recent_sentences(self):
         """Get recently sent sentences."""
@@ -104,7 +98,7 @@ def main():
     file_output = FileOutput(file_config)
     engine.add_output_handler(file_output)
     
-    # Add console output to see live NMEA messages
+    # Add console output to show recent NMEA messages with each status update
     console_output = ConsoleOutput(max_display=10)
     engine.add_output_handler(console_output)
     
@@ -137,11 +131,12 @@ def main():
             recent = console_output.get_recent_sentences()
             if recent:
                 print(f"  Recent NMEA messages:")
-                for msg in recent[-3:]:  # Show last 3 messages
-                    age = time.time() - msg['timestamp']
-                    print(f"    [{msg['talker']}{msg['type']}] {msg['sentence']} ({age:.1f}s ago)")
+                sent = console_output.sentences_sent
+                for talker_id, msg_type, sentence, sequence in recent[-3:]:  # Show last 3 messages
+                    print(f"    [{talker_id}{msg_type}] {sentence} ({sent - sequence} sentences ago)")
             
             print("-" * 60)
+            sys.stdout.flush()
         
         print("\nSimulation completed!")
         
@@ -156,17 +151,20 @@ def main():
         print(f"  Sentences by type: {stats['sentences_by_type']}")
         
         # Show output file info
-        if Path("nmea_output_enhanced.log").exists():
-            file_size = Path("nmea_output_enhanced.log").stat().st_size
+        try:
+            file_size = os.path.getsize("nmea_output_enhanced.log")
             print(f"  Output file: nmea_output_enhanced.log ({file_size} bytes)")
+        except OSError:
+            pass
         
         # Show sample of generated sentences
         print(f"\nSample NMEA sentences from file:")
         try:
-            with open("nmea_output_enhanced.log", 'r') as f:
+            with open("nmea_output_enhanced.log", 'r', buffering=1 << 20) as f:
                 lines = [line.strip() for line in f if line.startswith('$')]
                 for i, line in enumerate(lines[:5]):  # Show first 5 sentences
-                    sentence_type = line.split(',')[0][1:] if ',' in line else "UNKNOWN"
+                    head, sep, _ = line.partition(',')
+                    sentence_type = head[1:] if sep else "UNKNOWN"
                     print(f"  {i+1}. [{sentence_type}] {line}")
                 if len(lines) > 5:
                     print(f"  ... and {len(lines)-5} more sentences")
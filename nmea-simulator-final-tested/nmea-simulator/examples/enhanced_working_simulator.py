@@ -11,7 +11,6 @@ This example demonstrates the complete NMEA simulator with:
 
 import sys
 import os
-import json
 import time
 import socket
 import threading
@@ -23,24 +22,49 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from nmea_lib.types import Position
 from nmea_lib.sentences.aivdm import AISMessageGenerator
-from nmea_lib.types.datetime import NMEATime, NMEADate
+from nmea_lib.types.datetime import NMEATime
 from nmea_lib.types.vessel import VesselState, VesselClass, ShipType, NavigationStatus
 
 from simulator.generators.vessel import EnhancedVesselGenerator, create_default_vessel_config
-from nmea_lib.parser import SentenceBuilder
-from nmea_lib.base import TalkerId, SentenceId
+from simulator.generators.fleet import VesselFleet
+from simulator.utils.json_io import dumps, write_json
+from nmea_lib.validator import SentenceValidator
 
+# Output files are written sequentially and never seek, so use a large buffer
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Fixed GGA/RMC layouts (sentence bodies without '$' and checksum)
+_GGA_BODY_TEMPLATE = "GPGGA,{time},{lat},{lat_hem},{lon},{lon_hem},{fix},{sats},{hdop:.1f},{alt:.1f},M,{geoid:.1f},M,,"
+_RMC_BODY_TEMPLATE = "GPRMC,{time},{status},{lat},{lat_hem},{lon},{lon_hem},{sog:.1f},{cog:.1f},{date},{mag_var:.1f},{mag_var_dir},{mode}"
+
+# One compact NDJSON reference row; string fields are passed in already JSON-encoded and
+# floats use repr(), which is what the JSON encoder emits for them
+_REFERENCE_ROW_TEMPLATE = (
+    '{{"timestamp":"{ts}","message_type":"{msg_type}","sentence":{sentence},'
+    '"vessel_mmsi":{mmsi},"ais_message_type":{ais_type},"vessel_data":{{"name":{name},'
+    '"position":{{"latitude":{lat!r},"longitude":{lon!r}}},"sog":{sog!r},"cog":{cog!r},'
+    '"heading":{heading},"rot":{rot},"nav_status":"{nav_status}"}}}}\n'
+)
+
+
+
+def _json_text(value):
+    """JSON-encode a value for splicing into a reference row."""
+    return dumps(value).decode('utf-8')
 
 class NetworkOutput:
     """Handle TCP and UDP network output."""
     
-    def __init__(self, tcp_port=None, udp_port=None, udp_host="255.255.255.255"):
+    def __init__(self, tcp_port=None, udp_port=None, udp_host="255.255.255.255", udp_max_datagram=1472):
         self.tcp_port = tcp_port
         self.udp_port = udp_port
         self.udp_host = udp_host
+        self.udp_max_datagram = udp_max_datagram  # Ethernet MTU minus IP/UDP headers
+        self._udp_buf = bytearray()  # Whole sentences waiting for the next datagram
         self.tcp_server = None
         self.udp_socket = None
         self.tcp_clients = []
+        self.clients_lock = threading.Lock()  # Shared with the accept thread
         self.running = False
         if tcp_port: self._setup_tcp_server()
         if udp_port: self._setup_udp_socket()
@@ -72,7 +96,8 @@ class NetworkOutput:
         while self.running and self.tcp_server:
             try:
                 client_socket, address = self.tcp_server.accept()
-                self.tcp_clients.append(client_socket)
+                with self.clients_lock:
+                    self.tcp_clients.append(client_socket)
                 print(f"TCP client connected from {address}")
             except socket.timeout: continue
             except Exception as e:
@@ -80,25 +105,65 @@ class NetworkOutput:
                 break
     
     def send_sentence(self, sentence):
-        sentence_with_newline = sentence + "\n"
-        if self.tcp_clients:
-            disconnected_clients = []
-            for client in self.tcp_clients:
-                try: client.send(sentence_with_newline.encode('utf-8'))
-                except: disconnected_clients.append(client)
-            for client in disconnected_clients:
-                self.tcp_clients.remove(client)
-                try: client.close()
-                except: pass
+        self._send_bytes((sentence + "\n").encode('utf-8'))
+    
+    def send_blob(self, blob):
+        """Send a block of newline-terminated sentences (str or pre-encoded bytes)."""
+        self._send_bytes(blob if isinstance(blob, bytes) else blob.encode('utf-8'))
+    
+    def _send_bytes(self, payload):
+        """Send an already-encoded payload with one sendall per TCP client and one UDP sendto."""
+        with self.clients_lock:
+            clients = list(self.tcp_clients)
+        if clients:
+            # Send outside the lock so a slow client doesn't hold up accepts
+            failed_clients = []
+            for client in clients:
+                try:
+                    client.sendall(payload)
+                except:
+                    failed_clients.append(client)
+            if failed_clients:
+                with self.clients_lock:
+                    for client in failed_clients:
+                        if client in self.tcp_clients:
+                            self.tcp_clients.remove(client)
+                for client in failed_clients:
+                    try: client.close()
+                    except: pass
         if self.udp_socket and self.udp_port:
-            try:
-                self.udp_socket.sendto(sentence_with_newline.encode('utf-8'), (self.udp_host, self.udp_port))
-            except Exception as e: print(f"UDP send error: {e}")
+            self._queue_udp(payload)
+    
+    def _queue_udp(self, payload):
+        """Pack newline-terminated sentences into datagrams, sending each one as it fills up."""
+        buf = self._udp_buf
+        if len(buf) + len(payload) <= self.udp_max_datagram:
+            buf += payload
+            return
+        for line in payload.splitlines(keepends=True):
+            if buf and len(buf) + len(line) > self.udp_max_datagram:
+                self._send_datagram(bytes(buf))
+                buf.clear()
+            buf += line
+    
+    def flush_udp(self):
+        """Send whatever is waiting in the UDP buffer; call at the end of each simulation step."""
+        if self._udp_buf and self.udp_socket:
+            self._send_datagram(bytes(self._udp_buf))
+        self._udp_buf.clear()
+    
+    def _send_datagram(self, datagram):
+        try:
+            self.udp_socket.sendto(datagram, (self.udp_host, self.udp_port))
+        except Exception as e: print(f"UDP send error: {e}")
     
     def close(self):
+        self.flush_udp()
         self.running = False
         if self.tcp_server: self.tcp_server.close()
-        for client in self.tcp_clients:
+        with self.clients_lock:
+            clients, self.tcp_clients = self.tcp_clients, []
+        for client in clients:
             try: client.close()
             except: pass
         if self.udp_socket: self.udp_socket.close()
@@ -112,7 +177,8 @@ class EnhancedNMEASimulator:
         self.output_dir.mkdir(exist_ok=True)
         
         self.vessel_generators: list[EnhancedVesselGenerator] = [] # Store generators
-        self.reference_data = []
+        self._ref_f = None  # NDJSON reference stream, open only while a scenario runs
+        self._ref_names = {}  # MMSI -> JSON-encoded vessel name for reference rows
         self.message_count = 0
         
         self.network = NetworkOutput(tcp_port, udp_port)
@@ -143,20 +209,33 @@ class EnhancedNMEASimulator:
         })
 
         for config in vessel_configs:
-            self.vessel_generators.append(EnhancedVesselGenerator(config))
+            generator = EnhancedVesselGenerator(config)
+            state = generator.get_current_state()
+            # Static and voyage data never change during a run, so a bad value is caught here
+            # rather than by the AIS encoders on every tick
+            if not (state.static_data.validate() and state.voyage_data.validate()):
+                raise ValueError(f"Invalid static/voyage data for vessel {state.mmsi}")
+            self.vessel_generators.append(generator)
 
     def generate_scenario(self, duration_minutes=1): # Shortened for testing
         print(f"Generating {duration_minutes}-minute scenario with {len(self.vessel_generators)} dynamic vessels...")
         
         nmea_file = self.output_dir / "nmea_output_dynamic.txt"
-        reference_file = self.output_dir / "reference_data_dynamic.json"
+        reference_file = self.output_dir / "reference_data_dynamic.jsonl"
+        meta_file = self.output_dir / "reference_data_dynamic.meta.json"
         human_file = self.output_dir / "human_readable_dynamic.txt"
         
-        sim_current_time = datetime.utcnow()
-        sim_start_time = sim_current_time
-        sim_end_time = sim_start_time + timedelta(minutes=duration_minutes)
+        sim_start_time = datetime.utcnow()
+        duration_seconds = duration_minutes * 60
         
-        with open(nmea_file, 'w') as nmea_f, open(human_file, 'w') as human_f:
+        # The NMEA stream gets one pre-encoded blob per step, so write it unbuffered
+        # (a raw FileIO, one write() syscall per blob) rather than through two buffer layers
+        with open(nmea_file, 'wb', buffering=0) as nmea_f, \
+             open(human_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as human_f, \
+             open(reference_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as ref_f:
+            self._ref_f = ref_f
+            self._ref_names = {vg.get_current_state().mmsi: _json_text(vg.get_current_state().static_data.vessel_name)
+                               for vg in self.vessel_generators}
             human_f.write("Dynamic NMEA Simulator Output - Human Readable\n" + "="*60 + "\n" +
                           f"Generated: {sim_start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n" +
                           f"Duration: {duration_minutes} minutes\n" +
@@ -164,124 +243,180 @@ class EnhancedNMEASimulator:
             
             step = 0
             time_step_seconds = 1.0
+            time_step = timedelta(seconds=time_step_seconds)
+            # Steps at which something is emitted or reported; vessels are only advanced at these
+            gps_every, ais1_every, ais5_every, progress_every = 5, 10, 30, 15
+            emit_every = (gps_every, ais1_every, ais5_every, progress_every)
+            # Per-vessel GGA/RMC fields that stay fixed for the whole run
+            gps_static = [self._gps_static_fields(vg.get_current_state().navigation_data)
+                          for vg in self.vessel_generators]
+            fleet, patterned = self._build_fleet()
+            # Steps are whole seconds from the start, so the NMEA time's fractional part
+            # ("" or ".mmm") is the same all run; everything else is sliced from the ISO string
+            nmea_time_suffix = NMEATime.from_datetime(sim_start_time).to_nmea()[6:]
 
-            while sim_current_time < sim_end_time:
-                step += 1
+            while True:
+                # Jump straight to the next step where a block fires
+                next_step = min(step + every - step % every for every in emit_every)
+                elapsed_steps = next_step - step
+                step = next_step
+                # Simulation clock as plain seconds; a datetime is only built for steps that run
+                elapsed_loop = (step - 1) * time_step_seconds
+                if elapsed_loop >= duration_seconds:
+                    break
+                sim_current_time = sim_start_time + (step - 1) * time_step
+                # Sentences and human-readable records produced this step, written once at the end
+                pending_nmea = []
+                pending_human = []
                 
-                for v_gen in self.vessel_generators:
-                    v_gen.update_vessel_state(elapsed_seconds=time_step_seconds, current_time=sim_current_time)
+                # Advance every vessel over the skipped steps and reuse its state for all message blocks below
+                fleet.step(elapsed_steps * time_step_seconds, sim_current_time)
+                for v_gen in patterned:
+                    v_gen.update_vessel_state(elapsed_seconds=elapsed_steps * time_step_seconds,
+                                              current_time=sim_current_time)
+                states = [v_gen.get_current_state() for v_gen in self.vessel_generators]
                 
-                if step % 5 == 0: # GPS every 5s
-                    for v_gen in self.vessel_generators:
-                        v_state = v_gen.get_current_state()
-                        gps_sentences = self._generate_gps_sentences(v_state, sim_current_time)
+                # Timestamp strings shared by every vessel in this step
+                iso_ts = sim_current_time.isoformat()
+                clock_str = iso_ts[11:19]
+                
+                if step % gps_every == 0: # GPS every 5s
+                    # YYYY-MM-DDTHH:MM:SS -> hhmmss[.sss] and ddmmyy
+                    time_str = f"{iso_ts[11:13]}{iso_ts[14:16]}{iso_ts[17:19]}{nmea_time_suffix}"
+                    date_str = f"{iso_ts[8:10]}{iso_ts[5:7]}{iso_ts[2:4]}"
+                    for v_state, static_fields in zip(states, gps_static):
+                        gps_sentences = self._generate_gps_sentences(v_state, time_str, date_str, static_fields)
                         for sentence in gps_sentences:
-                            nmea_f.write(sentence + "\n"); self.network.send_sentence(sentence)
-                            self._add_reference_data(sentence, "GPS", sim_current_time, v_state, None)
-                            self._write_human_readable(human_f, sentence, "GPS", sim_current_time, v_state)
+                            pending_nmea.append(sentence)
+                            self._add_reference_data(sentence, "GPS", iso_ts, v_state, None)
+                            pending_human.append(self._format_human_readable(sentence, "GPS", clock_str, v_state))
                 
-                if step % 10 == 0: # AIS Type 1 every 10s
-                    for v_gen in self.vessel_generators:
-                        v_state = v_gen.get_current_state()
-                        try:
-                            ais_sentences, _ = self.ais_message_generator.generate_type_1(v_state)
-                            for sentence in ais_sentences:
-                                nmea_f.write(sentence + "\n"); self.network.send_sentence(sentence)
-                                self._add_reference_data(sentence, "AIS", sim_current_time, v_state, 1)
-                                self._write_human_readable(human_f, sentence, "AIS", sim_current_time, v_state, 1)
-                        except Exception as e: print(f"Error AIS Type 1 for {v_state.mmsi}: {e}")
+                if step % ais1_every == 0: # AIS Type 1 every 10s
+                    for v_state in states:
+                        ais_sentences, _ = self.ais_message_generator.generate_type_1(v_state)
+                        for sentence in ais_sentences:
+                            pending_nmea.append(sentence)
+                            self._add_reference_data(sentence, "AIS", iso_ts, v_state, 1)
+                            pending_human.append(self._format_human_readable(sentence, "AIS", clock_str, v_state, 1))
                 
-                if step % 30 == 0: # AIS Type 5 every 30s (was 60)
-                    for v_gen in self.vessel_generators:
-                        v_state = v_gen.get_current_state()
+                if step % ais5_every == 0: # AIS Type 5 every 30s (was 60)
+                    for v_state in states:
                         if v_state.static_data.vessel_class == VesselClass.CLASS_A:
-                            try:
-                                ais_sentences, _ = self.ais_message_generator.generate_type_5(v_state)
-                                for sentence in ais_sentences:
-                                    nmea_f.write(sentence + "\n"); self.network.send_sentence(sentence)
-                                    self._add_reference_data(sentence, "AIS", sim_current_time, v_state, 5)
-                                    self._write_human_readable(human_f, sentence, "AIS", sim_current_time, v_state, 5)
-                            except Exception as e: print(f"Error AIS Type 5 for {v_state.mmsi}: {e}")
+                            ais_sentences, _ = self.ais_message_generator.generate_type_5(v_state)
+                            for sentence in ais_sentences:
+                                pending_nmea.append(sentence)
+                                self._add_reference_data(sentence, "AIS", iso_ts, v_state, 5)
+                                pending_human.append(self._format_human_readable(sentence, "AIS", clock_str, v_state, 5))
                 
-                if step % 15 == 0:
-                    elapsed_loop = (sim_current_time - sim_start_time).total_seconds()
-                    progress = elapsed_loop / (duration_minutes * 60) * 100
-                    tcp_clients = len(self.network.tcp_clients)
-                    print(f"Progress: {progress:.1f}% - SimTime: {sim_current_time.strftime('%H:%M:%S')} - Msgs: {self.message_count} - TCP Clients: {tcp_clients}")
+                if pending_nmea:
+                    blob = ("\n".join(pending_nmea) + "\n").encode('ascii')
+                    nmea_f.write(blob); self.network.send_blob(blob); self.network.flush_udp()
+                    human_f.write("".join(pending_human))
                 
-                sim_current_time += timedelta(seconds=time_step_seconds)
+                if step % progress_every == 0:
+                    progress = elapsed_loop / duration_seconds * 100
+                    tcp_clients = len(self.network.tcp_clients)
+                    print(f"Progress: {progress:.1f}% - SimTime: {clock_str} - Msgs: {self.message_count} - TCP Clients: {tcp_clients}")
+            
+            self._ref_f = None
+        self._save_reference_metadata(meta_file)
         
-        self._save_reference_data(reference_file)
         print(f"\nScenario generation complete! Generated {self.message_count} messages.")
         # ... (rest of file printing)
-        return {'nmea_file': str(nmea_file), 'reference_file': str(reference_file), 'human_readable': str(human_file)}
+        return {'nmea_file': str(nmea_file), 'reference_file': str(reference_file),
+                'reference_meta_file': str(meta_file), 'human_readable': str(human_file)}
 
-    def _generate_gps_sentences(self, vessel_state: VesselState, current_time: datetime):
-        sentences = []
+    def _build_fleet(self):
+        """Batch linear movers into one VesselFleet; other patterns keep their own generator."""
+        linear = [vg for vg in self.vessel_generators if vg.movement_pattern.pattern_type == 'linear']
+        patterned = [vg for vg in self.vessel_generators if vg.movement_pattern.pattern_type != 'linear']
+        fleet = VesselFleet(
+            [vg.get_current_state() for vg in linear],
+            max_speed=[vg.max_speed for vg in linear],
+            position_noise=[vg.movement_pattern.position_noise for vg in linear]
+        )
+        return fleet, patterned
+
+    @staticmethod
+    def _gps_static_fields(nav):
+        """Resolve the optional GGA/RMC fields once, falling back to fixed defaults."""
+        fix_quality = getattr(nav, 'fix_quality', None)
+        altitude = getattr(nav, 'altitude', None)
+        geoid_height = getattr(nav, 'geoid_height', None)
+        status = getattr(nav, 'status', None)
+        mag_var_dir = getattr(nav, 'magnetic_variation_direction', None)
+        mode = getattr(nav, 'mode_indicator', None)
+        return (str(fix_quality.value if fix_quality else 1),
+                str(getattr(nav, 'satellites_in_use', 8)),
+                getattr(nav, 'hdop', 1.2),
+                altitude.value if altitude else 0.0,
+                geoid_height.value if geoid_height else 19.6,
+                status.value if status else "A",
+                getattr(nav, 'magnetic_variation', 0.0),
+                mag_var_dir.value if mag_var_dir else "E",
+                mode.value if mode else "A")
+
+    def _generate_gps_sentences(self, vessel_state: VesselState, time_str, date_str, static_fields):
+        (fix_quality, satellites, hdop, altitude, geoid_height,
+         status, mag_var, mag_var_dir, mode) = static_fields
         nav = vessel_state.navigation_data
-        nmea_time_obj = NMEATime.from_datetime(current_time)
-        nmea_date_obj = NMEADate.from_date(current_time.date())
-        time_str = nmea_time_obj.to_nmea()
-        date_str = nmea_date_obj.to_nmea()
-        
-        gga_builder = SentenceBuilder(TalkerId.GP, SentenceId.GGA)
-        gga_builder.add_field(time_str)
         lat_str, lat_hem, lon_str, lon_hem = nav.position.to_nmea()
-        gga_builder.add_field(lat_str).add_field(lat_hem).add_field(lon_str).add_field(lon_hem)
-        gga_builder.add_field(str(nav.fix_quality.value if hasattr(nav, 'fix_quality') and nav.fix_quality else 1))
-        gga_builder.add_field(str(nav.satellites_in_use if hasattr(nav, 'satellites_in_use') else 8))
-        gga_builder.add_float_field(nav.hdop if hasattr(nav, 'hdop') else 1.2, 1)
-        gga_builder.add_float_field(nav.altitude.value if hasattr(nav, 'altitude') and nav.altitude else 0.0, 1)
-        gga_builder.add_field("M")
-        gga_builder.add_float_field(nav.geoid_height.value if hasattr(nav, 'geoid_height') and nav.geoid_height else 19.6, 1)
-        gga_builder.add_field("M").add_field("").add_field("")
-        sentences.append(gga_builder.build().strip())
         
-        rmc_builder = SentenceBuilder(TalkerId.GP, SentenceId.RMC)
-        rmc_builder.add_field(time_str)
-        rmc_builder.add_field(nav.status.value if hasattr(nav, 'status') and nav.status else "A")
-        rmc_builder.add_field(lat_str).add_field(lat_hem).add_field(lon_str).add_field(lon_hem)
-        rmc_builder.add_float_field(nav.sog, 1)
-        rmc_builder.add_float_field(nav.cog, 1)
-        rmc_builder.add_field(date_str)
-        rmc_builder.add_float_field(nav.magnetic_variation if hasattr(nav, 'magnetic_variation') else 0.0, 1)
-        rmc_builder.add_field(nav.magnetic_variation_direction.value if hasattr(nav, 'magnetic_variation_direction') and nav.magnetic_variation_direction else "E")
-        rmc_builder.add_field(nav.mode_indicator.value if hasattr(nav, 'mode_indicator') and nav.mode_indicator else "A")
-        sentences.append(rmc_builder.build().strip())
-        return sentences
+        gga_body = _GGA_BODY_TEMPLATE.format(
+            time=time_str, lat=lat_str, lat_hem=lat_hem, lon=lon_str, lon_hem=lon_hem,
+            fix=fix_quality, sats=satellites, hdop=hdop, alt=altitude, geoid=geoid_height)
+        rmc_body = _RMC_BODY_TEMPLATE.format(
+            time=time_str, status=status, lat=lat_str, lat_hem=lat_hem, lon=lon_str, lon_hem=lon_hem,
+            sog=nav.sog, cog=nav.cog, date=date_str, mag_var=mag_var, mag_var_dir=mag_var_dir, mode=mode)
+        checksum = SentenceValidator.calculate_checksum
+        return [f"${gga_body}*{checksum(gga_body)}", f"${rmc_body}*{checksum(rmc_body)}"]
 
-    def _add_reference_data(self, sentence, msg_type, timestamp, vessel_state: VesselState, ais_msg_type=None):
+    def _add_reference_data(self, sentence, msg_type, iso_ts, vessel_state: VesselState, ais_msg_type=None):
         nav = vessel_state.navigation_data
-        static = vessel_state.static_data
-        ref = {
-            'timestamp': timestamp.isoformat(), 'message_type': msg_type, 'sentence': sentence,
-            'vessel_mmsi': vessel_state.mmsi, 'ais_message_type': ais_msg_type,
-            'vessel_data': {
-                'name': static.vessel_name,
-                'position': {'latitude': nav.position.latitude, 'longitude': nav.position.longitude},
-                'sog': nav.sog, 'cog': nav.cog, 'heading': nav.heading, 'rot': nav.rot,
-                'nav_status': nav.nav_status.name
-            }}
-        self.reference_data.append(ref)
+        position = nav.position
+        # Formatted straight into the row; AIS payloads can contain '\\', so the sentence is still JSON-encoded
+        self._ref_f.write(_REFERENCE_ROW_TEMPLATE.format(
+            ts=iso_ts, msg_type=msg_type, sentence=_json_text(sentence),
+            mmsi=vessel_state.mmsi, ais_type='null' if ais_msg_type is None else ais_msg_type,
+            name=self._ref_names[vessel_state.mmsi],
+            lat=position.latitude, lon=position.longitude, sog=nav.sog, cog=nav.cog,
+            heading=nav.heading, rot=nav.rot, nav_status=nav.nav_status.name))
         self.message_count += 1
 
-    def _write_human_readable(self, file, sentence, msg_type, timestamp, v_state: VesselState, ais_msg_type=None):
-        time_str = timestamp.strftime('%H:%M:%S')
+    def _format_human_readable(self, sentence, msg_type, clock_str, v_state: VesselState, ais_msg_type=None):
         nav = v_state.navigation_data; static = v_state.static_data
-        file.write(f"[{time_str}] ")
+        text = f"[{clock_str}] "
         if msg_type == 'GPS':
-            file.write(f"GPS ({static.vessel_name} MMSI: {v_state.mmsi}) {sentence.split(',')[0]}: " +
-                       f"Pos={nav.position.latitude:.4f},{nav.position.longitude:.4f} SOG={nav.sog:.1f} COG={nav.cog:.1f}\n")
+            text += (f"GPS ({static.vessel_name} MMSI: {v_state.mmsi}) {sentence.split(',')[0]}: " +
+                     f"Pos={nav.position.latitude:.4f},{nav.position.longitude:.4f} SOG={nav.sog:.1f} COG={nav.cog:.1f}\n")
         elif msg_type == 'AIS':
-            file.write(f"AIS Type {ais_msg_type} ({static.vessel_name} MMSI: {v_state.mmsi}): " +
-                       f"Pos={nav.position.latitude:.4f},{nav.position.longitude:.4f} SOG={nav.sog:.1f} COG={nav.cog:.1f} HDG={nav.heading}\n")
-        file.write(f"  Sentence: {sentence}\n\n")
+            text += (f"AIS Type {ais_msg_type} ({static.vessel_name} MMSI: {v_state.mmsi}): " +
+                     f"Pos={nav.position.latitude:.4f},{nav.position.longitude:.4f} SOG={nav.sog:.1f} COG={nav.cog:.1f} HDG={nav.heading}\n")
+        return text + f"  Sentence: {sentence}\n\n"
 
-    def _save_reference_data(self, file_path):
-        v_gens_info = [{'mmsi': vg.get_current_state().mmsi, 'name': vg.get_current_state().static_data.vessel_name} for vg in self.vessel_generators]
-        data = {'generation_info': {'timestamp': datetime.utcnow().isoformat(), 'vessel_count': len(self.vessel_generators), 'total_messages': self.message_count},
-                'vessels_initial_config_summary': v_gens_info, 'messages': self.reference_data}
-        with open(file_path, 'w') as f: json.dump(data, f, indent=2)
+    def _save_reference_metadata(self, file_path):
+        """Save the run summary that accompanies the streamed reference rows."""
+        vessel_gens_info = []
+        for v_gen in self.vessel_generators:
+            vs = v_gen.get_current_state()
+            vessel_gens_info.append({
+                'mmsi': vs.mmsi,
+                'name': vs.static_data.vessel_name,
+                'call_sign': vs.static_data.callsign,
+                'ship_type': vs.static_data.ship_type.value,
+                'vessel_class': vs.static_data.vessel_class.value
+            })
+
+        data = {
+            'generation_info': {
+                'timestamp': datetime.utcnow().isoformat(),
+                'vessel_count': len(self.vessel_generators),
+                'total_messages': self.message_count
+            },
+            'vessels_initial_config_summary': vessel_gens_info
+        }
+        
+        write_json(file_path, data, indent=True)
 
     def close(self): self.network.close()
 
@@ -3,8 +3,10 @@
 
 import sys
 import time
+import signal
 import threading
 import socket
+import selectors
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -15,31 +17,63 @@ from simulator.config.parser import ConfigParser
 from simulator.outputs.factory import OutputFactory
 
 
+# One receive call can drain many queued sentences (or the largest UDP datagram)
+RECV_BUFFER_SIZE = 65536
+# Kernel receive buffer requested for the UDP client; capped by net.core.rmem_max
+UDP_RCVBUF_BYTES = 12 * 1024 * 1024
+# Client tests print a running summary at most this often instead of every sentence
+PRINT_INTERVAL_SECONDS = 1.0
+
+
 def tcp_client_test(host='localhost', port=10110, duration=30):
     """Test TCP client connection."""
     print(f"Starting TCP client test to {host}:{port}")
     
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock, \
+                selectors.DefaultSelector() as selector:
             sock.connect((host, port))
-            sock.settimeout(5.0)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            selector.register(sock, selectors.EVENT_READ)
+            
+            # Reuse one receive buffer; bytes after the last newline are kept in
+            # pending so a sentence split across two reads is counted once, whole
+            buffer = bytearray(RECV_BUFFER_SIZE)
+            view = memoryview(buffer)
+            pending = bytearray()
             
             start_time = time.time()
             sentence_count = 0
+            last_print = time.monotonic()
             
-            while time.time() - start_time < duration:
+            while True:
+                # Block until data arrives or the test duration is up
+                remaining = duration - (time.time() - start_time)
+                if remaining <= 0:
+                    break
+                if not selector.select(timeout=remaining):
+                    continue
                 try:
-                    data = sock.recv(1024)
-                    if data:
-                        sentences = data.decode('utf-8').strip().split('\n')
-                        for sentence in sentences:
-                            if sentence.startswith('$'):
-                                sentence_count += 1
-                                print(f"TCP: {sentence}")
-                    else:
+                    nbytes = sock.recv_into(buffer)
+                    if not nbytes:
                         break
-                except socket.timeout:
-                    continue
+                    pending += view[:nbytes]
+                    end = pending.rfind(b'\n')
+                    if end < 0:
+                        continue
+                    # Sentences are counted as bytes; only the printed one is decoded
+                    for line in pending[:end].split(b'\n'):
+                        sentence = line.strip()
+                        if sentence.startswith(b'$'):
+                            sentence_count += 1
+                            last_sentence = sentence
+                    del pending[:end + 1]
+                    
+                    now = time.monotonic()
+                    if sentence_count and now - last_print >= PRINT_INTERVAL_SECONDS:
+                        print(f"TCP: {sentence_count} sentences, "
+                              f"last: {last_sentence[:60].decode('ascii', 'replace')}")
+                        last_print = now
                 except Exception as e:
                     print(f"TCP client error: {e}")
                     break
@@ -55,23 +89,45 @@ def udp_client_test(host='localhost', port=10111, duration=30):
     print(f"Starting UDP client test on port {port}")
     
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock, \
+                selectors.DefaultSelector() as selector:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_BYTES)
+            # Let repeated runs (or another listener) bind the same port right away
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             sock.bind(('', port))
-            sock.settimeout(5.0)
+            selector.register(sock, selectors.EVENT_READ)
+            
+            # Datagrams are received into one reusable buffer instead of a new bytes object each
+            buffer = bytearray(RECV_BUFFER_SIZE)
             
             start_time = time.time()
             sentence_count = 0
+            last_print = time.monotonic()
             
-            while time.time() - start_time < duration:
-                try:
-                    data, addr = sock.recvfrom(1024)
-                    if data:
-                        sentence = data.decode('utf-8').strip()
-                        if sentence.startswith('$'):
-                            sentence_count += 1
-                            print(f"UDP from {addr[0]}: {sentence}")
-                except socket.timeout:
+            while True:
+                # Block until a datagram arrives or the test duration is up
+                remaining = duration - (time.time() - start_time)
+                if remaining <= 0:
+                    break
+                if not selector.select(timeout=remaining):
                     continue
+                try:
+                    nbytes, addr = sock.recvfrom_into(buffer)
+                    if nbytes:
+                        # A datagram may carry several CRLF-terminated sentences;
+                        # they are counted as bytes and only the printed one is decoded
+                        for sentence in buffer[:nbytes].splitlines():
+                            if sentence.startswith(b'$'):
+                                sentence_count += 1
+                                last_sentence = sentence
+                        
+                        now = time.monotonic()
+                        if sentence_count and now - last_print >= PRINT_INTERVAL_SECONDS:
+                            print(f"UDP from {addr[0]}: {sentence_count} sentences, "
+                                  f"last: {last_sentence[:60].decode('ascii', 'replace')}")
+                            last_print = now
                 except Exception as e:
                     print(f"UDP client error: {e}")
                     break
@@ -124,10 +180,10 @@ def main():
     
     # Start client test threads
     client_threads = []
+    enabled_types = {oc.type for oc in config.output_configs if oc.enabled}
     
     # Check if TCP output is configured
-    tcp_enabled = any(oc.type == 'tcp' and oc.enabled for oc in config.output_configs)
-    if tcp_enabled:
+    if 'tcp' in enabled_types:
         tcp_thread = threading.Thread(
             target=tcp_client_test, 
             args=('localhost', 10110, 60), 
@@ -136,8 +192,7 @@ def main():
         client_threads.append(tcp_thread)
     
     # Check if UDP output is configured
-    udp_enabled = any(oc.type == 'udp' and oc.enabled for oc in config.output_configs)
-    if udp_enabled:
+    if 'udp' in enabled_types:
         udp_thread = threading.Thread(
             target=udp_client_test, 
             args=('localhost', 10111, 60), 
@@ -145,6 +200,9 @@ def main():
         )
         client_threads.append(udp_thread)
     
+    # Ctrl+C wakes the monitor loop below right away instead of at its next tick
+    previous_sigint = signal.signal(signal.SIGINT, lambda signum, frame: engine.request_shutdown())
+    
     try:
         print("Starting simulation...")
         engine.start()
@@ -159,19 +217,23 @@ def main():
         # Monitor simulation
         start_time = time.time()
         while engine.running:
-            time.sleep(10)  # Update every 10 seconds
+            if engine.wait_until_finished(10):  # Update every 10 seconds
+                break
             
             status = engine.get_status()
             elapsed = time.time() - start_time
+            pos = status['position']
             
-            print(f"\n[{elapsed:6.1f}s] Simulation Status:")
-            print(f"  Position: {status['position']['latitude']:.6f}, {status['position']['longitude']:.6f}")
-            print(f"  Speed: {status['position']['speed_knots']:.1f} knots")
-            print(f"  Heading: {status['position']['heading_degrees']:.1f}°")
-            print(f"  Total sentences: {status['statistics']['total_sentences']}")
+            lines = [
+                f"\n[{elapsed:6.1f}s] Simulation Status:",
+                f"  Position: {pos['latitude']:.6f}, {pos['longitude']:.6f}",
+                f"  Speed: {pos['speed_knots']:.1f} knots",
+                f"  Heading: {pos['heading_degrees']:.1f}°",
+                f"  Total sentences: {status['statistics']['total_sentences']}",
+            ]
             
             # Show output handler status
-            for i, handler_status in enumerate(status['output_handlers']):
+            for handler_status in status['output_handlers']:
                 handler_type = "unknown"
                 if 'server_address' in handler_status:
                     handler_type = "TCP"
@@ -180,27 +242,33 @@ def main():
                 elif 'file_path' in handler_status:
                     handler_type = "File"
                 
-                print(f"  {handler_type} output: {handler_status.get('sentences_sent', 0)} sentences")
+                lines.append(f"  {handler_type} output: {handler_status.get('sentences_sent', 0)} sentences")
                 
                 if handler_type == "TCP":
-                    client_count = handler_status.get('client_count', 0)
-                    print(f"    TCP clients: {client_count}")
+                    lines.append(f"    TCP clients: {handler_status.get('client_count', 0)}")
+            
+            # One write per tick instead of a print per line
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
         
-        print("\nSimulation completed!")
+        interrupted = engine.stop_event.is_set()
+        print("\nSimulation interrupted by user" if interrupted else "\nSimulation completed!")
         
         # Show final statistics
         final_status = engine.get_status()
         stats = final_status['statistics']
         
-        print(f"\nFinal Statistics:")
-        print(f"  Total sentences: {stats['total_sentences']}")
-        print(f"  Runtime: {stats['runtime_seconds']:.1f} seconds")
-        print(f"  Rate: {stats['sentences_per_second']:.1f} sentences/second")
-        print(f"  Sentences by type: {stats['sentences_by_type']}")
+        print(f"\nFinal Statistics:\n"
+              f"  Total sentences: {stats['total_sentences']}\n"
+              f"  Runtime: {stats['runtime_seconds']:.1f} seconds\n"
+              f"  Rate: {stats['sentences_per_second']:.1f} sentences/second\n"
+              f"  Sentences by type: {stats['sentences_by_type']}")
         
         # Wait for client threads to finish
-        for thread in client_threads:
-            thread.join(timeout=5)
+        if not interrupted:
+            for thread in client_threads:
+                thread.join(timeout=5)
     
     except KeyboardInterrupt:
         print("\nSimulation interrupted by user")
@@ -211,6 +279,7 @@ def main():
         traceback.print_exc()
     
     finally:
+        signal.signal(signal.SIGINT, previous_sigint)
         print("Stopping simulation...")
         engine.stop()
         print("Done.")
@@ -9,11 +9,20 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 import math
-from datetime import datetime, timedelta
-from nmea_lib.types import Position, Speed, Bearing, SpeedUnit, BearingType
+from datetime import datetime
+from nmea_lib.types import Position, Speed, Bearing, SpeedUnit, BearingType, haversine_distance
 from simulator.generators.position import PositionGenerator
 
 
+# Conversion factors; the knots-to-km/h and knots-to-mph factors are folded
+# so each converted speed costs a single multiply from knots
+KNOTS_TO_MS = 0.514444
+MS_TO_KMH = 3.6
+MS_TO_MPH = 2.23694
+KNOTS_TO_KMH = KNOTS_TO_MS * MS_TO_KMH
+KNOTS_TO_MPH = KNOTS_TO_MS * MS_TO_MPH
+
+
 def demonstrate_position_calculation():
     """Demonstrate step-by-step position calculation."""
     
@@ -54,31 +63,29 @@ def demonstrate_position_calculation():
     current_time = datetime.now()
     total_distance = 0.0
     
-    for i in range(10):
-        # Update position (1 second intervals)
-        elapsed_time = 1.0
-        current_time += timedelta(seconds=elapsed_time)
-        
-        # Get previous position for distance calculation
-        prev_position = generator.current_position
-        
-        # Update position
-        state = generator.update_position(elapsed_time, current_time)
-        
-        # Calculate distance moved
+    # Run all position updates (1 second intervals) in one call, then display each step
+    track = generator.update_positions_track(10, 1.0, current_time)
+    lats, lons = track.latitude, track.longitude
+    
+    for i in range(len(track)):
+        # Calculate distance moved since the previous step
         if i > 0:
-            distance_moved = prev_position.distance_to(state.position)
+            distance_moved = haversine_distance(lats[i - 1], lons[i - 1], lats[i], lons[i])
             total_distance += distance_moved
         else:
             distance_moved = 0.0
         
         # Display results
-        print(f"   {i+1:<8} {state.position.latitude:<12.6f} {state.position.longitude:<13.6f} "
-              f"{state.speed.value:<8.2f} {state.heading.value:<8.1f} {distance_moved:<10.2f}")
+        print(f"   {i+1:<8} {lats[i]:<12.6f} {lons[i]:<13.6f} "
+              f"{track.speed[i]:<8.2f} {track.heading[i]:<8.1f} {distance_moved:<10.2f}")
+    
+    # Average over the span of the displayed fixes (first to last)
+    span_seconds = (track.timestamp(len(track) - 1) - track.timestamp(0)).total_seconds()
+    average_speed = total_distance / span_seconds / KNOTS_TO_MS if span_seconds > 0 else 0.0
     
     print(f"\n4. SUMMARY:")
     print(f"   Total distance traveled: {total_distance:.2f} meters")
-    print(f"   Average speed: {generator.get_average_speed():.2f} knots")
+    print(f"   Average speed: {average_speed:.2f} knots")
     print(f"   Final position: {generator.current_position}")
 
 
@@ -168,22 +175,17 @@ def demonstrate_speed_conversion():
     
     speed_knots = 5.0
     
-    # Conversion factors
-    knots_to_ms = 0.514444
-    ms_to_kmh = 3.6
-    ms_to_mph = 2.23694
-    
-    speed_ms = speed_knots * knots_to_ms
-    speed_kmh = speed_ms * ms_to_kmh
-    speed_mph = speed_ms * ms_to_mph
+    speed_ms = speed_knots * KNOTS_TO_MS
+    speed_kmh = speed_knots * KNOTS_TO_KMH
+    speed_mph = speed_knots * KNOTS_TO_MPH
     
     print(f"\n1. SPEED CONVERSIONS:")
     print(f"   Original speed: {speed_knots} knots")
     print(f"   ")
     print(f"   Conversion factors:")
-    print(f"   - 1 knot = {knots_to_ms} m/s")
-    print(f"   - 1 m/s = {ms_to_kmh} km/h")
-    print(f"   - 1 m/s = {ms_to_mph} mph")
+    print(f"   - 1 knot = {KNOTS_TO_MS} m/s")
+    print(f"   - 1 m/s = {MS_TO_KMH} km/h")
+    print(f"   - 1 m/s = {MS_TO_MPH} mph")
     print(f"   ")
     print(f"   Converted speeds:")
     print(f"   - {speed_ms:.3f} m/s")
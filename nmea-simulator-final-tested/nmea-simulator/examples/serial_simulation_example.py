@@ -16,9 +16,12 @@ from simulator.outputs.serial import SerialOutput, SerialOutputConfig
 from simulator.outputs.factory import OutputFactory # For potential use with full config parsing
 from simulator.config.parser import OutputConfig as GlobalOutputConfig # For potential use with full config parsing
 
-def run_serial_example():
+def run_serial_example(verbose: bool = False):
     """
     Runs a simple demonstration of the SerialOutput handler.
+
+    Args:
+        verbose: Print every sentence as it is sent instead of a per-batch summary.
     """
     print("NMEA Simulator - Serial Output Example")
     print("------------------------------------")
@@ -75,25 +78,33 @@ def run_serial_example():
                 "$GPVTG,054.7,T,,M,005.5,N,010.2,K*48",
             ]
 
+            # Split each sentence around the "123519" time field once and encode
+            # the pieces, so each batch only has to join bytes with the current time.
+            # Sentences without a time field get a None suffix and are sent as-is.
+            templates = []
+            for sentence in nmea_sentences:
+                prefix, placeholder, suffix = sentence.partition("123519")
+                if placeholder:
+                    templates.append((prefix.encode('ascii'), (suffix + '\r\n').encode('ascii')))
+                else:
+                    templates.append(((sentence + '\r\n').encode('ascii'), None))
+
             for i in range(5): # Send a few batches of sentences
                 print(f"\nSending batch {i+1}...")
-                for sentence in nmea_sentences:
-                    # Slightly modify sentence to see changes if looping
-                    timestamp = time.strftime("%H%M%S", time.gmtime())
-                    modified_sentence = sentence.replace("123519", timestamp)
-
-                    # Recalculate checksum (simple placeholder, real NMEA lib would do this)
-                    # For this example, we'll send with potentially incorrect checksum if time changes
-                    # or use a fixed one. The important part is the sending.
-                    # A real sentence generator would handle checksums.
-                    # Let's assume sentences are pre-checksummed for this basic example.
-
-                    print(f"  Sending: {modified_sentence}")
-                    if serial_output_handler.send_sentence(modified_sentence):
-                        print(f"    -> Sent successfully.")
-                    else:
-                        print(f"    -> Failed to send.")
-                    time.sleep(0.5) # Pause between sentences
+                # Slightly modify sentences to see changes if looping.
+                # Checksums are not recalculated; a real sentence generator would handle them.
+                timestamp = time.strftime("%H%M%S", time.gmtime()).encode('ascii')
+                # The whole batch goes out in a single write
+                payload = b"".join(prefix if suffix is None else prefix + timestamp + suffix
+                                   for prefix, suffix in templates)
+
+                if serial_output_handler.send_bytes(payload, sentence_count=len(templates)):
+                    print(f"  {len(templates)} sentences sent.")
+                    if verbose:
+                        for line in payload.decode('ascii').splitlines():
+                            print(f"  Sent: {line}")
+                else:
+                    print("  Failed to send batch.")
 
                 if i < 4: # Don't sleep after the last batch
                     print("Waiting 2 seconds before next batch...")
@@ -138,4 +149,4 @@ def run_serial_example():
 
 
 if __name__ == "__main__":
-    run_serial_example()
+    run_serial_example(verbose="-v" in sys.argv[1:])
@@ -3,6 +3,7 @@
 
 import sys
 import time
+import signal
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -41,6 +42,9 @@ def main():
     file_output = FileOutput(output_config)
     engine.add_output_handler(file_output)
     
+    # Ctrl+C wakes the monitor loop below right away instead of at its next tick
+    previous_sigint = signal.signal(signal.SIGINT, lambda signum, frame: engine.request_shutdown())
+    
     try:
         print("Starting simulation...")
         engine.start()
@@ -48,28 +52,30 @@ def main():
         # Monitor simulation
         start_time = time.time()
         while engine.running:
-            time.sleep(5)  # Update every 5 seconds
+            if engine.wait_until_finished(5):  # Update every 5 seconds
+                break
             
-            status = engine.get_status()
+            latitude, longitude, speed_knots, heading_degrees = engine.get_position_snapshot()
             elapsed = time.time() - start_time
             
             print(f"[{elapsed:6.1f}s] "
-                  f"Pos: {status['position']['latitude']:.6f}, {status['position']['longitude']:.6f} "
-                  f"Speed: {status['position']['speed_knots']:.1f}kts "
-                  f"Heading: {status['position']['heading_degrees']:.1f}° "
-                  f"Sentences: {status['statistics']['total_sentences']}")
+                  f"Pos: {latitude:.6f}, {longitude:.6f} "
+                  f"Speed: {speed_knots:.1f}kts "
+                  f"Heading: {heading_degrees:.1f}° "
+                  f"Sentences: {engine.total_sentences_generated}")
         
-        print("\nSimulation completed!")
+        interrupted = engine.stop_event.is_set()
+        print("\nSimulation interrupted by user" if interrupted else "\nSimulation completed!")
         
         # Show final statistics
         final_status = engine.get_status()
         stats = final_status['statistics']
         
-        print(f"\nFinal Statistics:")
-        print(f"  Total sentences: {stats['total_sentences']}")
-        print(f"  Runtime: {stats['runtime_seconds']:.1f} seconds")
-        print(f"  Rate: {stats['sentences_per_second']:.1f} sentences/second")
-        print(f"  Sentences by type: {stats['sentences_by_type']}")
+        print(f"\nFinal Statistics:\n"
+              f"  Total sentences: {stats['total_sentences']}\n"
+              f"  Runtime: {stats['runtime_seconds']:.1f} seconds\n"
+              f"  Rate: {stats['sentences_per_second']:.1f} sentences/second\n"
+              f"  Sentences by type: {stats['sentences_by_type']}")
         
         # Show output file info
         if Path("nmea_output.log").exists():
@@ -83,6 +89,7 @@ def main():
         print(f"Error during simulation: {e}")
     
     finally:
+        signal.signal(signal.SIGINT, previous_sigint)
         print("Stopping simulation...")
         engine.stop()
         print("Done.")
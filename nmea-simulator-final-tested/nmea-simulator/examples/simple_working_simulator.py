@@ -7,26 +7,76 @@ This example demonstrates the NMEA simulator with dynamic AIS message generation
 
 import sys
 import os
-import json
-import time # time.sleep might be useful if running interactively
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta
+from heapq import merge
+from itertools import chain, count, groupby, repeat
+from operator import itemgetter
 from pathlib import Path
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from nmea_lib.types import Position
-# from nmea_lib.types.units import Distance, DistanceUnit # Not directly used after refactor
-# from nmea_lib.sentences.gga import GGASentence # Built manually now
-# from nmea_lib.sentences.rmc import RMCSentence # Built manually now
+from nmea_lib.base import SentenceId
 from nmea_lib.sentences.aivdm import AISMessageGenerator
-from nmea_lib.types.datetime import NMEATime, NMEADate # Used by GPS sentence generation
-from nmea_lib.types.vessel import VesselState, VesselClass, ShipType, NavigationStatus # Used by GPS
-# from nmea_lib.types import create_vessel_state # Replaced by EnhancedVesselGenerator config
+from nmea_lib.types.datetime import NMEATime # Fractional-second layout of GPS times
+from nmea_lib.types.vessel import VesselState, VesselClass, ShipType
 
 from simulator.generators.vessel import EnhancedVesselGenerator, create_default_vessel_config
-from nmea_lib.parser import SentenceBuilder # For GPS sentences
-from nmea_lib.base import TalkerId, SentenceId # For GPS sentences
+from simulator.generators.fleet import VesselFleet
+from nmea_lib.validator import SentenceValidator # For GPS sentence checksums
+from simulator.utils.json_io import dumps, loads, write_json
+
+# Output files are written sequentially and never seek, so use a large buffer
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Simulated seconds between explicit flushes, so readers tailing the files see
+# steady progress instead of one large write whenever the buffer fills
+FLUSH_INTERVAL_SECONDS = 60
+
+# Fleets at least this large format GPS sentences in a process pool; below it,
+# shipping each step's positions to the workers costs more than it saves
+PARALLEL_GPS_MIN_VESSELS = 500
+
+
+def _gps_formatter(gga_tail, rmc_status, rmc_tail):
+    """
+    Build a function producing one vessel's GGA and RMC sentences.
+    
+    The arguments are the vessel's pre-formatted constant fields. The returned
+    function takes the position, SOG, COG and the step's time and date strings
+    and returns (SentenceId, sentence) pairs.
+    """
+    checksum = SentenceValidator.calculate_checksum
+    gga_id, rmc_id = SentenceId.GGA, SentenceId.RMC
+    
+    def format_gps(position, sog, cog, time_str, date_str):
+        lat_str, lat_hem, lon_str, lon_hem = position.to_nmea()
+        gga_body = f"GPGGA,{time_str},{lat_str},{lat_hem},{lon_str},{lon_hem},{gga_tail}"
+        rmc_body = (f"GPRMC,{time_str},{rmc_status},{lat_str},{lat_hem},{lon_str},{lon_hem},"
+                    f"{sog:.1f},{cog:.1f},{date_str},{rmc_tail}")
+        return [(gga_id, f"${gga_body}*{checksum(gga_body)}"),
+                (rmc_id, f"${rmc_body}*{checksum(rmc_body)}")]
+    
+    return format_gps
+
+
+# GPS formatters of a pool worker process, built once by _init_gps_worker
+_worker_gps_formatters = []
+
+
+def _init_gps_worker(gps_constants):
+    """Process pool initializer: build the formatters for every vessel in the fleet."""
+    _worker_gps_formatters[:] = [_gps_formatter(*constants) for constants in gps_constants]
+
+
+def _format_gps_chunk(task):
+    """Format GPS sentences for a contiguous slice of the fleet inside a pool worker."""
+    start, time_str, date_str, kinematics = task
+    formatters = _worker_gps_formatters
+    return [formatters[start + i](Position(lat, lon), sog, cog, time_str, date_str)
+            for i, (lat, lon, sog, cog) in enumerate(kinematics)]
 
 
 class SimpleNMEASimulator:
@@ -38,13 +88,20 @@ class SimpleNMEASimulator:
         self.output_dir.mkdir(exist_ok=True)
         
         self.vessel_generators: list[EnhancedVesselGenerator] = []
-        self.reference_data = []
         self.message_count = 0
         
         # AISMessageGenerator is used to create AIVDM sentences from VesselState
         self.ais_message_generator = AISMessageGenerator()
         
         self._create_dynamic_vessels()
+        # Per-vessel GGA/RMC formatters with the fields that never change baked in
+        self._gps_constants = [self._gps_constant_fields(v_gen.get_current_state().navigation_data)
+                               for v_gen in self.vessel_generators]
+        self._gps_formatters = [_gps_formatter(*constants) for constants in self._gps_constants]
+        self._gps_chunk_size = None  # Vessels per pool task, set when a GPS pool is started
+        # Vessel class is static, so the Type 5 (Class A only) senders are resolved once
+        self._type5_generators = [v_gen for v_gen in self.vessel_generators
+                                  if v_gen.get_current_state().static_data.vessel_class is VesselClass.CLASS_A]
     
     def _create_dynamic_vessels(self):
         """Create dynamic vessel generators."""
@@ -75,195 +132,279 @@ class SimpleNMEASimulator:
         # vessel2_config = create_default_vessel_config(mmsi=367002345, name="DYNAMIC PACIFIC", position=pos2)
         # self.vessel_generators.append(EnhancedVesselGenerator(vessel2_config))
 
-    def generate_scenario(self, duration_minutes=1): # Shortened for easier testing
-        """Generate a complete scenario with reference data."""
+    def generate_scenario(self, duration_minutes=1, workers=None): # Shortened for easier testing
+        """
+        Generate a complete scenario with reference data.
+        
+        Fleets of PARALLEL_GPS_MIN_VESSELS or more format their GPS sentences in
+        a pool of `workers` processes (default: one per CPU).
+        """
         
         print(f"Generating {duration_minutes}-minute scenario with {len(self.vessel_generators)} dynamic vessel(s)...")
         
         nmea_file = self.output_dir / "nmea_output_dynamic.txt"
-        reference_file = self.output_dir / "reference_data_dynamic.json"
+        reference_file = self.output_dir / "reference_data_dynamic.jsonl"
+        meta_file = self.output_dir / "reference_data_dynamic.meta.json"
         human_file = self.output_dir / "human_readable_dynamic.txt"
         
         # Use a fixed start time for reproducibility of simulation path if time_factor is involved
         # For this script, current_time is advanced by 1 real second per step.
-        sim_current_time = datetime.utcnow()
-        sim_start_time = sim_current_time
+        sim_start_time = datetime.utcnow()
         sim_end_time = sim_start_time + timedelta(minutes=duration_minutes)
         
-        with open(nmea_file, 'w') as nmea_f, open(human_file, 'w') as human_f:
-            human_f.write("Dynamic NMEA Simulator Output - Human Readable\n")
-            human_f.write("=" * 60 + "\n")
-            human_f.write(f"Generated: {sim_start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
-            human_f.write(f"Duration: {duration_minutes} minutes\n")
-            human_f.write(f"Vessels: {len(self.vessel_generators)}\n")
-            human_f.write("=" * 60 + "\n\n")
-            
+        # Reference rows are streamed one JSON object per line as they are produced; the
+        # human-readable log is rendered from them after the run
+        with open(nmea_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as nmea_f, \
+             open(reference_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as ref_f, \
+             self._gps_pool(workers) as gps_pool:
             step = 0
             time_step_seconds = 1.0 # Each step in the loop represents 1 second of simulated time
+            time_step = timedelta(seconds=time_step_seconds)
+            # Steps at which something is emitted or reported; vessels are only advanced at these
+            schedule = self._emission_schedule({'gps': 5, 'ais1': 10, 'ais5': 30, 'progress': 15})
+            fleet, patterned = self._build_fleet()
+            # Steps are whole seconds from the start, so the NMEA time's fractional part
+            # ("" or ".mmm") is the same all run; everything else is sliced from the ISO string
+            nmea_time_suffix = NMEATime.from_datetime(sim_start_time).to_nmea()[6:]
+            flush_every = int(FLUSH_INTERVAL_SECONDS / time_step_seconds)
+            last_flush_step = 0
 
-            while sim_current_time < sim_end_time:
-                step += 1
+            for next_step, due in schedule:
+                elapsed_steps = next_step - step
+                step = next_step
+                sim_current_time = sim_start_time + (step - 1) * time_step
+                if sim_current_time >= sim_end_time:
+                    break
                 
-                # Update all vessel states
-                for v_gen in self.vessel_generators:
-                    v_gen.update_vessel_state(elapsed_seconds=time_step_seconds, current_time=sim_current_time)
+                # Advance all vessels over the skipped steps: linear movers in one batched
+                # fleet step, the rest individually
+                fleet.step(elapsed_steps * time_step_seconds, sim_current_time)
+                for v_gen in patterned:
+                    v_gen.update_vessel_state(elapsed_seconds=elapsed_steps * time_step_seconds,
+                                              current_time=sim_current_time)
+                # Sentences (each followed by its newline) and reference rows produced
+                # this step, written once at the end
+                pending_nmea = []
+                pending_ref = []
+                # ISO timestamp shared by every reference row in this step
+                iso_ts = sim_current_time.isoformat()
                 
                 # Generate GPS sentences every 5 seconds (for each vessel)
-                if step % 5 == 0:
-                    for v_gen in self.vessel_generators:
-                        vessel_state = v_gen.get_current_state()
-                        gps_sentences = self._generate_gps_sentences(vessel_state, sim_current_time)
-                        for sentence in gps_sentences:
-                            nmea_f.write(sentence + "\n")
-                            self._add_reference_data(sentence, "GPS", sim_current_time, vessel_state.mmsi, vessel_state)
-                            self._write_human_readable(human_f, sentence, "GPS", sim_current_time, vessel_state)
+                if 'gps' in due:
+                    # YYYY-MM-DDTHH:MM:SS -> hhmmss[.sss] and ddmmyy
+                    time_str = f"{iso_ts[11:13]}{iso_ts[14:16]}{iso_ts[17:19]}{nmea_time_suffix}"
+                    date_str = f"{iso_ts[8:10]}{iso_ts[5:7]}{iso_ts[2:4]}"
+                    states = [v_gen.get_current_state() for v_gen in self.vessel_generators]
+                    gps_batches = self._format_gps_batches(states, time_str, date_str, gps_pool)
+                    for vessel_state, gps_sentences in zip(states, gps_batches):
+                        for _, sentence in gps_sentences:
+                            pending_nmea += (sentence, "\n")
+                            pending_ref.append(self._reference_row(sentence, "GPS", iso_ts, vessel_state.mmsi, vessel_state))
                 
                 # Generate AIS Type 1 messages every 10 seconds (for each vessel)
-                if step % 10 == 0:
+                if 'ais1' in due:
                     for v_gen in self.vessel_generators:
                         vessel_state = v_gen.get_current_state()
                         try:
                             # Use the AISMessageGenerator instance
                             ais_sentences, _ = self.ais_message_generator.generate_type_1(vessel_state)
                             for sentence in ais_sentences:
-                                nmea_f.write(sentence + "\n")
-                                self._add_reference_data(sentence, "AIS", sim_current_time, vessel_state.mmsi, vessel_state, 1)
-                                self._write_human_readable(human_f, sentence, "AIS", sim_current_time, vessel_state, 1)
+                                pending_nmea += (sentence, "\n")
+                                pending_ref.append(self._reference_row(sentence, "AIS", iso_ts, vessel_state.mmsi, vessel_state, 1))
                         except Exception as e:
                             print(f"Error generating AIS Type 1 for vessel {vessel_state.mmsi}: {e}")
                 
                 # Generate AIS Type 5 messages every 30 seconds (was 60)
-                if step % 30 == 0:
-                    for v_gen in self.vessel_generators:
+                if 'ais5' in due:
+                    for v_gen in self._type5_generators:
                         vessel_state = v_gen.get_current_state()
-                        if vessel_state.static_data.vessel_class == VesselClass.CLASS_A: # Type 5 is for Class A
-                            try:
-                                ais_sentences, _ = self.ais_message_generator.generate_type_5(vessel_state)
-                                for sentence in ais_sentences:
-                                    nmea_f.write(sentence + "\n")
-                                    self._add_reference_data(sentence, "AIS", sim_current_time, vessel_state.mmsi, vessel_state, 5)
-                                    self._write_human_readable(human_f, sentence, "AIS", sim_current_time, vessel_state, 5)
-                            except Exception as e:
-                                print(f"Error generating AIS Type 5 for vessel {vessel_state.mmsi}: {e}")
+                        try:
+                            ais_sentences, _ = self.ais_message_generator.generate_type_5(vessel_state)
+                            for sentence in ais_sentences:
+                                pending_nmea += (sentence, "\n")
+                                pending_ref.append(self._reference_row(sentence, "AIS", iso_ts, vessel_state.mmsi, vessel_state, 5))
+                        except Exception as e:
+                            print(f"Error generating AIS Type 5 for vessel {vessel_state.mmsi}: {e}")
                 
-                if step % 15 == 0: # Print progress more often for shorter test
+                if pending_nmea:
+                    nmea_f.write("".join(pending_nmea))
+                    ref_f.write(b"".join(pending_ref))
+                    self.message_count += len(pending_ref)
+                
+                if step - last_flush_step >= flush_every:
+                    nmea_f.flush()
+                    ref_f.flush()
+                    last_flush_step = step
+                
+                if 'progress' in due: # Print progress more often for shorter test
                     elapsed_loop = (sim_current_time - sim_start_time).total_seconds()
                     progress = elapsed_loop / (duration_minutes * 60) * 100
-                    print(f"Progress: {progress:.1f}% - Sim Time: {sim_current_time.strftime('%H:%M:%S')} - Messages: {self.message_count}")
-                
-                sim_current_time += timedelta(seconds=time_step_seconds)
+                    print(f"Progress: {progress:.1f}% - Sim Time: {iso_ts[11:19]} - Messages: {self.message_count}")
         
-        self._save_reference_data(reference_file)
+        self._write_human_readable(human_file, reference_file, sim_start_time, duration_minutes)
+        self._save_reference_metadata(meta_file)
         
         print(f"\nScenario generation complete!")
         print(f"Generated {self.message_count} messages")
         print(f"Files created in '{self.output_dir}':")
         print(f"  NMEA output: {nmea_file.name}")
-        print(f"  Reference data: {reference_file.name}")
+        print(f"  Reference data: {reference_file.name} (metadata: {meta_file.name})")
         print(f"  Human readable: {human_file.name}")
         
         return {
             'nmea_file': str(nmea_file),
             'reference_file': str(reference_file),
+            'reference_meta_file': str(meta_file),
             'human_readable': str(human_file)
         }
     
-    # _update_vessel_positions is removed as EnhancedVesselGenerator handles updates.
-    
-    def _generate_gps_sentences(self, vessel_state: VesselState, current_time: datetime):
-        """Generate GPS sentences for a vessel state."""
-        sentences = []
-        nav = vessel_state.navigation_data
+    @staticmethod
+    def _emission_schedule(intervals):
+        """
+        Yield (step, kinds) for every step at which at least one event is due.
         
-        nmea_time_obj = NMEATime.from_datetime(current_time)
-        nmea_date_obj = NMEADate.from_date(current_time.date())
-        time_str = nmea_time_obj.to_nmea()
-        date_str = nmea_date_obj.to_nmea()
+        intervals maps an event kind to its period in steps. The per-kind
+        timelines are merged lazily, so the caller stops whenever the run ends.
+        """
+        timelines = [zip(count(every, every), repeat(kind)) for kind, every in intervals.items()]
+        for step, events in groupby(merge(*timelines), key=itemgetter(0)):
+            yield step, {kind for _, kind in events}
+    
+    def _build_fleet(self):
+        """Batch linear movers into one VesselFleet; other patterns keep their own generator."""
+        linear = [vg for vg in self.vessel_generators if vg.movement_pattern.pattern_type == 'linear']
+        patterned = [vg for vg in self.vessel_generators if vg.movement_pattern.pattern_type != 'linear']
+        fleet = VesselFleet(
+            [vg.get_current_state() for vg in linear],
+            max_speed=[vg.max_speed for vg in linear],
+            position_noise=[vg.movement_pattern.position_noise for vg in linear]
+        )
+        return fleet, patterned
+    
+    @staticmethod
+    def _gps_constant_fields(nav):
+        """
+        Pre-format the GGA and RMC fields that do not change during a run.
         
-        gga_builder = SentenceBuilder(TalkerId.GP, SentenceId.GGA)
-        gga_builder.add_field(time_str)
-
-        lat_str, lat_hem, lon_str, lon_hem = nav.position.to_nmea()
-        gga_builder.add_field(lat_str).add_field(lat_hem).add_field(lon_str).add_field(lon_hem)
-        gga_builder.add_field(str(nav.fix_quality.value if hasattr(nav, 'fix_quality') else 1)) # Assuming fix_quality is available
-        gga_builder.add_field(str(nav.satellites_in_use if hasattr(nav, 'satellites_in_use') else 8))
-        gga_builder.add_float_field(nav.hdop if hasattr(nav, 'hdop') else 1.2, 1)
-        gga_builder.add_float_field(nav.altitude.value if hasattr(nav, 'altitude') else 0.0, 1)
-        gga_builder.add_field("M")
-        gga_builder.add_float_field(nav.geoid_height.value if hasattr(nav, 'geoid_height') else 19.6, 1)
-        gga_builder.add_field("M").add_field("").add_field("")
-        sentences.append(gga_builder.build().strip())
+        Fix quality, satellites, HDOP, altitude, geoid height, status, magnetic
+        variation and mode are returned as (gga_tail, rmc_status, rmc_tail)
+        strings, ready for _gps_formatter.
+        """
+        fix_quality = getattr(nav, 'fix_quality', None)
+        altitude = getattr(nav, 'altitude', None)
+        geoid_height = getattr(nav, 'geoid_height', None)
+        status = getattr(nav, 'status', None)
+        mag_var_dir = getattr(nav, 'magnetic_variation_direction', None)
+        mode = getattr(nav, 'mode_indicator', None)
         
-        rmc_builder = SentenceBuilder(TalkerId.GP, SentenceId.RMC)
-        rmc_builder.add_field(time_str)
-        rmc_builder.add_field(nav.status.value if hasattr(nav, 'status') else "A") # DataStatus.ACTIVE
-        rmc_builder.add_field(lat_str).add_field(lat_hem).add_field(lon_str).add_field(lon_hem)
-        rmc_builder.add_float_field(nav.sog, 1)
-        rmc_builder.add_float_field(nav.cog, 1)
-        rmc_builder.add_field(date_str)
-        rmc_builder.add_float_field(nav.magnetic_variation if hasattr(nav, 'magnetic_variation') else 0.0, 1)
-        rmc_builder.add_field(nav.magnetic_variation_direction.value if hasattr(nav, 'magnetic_variation_direction') else "E")
-        # RMC mode indicator (optional in some NMEA versions)
-        # Assuming nav.mode_indicator exists, otherwise default or omit
-        rmc_builder.add_field(nav.mode_indicator.value if hasattr(nav, 'mode_indicator') else "A")
-        sentences.append(rmc_builder.build().strip())
+        gga_tail = "{},{},{:.1f},{:.1f},M,{:.1f},M,,".format(
+            fix_quality.value if fix_quality else 1,
+            getattr(nav, 'satellites_in_use', 8),
+            getattr(nav, 'hdop', 1.2),
+            altitude.value if altitude else 0.0,
+            geoid_height.value if geoid_height else 19.6)
+        rmc_status = status.value if status else "A"
+        rmc_tail = "{:.1f},{},{}".format(
+            getattr(nav, 'magnetic_variation', 0.0),
+            mag_var_dir.value if mag_var_dir else "E",
+            mode.value if mode else "A")
+        return gga_tail, rmc_status, rmc_tail
+    
+    def _gps_pool(self, workers=None):
+        """Return a GPS process pool for large fleets, or a null context yielding None."""
+        workers = workers or os.cpu_count() or 1
+        vessel_count = len(self.vessel_generators)
+        if workers < 2 or vessel_count < PARALLEL_GPS_MIN_VESSELS:
+            return nullcontext()
+        self._gps_chunk_size = -(-vessel_count // workers)
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_gps_worker,
+                                   initargs=(self._gps_constants,))
+    
+    def _format_gps_batches(self, states, time_str, date_str, gps_pool=None):
+        """GPS (SentenceId, sentence) pairs for every vessel state, in fleet order."""
+        navs = [vessel_state.navigation_data for vessel_state in states]
+        if gps_pool is None:
+            return [format_gps(nav.position, nav.sog, nav.cog, time_str, date_str)
+                    for format_gps, nav in zip(self._gps_formatters, navs)]
         
-        return sentences
+        # Workers hold the formatters; only plain floats cross the process boundary
+        kinematics = [(nav.position.latitude, nav.position.longitude, nav.sog, nav.cog) for nav in navs]
+        chunk = self._gps_chunk_size
+        tasks = [(start, time_str, date_str, kinematics[start:start + chunk])
+                 for start in range(0, len(kinematics), chunk)]
+        return list(chain.from_iterable(gps_pool.map(_format_gps_chunk, tasks)))
     
     # _generate_ais_type1 and _generate_ais_type5 are now handled by AISMessageGenerator
     # using the dynamic vessel_state in the main loop.
 
-    def _add_reference_data(self, sentence, msg_type, timestamp, vessel_mmsi, vessel_state: VesselState, ais_msg_type=None):
-        """Add reference data for validation, using current VesselState."""
+    def _reference_row(self, sentence, msg_type, iso_ts, vessel_mmsi, vessel_state: VesselState, ais_msg_type=None):
+        """Encode one reference record, using current VesselState, as a JSON Lines row."""
         nav = vessel_state.navigation_data
-        static = vessel_state.static_data
-        ref = {
-            'timestamp': timestamp.isoformat(),
+        position = nav.position
+        return dumps({
+            'timestamp': iso_ts,
             'message_type': msg_type,
             'sentence': sentence,
             'vessel_mmsi': vessel_mmsi,
             'ais_message_type': ais_msg_type,
-            'vessel_data': { # Capture current dynamic data
-                'name': static.vessel_name,
-                'position': {'latitude': nav.position.latitude, 'longitude': nav.position.longitude},
+            'vessel_data': {
+                'name': vessel_state.static_data.vessel_name,
+                'position': {'latitude': position.latitude, 'longitude': position.longitude},
                 'sog': nav.sog,
                 'cog': nav.cog,
                 'heading': nav.heading,
                 'rot': nav.rot,
                 'nav_status': nav.nav_status.name
             }
-        }
-        self.reference_data.append(ref)
-        self.message_count += 1
+        }) + b"\n"
     
-    def _write_human_readable(self, file, sentence, msg_type, timestamp, vessel_state: VesselState, ais_msg_type=None):
-        """Write human-readable explanation using current VesselState."""
-        time_str = timestamp.strftime('%H:%M:%S')
-        nav = vessel_state.navigation_data
-        static = vessel_state.static_data
+    def _write_human_readable(self, human_file, reference_file, sim_start_time, duration_minutes):
+        """Render the human-readable log in one pass over the streamed reference rows."""
+        callsigns = {vs.mmsi: vs.static_data.callsign
+                     for vs in (v_gen.get_current_state() for v_gen in self.vessel_generators)}
+        with open(reference_file, 'rb') as ref_f, \
+             open(human_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as human_f:
+            human_f.write("Dynamic NMEA Simulator Output - Human Readable\n")
+            human_f.write("=" * 60 + "\n")
+            human_f.write(f"Generated: {sim_start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+            human_f.write(f"Duration: {duration_minutes} minutes\n")
+            human_f.write(f"Vessels: {len(self.vessel_generators)}\n")
+            human_f.write("=" * 60 + "\n\n")
+            human_f.writelines(self._format_human_readable(loads(line), callsigns) for line in ref_f)
+    
+    @staticmethod
+    def _format_human_readable(row, callsigns):
+        """Format a human-readable explanation of one reference row."""
+        vessel = row['vessel_data']
+        position = vessel['position']
+        sentence = row['sentence']
+        ais_msg_type = row['ais_message_type']
+        clock_str = row['timestamp'][11:19]  # HH:MM:SS of the ISO timestamp
         
-        file.write(f"[{time_str}] ")
+        parts = [f"[{clock_str}] "]
         
-        if msg_type == 'GPS':
-            if sentence.startswith('$GPGGA'):
-                file.write(f"GPS Fix - {static.vessel_name} (MMSI: {vessel_state.mmsi})\n")
-                file.write(f"  Position: {nav.position.latitude:.6f}, {nav.position.longitude:.6f}, SOG: {nav.sog:.1f}kn, COG: {nav.cog:.1f}deg\n")
-            elif sentence.startswith('$GPRMC'):
-                file.write(f"GPS RMC - {static.vessel_name}\n")
-                file.write(f"  Speed: {nav.sog:.1f} knots, Course: {nav.cog:.1f}°, Time: {time_str}\n")
+        if row['message_type'] == 'GPS':
+            sentence_id = SentenceId.parse(sentence)
+            if sentence_id is SentenceId.GGA:
+                parts.append(f"GPS Fix - {vessel['name']} (MMSI: {row['vessel_mmsi']})\n")
+                parts.append(f"  Position: {position['latitude']:.6f}, {position['longitude']:.6f}, SOG: {vessel['sog']:.1f}kn, COG: {vessel['cog']:.1f}deg\n")
+            elif sentence_id is SentenceId.RMC:
+                parts.append(f"GPS RMC - {vessel['name']}\n")
+                parts.append(f"  Speed: {vessel['sog']:.1f} knots, Course: {vessel['cog']:.1f}°, Time: {clock_str}\n")
         
-        elif msg_type == 'AIS':
-            file.write(f"AIS Type {ais_msg_type} - {static.vessel_name} (MMSI: {vessel_state.mmsi})\n")
+        elif row['message_type'] == 'AIS':
+            parts.append(f"AIS Type {ais_msg_type} - {vessel['name']} (MMSI: {row['vessel_mmsi']})\n")
             if ais_msg_type == 1:
-                file.write(f"  Position Report: Lat={nav.position.latitude:.4f}, Lon={nav.position.longitude:.4f}\n")
-                file.write(f"  SOG: {nav.sog:.1f}kn, COG: {nav.cog:.1f}°, HDG: {nav.heading}°, ROT: {nav.rot}\n")
+                parts.append(f"  Position Report: Lat={position['latitude']:.4f}, Lon={position['longitude']:.4f}\n")
+                parts.append(f"  SOG: {vessel['sog']:.1f}kn, COG: {vessel['cog']:.1f}°, HDG: {vessel['heading']}°, ROT: {vessel['rot']}\n")
             elif ais_msg_type == 5:
-                file.write(f"  Static Data: Name={static.vessel_name}, CallSign={static.callsign}\n")
+                parts.append(f"  Static Data: Name={vessel['name']}, CallSign={callsigns[row['vessel_mmsi']]}\n")
         
-        file.write(f"  Sentence: {sentence}\n\n")
+        parts.append(f"  Sentence: {sentence}\n\n")
+        return "".join(parts)
     
-    def _save_reference_data(self, file_path):
-        """Save reference data to JSON file."""
+    def _save_reference_metadata(self, file_path):
+        """Save the run summary that accompanies the streamed reference rows."""
         # Simplified vessels part for this refactor
         vessel_gens_info = []
         for v_gen in self.vessel_generators:
@@ -280,14 +421,12 @@ class SimpleNMEASimulator:
             'generation_info': {
                 'timestamp': datetime.utcnow().isoformat(),
                 'vessel_count': len(self.vessel_generators),
-                'total_messages': len(self.reference_data)
+                'total_messages': self.message_count
             },
-            'vessels_initial_config_summary': vessel_gens_info, # Summary of what was simulated
-            'messages': self.reference_data
+            'vessels_initial_config_summary': vessel_gens_info # Summary of what was simulated
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json(file_path, data, indent=True)
 
 
 def main():
@@ -323,14 +462,15 @@ def main():
     print("GENERATION COMPLETE")
     print("=" * 60)
     
-    nmea_file = files['nmea_file']
-    if Path(nmea_file).exists():
-        print("\nSample NMEA output (first 20 lines if available):")
-        with open(nmea_file, 'r') as f:
+    try:
+        with open(files['nmea_file'], 'r') as f:
+            print("\nSample NMEA output (first 20 lines if available):")
             for i, line in enumerate(f):
                 if i >= 20:
                     break
                 print(f"  {line.strip()}")
+    except FileNotFoundError:
+        pass
     
     print(f"\nReference data JSON: {files['reference_file']}")
     print(f"Human readable log: {files['human_readable']}")
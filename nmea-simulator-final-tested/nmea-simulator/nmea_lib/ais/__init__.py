@@ -11,6 +11,8 @@ from .constants import (
     AIS_MESSAGE_LENGTHS,
     AIS_6BIT_ASCII,
     AIS_ASCII_6BIT,
+    AIS_6BIT_ASCII_TABLE,
+    AIS_ASCII_6BIT_TABLE,
     MMSI_RANGES,
     AIS_CHANNELS,
     AIS_MAX_VALUES,
@@ -28,6 +30,8 @@ __all__ = [
     'AIS_MESSAGE_LENGTHS',
     'AIS_6BIT_ASCII',
     'AIS_ASCII_6BIT',
+    'AIS_6BIT_ASCII_TABLE',
+    'AIS_ASCII_6BIT_TABLE',
     'MMSI_RANGES',
     'AIS_CHANNELS',
     'AIS_MAX_VALUES',
@@ -239,17 +239,23 @@ AIS_MESSAGE_LENGTHS: Dict[int, int] = {
     24: 168,  # Type 24: Static Data Report Class B (Part A)
 }
 
-# 6-bit ASCII encoding table for AIS
+# 6-bit ASCII encoding table for AIS payload armoring (ITU-R M.1371 / IEC 61162-1):
+# values 0-39 map to '0'-'W' and values 40-63 to '`'-'w'
 AIS_6BIT_ASCII: List[str] = [
     '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', ':', ';', '<', '=', '>', '?',
     '@', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O',
-    'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', '[', '\\', ']', '^', '_',
-    '`', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o',
+    'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', '`', 'a', 'b', 'c', 'd', 'e', 'f', 'g',
+    'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w',
 ]
 
 # Reverse lookup for 6-bit ASCII decoding
 AIS_ASCII_6BIT: Dict[str, int] = {char: idx for idx, char in enumerate(AIS_6BIT_ASCII)}
 
+# Indexed byte tables for the payload hot paths: 6-bit value -> armoring
+# byte, and ASCII code -> 6-bit value (characters outside the set map to 0)
+AIS_6BIT_ASCII_TABLE: bytes = ''.join(AIS_6BIT_ASCII).encode('ascii')
+AIS_ASCII_6BIT_TABLE: bytes = bytes(AIS_ASCII_6BIT.get(chr(code), 0) for code in range(128))
+
 # Default MMSI ranges
 MMSI_RANGES = {
     'ship': (200000000, 799999999),
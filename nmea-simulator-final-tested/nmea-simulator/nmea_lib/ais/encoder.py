@@ -1,7 +1,38 @@
 """6-bit ASCII encoding utilities for AIS messages."""
 
 from typing import List
-from nmea_lib.ais.constants import AIS_6BIT_ASCII, AIS_ASCII_6BIT
+from nmea_lib.ais.constants import AIS_6BIT_ASCII_TABLE as _ENC, AIS_ASCII_6BIT_TABLE as _DEC
+
+
+class BitBuffer:
+    """Accumulates fixed-width AIS fields into a single integer."""
+    
+    __slots__ = ('value', 'length')
+    
+    def __init__(self):
+        """Initialize an empty bit buffer."""
+        self.value = 0
+        self.length = 0
+    
+    def push(self, value: int, width: int) -> None:
+        """Append value as a width-bit field (negative values wrap as two's complement)."""
+        self.value = (self.value << width) | (value & ((1 << width) - 1))
+        self.length += width
+    
+    def pad_to(self, multiple: int) -> None:
+        """Zero-pad the buffer up to a multiple of the given bit count."""
+        pad = -self.length % multiple
+        self.value <<= pad
+        self.length += pad
+    
+    def to_binary(self) -> str:
+        """Return the buffer as a string of '0'/'1' characters."""
+        if not self.length:
+            return ""
+        return format(self.value, f"0{self.length}b")
+    
+    def __len__(self) -> int:
+        return self.length
 
 
 class AIS6BitEncoder:
@@ -10,34 +41,39 @@ class AIS6BitEncoder:
     @staticmethod
     def encode_binary_to_6bit(binary_data: str) -> str:
         """Convert binary string to 6-bit ASCII encoded string."""
-        # Ensure binary data length is multiple of 6
-        while len(binary_data) % 6 != 0:
-            binary_data += "0"
+        if not binary_data:
+            return ""
+        
+        return AIS6BitEncoder.encode_int_to_6bit(int(binary_data, 2), len(binary_data))
+    
+    @staticmethod
+    def encode_int_to_6bit(value: int, bit_length: int) -> str:
+        """Convert the low bit_length bits of an int to 6-bit ASCII, MSB first."""
+        if not bit_length:
+            return ""
         
-        encoded = ""
-        for i in range(0, len(binary_data), 6):
-            # Extract 6-bit chunk
-            chunk = binary_data[i:i+6]
-            # Convert to integer
-            value = int(chunk, 2)
-            # Map to 6-bit ASCII character
-            encoded += AIS_6BIT_ASCII[value]
+        # Pad to a multiple of 6 and pull 6-bit lanes out of the int
+        fill_bits = AIS6BitEncoder.calculate_fill_bits(bit_length)
+        value <<= fill_bits
+        top_shift = bit_length + fill_bits - 6
         
-        return encoded
+        return bytes(
+            _ENC[(value >> shift) & 0x3F] for shift in range(top_shift, -1, -6)
+        ).decode('ascii')
     
     @staticmethod
     def decode_6bit_to_binary(encoded_data: str) -> str:
         """Convert 6-bit ASCII encoded string back to binary."""
-        binary = ""
+        if not encoded_data:
+            return ""
+        
+        value = 0
         for char in encoded_data:
-            if char in AIS_ASCII_6BIT:
-                value = AIS_ASCII_6BIT[char]
-                binary += format(value, '06b')
-            else:
-                # Invalid character, use 0
-                binary += "000000"
+            code = ord(char)
+            # Invalid characters decode as 0
+            value = (value << 6) | (_DEC[code] if code < 128 else 0)
         
-        return binary
+        return format(value, f"0{len(encoded_data) * 6}b")
     
     @staticmethod
     def calculate_fill_bits(binary_length: int) -> int:
@@ -50,7 +86,11 @@ class AIS6BitEncoder:
     @staticmethod
     def validate_6bit_string(encoded_data: str) -> bool:
         """Validate that all characters are valid 6-bit ASCII."""
-        return all(char in AIS_ASCII_6BIT for char in encoded_data)
+        try:
+            data = encoded_data.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        return not data.translate(None, _ENC)
 
 
 class AISMultiPartHandler:
@@ -1,6 +1,7 @@
 """AIS binary message encoders for all supported message types."""
 
 import math
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 from datetime import datetime
 
@@ -10,147 +11,182 @@ from nmea_lib.types.vessel import (
 from nmea_lib.ais.constants import (
     AISMessageType, AIS_NOT_AVAILABLE, AIS_MAX_VALUES
 )
+from nmea_lib.ais.encoder import BitBuffer
+
+
+# Fixed bit layout of the Class A position report (types 1, 2 and 3), in
+# transmission order
+CNB_LAYOUT: Tuple[Tuple[str, int], ...] = (
+    ('message_type', 6),
+    ('repeat', 2),
+    ('mmsi', 30),
+    ('nav_status', 4),
+    ('rot', 8),
+    ('sog', 10),
+    ('accuracy', 1),
+    ('lon', 28),
+    ('lat', 27),
+    ('cog', 12),
+    ('heading', 9),
+    ('timestamp', 6),
+    ('maneuver', 2),
+    ('spare', 3),
+    ('raim', 1),
+    ('radio', 19),
+)
+CNB_BITS = sum(width for _, width in CNB_LAYOUT)
+
+
+def _compile_packer(layout: Tuple[Tuple[str, int], ...]):
+    """
+    Generate a function packing the layout's fields into one int.
+
+    The shifts and masks are inlined as constants, so packing a message is
+    a single expression instead of one call per field.
+    """
+    total = sum(width for _, width in layout)
+    terms = []
+    for name, width in layout:
+        total -= width
+        terms.append(f"(({name} & {(1 << width) - 1:#x}) << {total})")
+    args = ", ".join(name for name, _ in layout)
+    source = f"def pack({args}):\n    return " + " | ".join(terms) + "\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace['pack']
+
+
+# The leading message type / repeat / MMSI fields are fixed for a vessel, so
+# they are packed once and cached; each report only packs the dynamic tail
+_CNB_HEADER_LAYOUT = CNB_LAYOUT[:3]
+_CNB_BODY_LAYOUT = CNB_LAYOUT[3:]
+_CNB_BODY_BITS = sum(width for _, width in _CNB_BODY_LAYOUT)
+_pack_cnb_header = _compile_packer(_CNB_HEADER_LAYOUT)
+_pack_cnb_body = _compile_packer(_CNB_BODY_LAYOUT)
+
+
+@lru_cache(maxsize=1024)
+def _cnb_header(message_type: int, repeat: int, mmsi: int) -> int:
+    """Header bits of a CNB report, already shifted into position."""
+    return _pack_cnb_header(message_type, repeat, mmsi) << _CNB_BODY_BITS
 
 
 class AISBinaryEncoder:
     """Encodes vessel data into AIS binary message format."""
     
     @staticmethod
-    def _encode_bits(value: int, bits: int) -> str:
-        """Encode integer value as binary string with specified bit length."""
-        if value < 0:
-            # Handle signed integers using two's complement
-            value = (1 << bits) + value
-        return format(value, f'0{bits}b')
-    
-    @staticmethod
-    def _encode_string(text: str, max_chars: int) -> str:
-        """Encode string as 6-bit ASCII binary."""
+    def _encode_string(text: str, max_chars: int) -> int:
+        """Pack string as 6-bit ASCII (6 * max_chars bits)."""
         # Pad or truncate to max_chars
         text = text.ljust(max_chars)[:max_chars]
-        binary = ""
+        packed = 0
         for char in text:
             # Convert to 6-bit ASCII (@ = 0, A = 1, etc.)
-            if char == ' ':
-                ascii_val = 32  # Space
-            else:
-                ascii_val = ord(char.upper())
+            ascii_val = ord(char.upper())
             
-            # Map to 6-bit range
-            if 32 <= ascii_val <= 95:
-                six_bit = ascii_val - 32
+            # '@'-'_' map to 0-31 and ' '-'?' to 32-63, defaulting to @
+            if 64 <= ascii_val <= 95:
+                six_bit = ascii_val - 64
+            elif 32 <= ascii_val <= 63:
+                six_bit = ascii_val
             else:
-                six_bit = 0  # Default to @
-            
-            binary += AISBinaryEncoder._encode_bits(six_bit, 6)
-        return binary
+                six_bit = 0
+            packed = (packed << 6) | six_bit
+        return packed
     
     @staticmethod
-    def _encode_latitude(lat: float) -> str:
-        """Encode latitude in AIS format (1/10000 minute resolution)."""
+    def _encode_latitude(lat: float) -> int:
+        """Encode latitude in AIS format (1/10000 minute resolution, 27 bits)."""
         if lat == AIS_NOT_AVAILABLE['latitude']:
-            return AISBinaryEncoder._encode_bits(0x3412140, 27)  # Not available
+            return 0x3412140  # Not available
         
         # Convert to 1/10000 minutes
-        lat_minutes = lat * 600000
-        lat_int = int(round(lat_minutes))
+        lat_int = int(round(lat * 600000))
         
         # Clamp to valid range
-        lat_int = max(-324000000, min(324000000, lat_int))
-        
-        return AISBinaryEncoder._encode_bits(lat_int, 27)
+        return max(-324000000, min(324000000, lat_int))
     
     @staticmethod
-    def _encode_longitude(lon: float) -> str:
-        """Encode longitude in AIS format (1/10000 minute resolution)."""
+    def _encode_longitude(lon: float) -> int:
+        """Encode longitude in AIS format (1/10000 minute resolution, 28 bits)."""
         if lon == AIS_NOT_AVAILABLE['longitude']:
-            return AISBinaryEncoder._encode_bits(0x6791AC0, 28)  # Not available
+            return 0x6791AC0  # Not available
         
         # Convert to 1/10000 minutes
-        lon_minutes = lon * 600000
-        lon_int = int(round(lon_minutes))
+        lon_int = int(round(lon * 600000))
         
         # Clamp to valid range
-        lon_int = max(-648000000, min(648000000, lon_int))
-        
-        return AISBinaryEncoder._encode_bits(lon_int, 28)
+        return max(-648000000, min(648000000, lon_int))
     
     @staticmethod
-    def _encode_sog(sog: float) -> str:
-        """Encode speed over ground (0.1 knot resolution)."""
+    def _encode_sog(sog: float) -> int:
+        """Encode speed over ground (0.1 knot resolution, 10 bits)."""
         if sog >= AIS_MAX_VALUES['sog']:
-            return AISBinaryEncoder._encode_bits(1023, 10)  # Not available
+            return 1023  # Not available
         
-        sog_int = int(round(sog * 10))
-        sog_int = max(0, min(1022, sog_int))
-        return AISBinaryEncoder._encode_bits(sog_int, 10)
+        return max(0, min(1022, int(round(sog * 10))))
     
     @staticmethod
-    def _encode_cog(cog: float) -> str:
-        """Encode course over ground (0.1 degree resolution)."""
+    def _encode_cog(cog: float) -> int:
+        """Encode course over ground (0.1 degree resolution, 12 bits)."""
         if cog >= AIS_MAX_VALUES['cog']:
-            return AISBinaryEncoder._encode_bits(3600, 12)  # Not available
+            return 3600  # Not available
         
-        cog_int = int(round(cog * 10))
-        cog_int = max(0, min(3599, cog_int))
-        return AISBinaryEncoder._encode_bits(cog_int, 12)
+        return max(0, min(3599, int(round(cog * 10))))
     
     @staticmethod
-    def _encode_heading(heading: int) -> str:
-        """Encode true heading."""
+    def _encode_heading(heading: int) -> int:
+        """Encode true heading (9 bits)."""
         if heading >= AIS_MAX_VALUES['heading']:
-            return AISBinaryEncoder._encode_bits(511, 9)  # Not available
+            return 511  # Not available
         
         heading = max(0, min(359, heading)) # heading could still be float here if input was float
-        return AISBinaryEncoder._encode_bits(int(round(heading)), 9)
+        return int(round(heading))
     
     @staticmethod
-    def _encode_rot(rot: int) -> str:
-        """Encode rate of turn."""
+    def _encode_rot(rot: int) -> int:
+        """Encode rate of turn (8 bits, signed)."""
         if rot == AIS_MAX_VALUES['rot']:
-            return AISBinaryEncoder._encode_bits(128, 8)  # Not available
+            return 128  # Not available
         
         # Rate of turn encoding: ROT_AIS = 4.733 * sqrt(ROT_sensor)
         if rot == 0:
-            rot_ais = 0
+            return 0
         elif rot > 0:
-            rot_ais = int(round(4.733 * math.sqrt(abs(rot))))
-            rot_ais = min(127, rot_ais)
+            return min(127, int(round(4.733 * math.sqrt(abs(rot)))))
         else:
-            rot_ais = -int(round(4.733 * math.sqrt(abs(rot))))
-            rot_ais = max(-127, rot_ais)
-        
-        return AISBinaryEncoder._encode_bits(rot_ais, 8)
+            return max(-127, -int(round(4.733 * math.sqrt(abs(rot)))))
     
     @staticmethod
-    def encode_type_1(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
-        """Encode AIS Type 1: Position Report Class A."""
+    def _encode_cnb(vessel: VesselState, message_type: int) -> Tuple[str, Dict[str, Any]]:
+        """Encode a Class A position report (types 1-3) using the CNB layout."""
+        value, input_data = AISBinaryEncoder._encode_cnb_value(vessel, message_type)
+        return format(value, f'0{CNB_BITS}b'), input_data
+    
+    @staticmethod
+    def _encode_cnb_value(vessel: VesselState, message_type: int) -> Tuple[int, Dict[str, Any]]:
+        """Pack a Class A position report into a CNB_BITS-wide int."""
         nav = vessel.navigation_data
+        nav_status = nav.nav_status.value
         
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(1, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(vessel.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(nav.nav_status.value, 4)  # Navigation status
-        binary += AISBinaryEncoder._encode_rot(nav.rot)  # Rate of turn
-        binary += AISBinaryEncoder._encode_sog(nav.sog)  # Speed over ground
-        binary += AISBinaryEncoder._encode_bits(int(nav.position_accuracy), 1)  # Position accuracy (ensure int)
-        binary += AISBinaryEncoder._encode_longitude(nav.position.longitude)  # Longitude
-        binary += AISBinaryEncoder._encode_latitude(nav.position.latitude)  # Latitude
-        binary += AISBinaryEncoder._encode_cog(nav.cog)  # Course over ground
-        binary += AISBinaryEncoder._encode_heading(nav.heading)  # True heading
-        binary += AISBinaryEncoder._encode_bits(nav.timestamp, 6)  # Time stamp
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Maneuver indicator
-        binary += AISBinaryEncoder._encode_bits(0, 3)  # Spare
-        binary += AISBinaryEncoder._encode_bits(int(nav.raim), 1)  # RAIM flag (ensure int)
-        binary += AISBinaryEncoder._encode_bits(nav.radio_status, 19)  # Radio status
+        value = _cnb_header(message_type, 0, vessel.mmsi) | _pack_cnb_body(
+            nav_status,
+            AISBinaryEncoder._encode_rot(nav.rot),
+            AISBinaryEncoder._encode_sog(nav.sog),
+            int(nav.position_accuracy),
+            AISBinaryEncoder._encode_longitude(nav.position.longitude),
+            AISBinaryEncoder._encode_latitude(nav.position.latitude),
+            AISBinaryEncoder._encode_cog(nav.cog),
+            AISBinaryEncoder._encode_heading(nav.heading),
+            nav.timestamp, 0, 0, int(nav.raim), nav.radio_status
+        )
         
         # Input data for trace logging
         input_data = {
-            'message_type': 1,
+            'message_type': message_type,
             'mmsi': vessel.mmsi,
-            'nav_status': nav.nav_status.value,
+            'nav_status': nav_status,
             'rot': nav.rot,
             'sog': nav.sog,
             'position_accuracy': nav.position_accuracy,
@@ -163,53 +199,50 @@ class AISBinaryEncoder:
             'radio_status': nav.radio_status
         }
         
-        return binary, input_data
+        return value, input_data
+    
+    @staticmethod
+    def encode_type_1(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
+        """Encode AIS Type 1: Position Report Class A."""
+        return AISBinaryEncoder._encode_cnb(vessel, 1)
     
     @staticmethod
     def encode_type_2(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
         """Encode AIS Type 2: Position Report Scheduled Class A."""
         # Type 2 has same format as Type 1, just different message type
-        binary, input_data = AISBinaryEncoder.encode_type_1(vessel)
-        # Change message type to 2
-        binary = AISBinaryEncoder._encode_bits(2, 6) + binary[6:]
-        input_data['message_type'] = 2
-        return binary, input_data
+        return AISBinaryEncoder._encode_cnb(vessel, 2)
     
     @staticmethod
     def encode_type_3(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
         """Encode AIS Type 3: Position Report Response Class A."""
         # Type 3 has same format as Type 1, just different message type
-        binary, input_data = AISBinaryEncoder.encode_type_1(vessel)
-        # Change message type to 3
-        binary = AISBinaryEncoder._encode_bits(3, 6) + binary[6:]
-        input_data['message_type'] = 3
-        return binary, input_data
+        return AISBinaryEncoder._encode_cnb(vessel, 3)
     
     @staticmethod
     def encode_type_4(base_station: BaseStationData) -> Tuple[str, Dict[str, Any]]:
         """Encode AIS Type 4: Base Station Report."""
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(4, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(base_station.mmsi, 30)  # MMSI
+        bits = BitBuffer()
+        bits.push(4, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(base_station.mmsi, 30)  # MMSI
         
         # UTC time
         utc_time = base_station.timestamp
-        binary += AISBinaryEncoder._encode_bits(utc_time.year, 14)  # Year
-        binary += AISBinaryEncoder._encode_bits(utc_time.month, 4)  # Month
-        binary += AISBinaryEncoder._encode_bits(utc_time.day, 5)  # Day
-        binary += AISBinaryEncoder._encode_bits(utc_time.hour, 5)  # Hour
-        binary += AISBinaryEncoder._encode_bits(utc_time.minute, 6)  # Minute
-        binary += AISBinaryEncoder._encode_bits(utc_time.second, 6)  # Second
-        
-        binary += AISBinaryEncoder._encode_bits(1, 1)  # Position accuracy (high)
-        binary += AISBinaryEncoder._encode_longitude(base_station.position.longitude)  # Longitude
-        binary += AISBinaryEncoder._encode_latitude(base_station.position.latitude)  # Latitude
-        binary += AISBinaryEncoder._encode_bits(base_station.epfd_type.value, 4)  # EPFD type
-        binary += AISBinaryEncoder._encode_bits(0, 10)  # Spare
-        binary += AISBinaryEncoder._encode_bits(base_station.raim, 1)  # RAIM
-        binary += AISBinaryEncoder._encode_bits(base_station.radio_status, 19)  # Radio status
+        bits.push(utc_time.year, 14)  # Year
+        bits.push(utc_time.month, 4)  # Month
+        bits.push(utc_time.day, 5)  # Day
+        bits.push(utc_time.hour, 5)  # Hour
+        bits.push(utc_time.minute, 6)  # Minute
+        bits.push(utc_time.second, 6)  # Second
+        
+        bits.push(1, 1)  # Position accuracy (high)
+        bits.push(AISBinaryEncoder._encode_longitude(base_station.position.longitude), 28)  # Longitude
+        bits.push(AISBinaryEncoder._encode_latitude(base_station.position.latitude), 27)  # Latitude
+        bits.push(base_station.epfd_type.value, 4)  # EPFD type
+        bits.push(0, 10)  # Spare
+        bits.push(base_station.raim, 1)  # RAIM
+        bits.push(base_station.radio_status, 19)  # Radio status
         
         input_data = {
             'message_type': 4,
@@ -227,7 +260,45 @@ class AISBinaryEncoder:
             'radio_status': base_station.radio_status
         }
         
-        return binary, input_data
+        return bits.to_binary(), input_data
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _encode_type_5_bits(mmsi: int, imo_number: int, callsign: str, vessel_name: str,
+                            ship_type: int, dims: Tuple[int, int, int, int], epfd_type: int,
+                            eta: Tuple[int, int, int, int], draught_int: int,
+                            destination: str, dte: int) -> str:
+        """Build the Type 5 bit string (memoized; these fields rarely change during a voyage)."""
+        bits = BitBuffer()
+        bits.push(5, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(mmsi, 30)  # MMSI
+        bits.push(0, 2)  # AIS version
+        bits.push(imo_number, 30)  # IMO number
+        bits.push(AISBinaryEncoder._encode_string(callsign, 7), 42)  # Call sign (42 bits)
+        bits.push(AISBinaryEncoder._encode_string(vessel_name, 20), 120)  # Vessel name (120 bits)
+        bits.push(ship_type, 8)  # Ship type
+        
+        # Dimensions
+        bits.push(dims[0], 9)  # Dimension to bow
+        bits.push(dims[1], 9)  # Dimension to stern
+        bits.push(dims[2], 6)  # Dimension to port
+        bits.push(dims[3], 6)  # Dimension to starboard
+        
+        bits.push(epfd_type, 4)  # EPFD type
+        
+        # ETA
+        bits.push(eta[0], 4)  # ETA month
+        bits.push(eta[1], 5)  # ETA day
+        bits.push(eta[2], 5)  # ETA hour
+        bits.push(eta[3], 6)  # ETA minute
+        
+        bits.push(draught_int, 8)  # Maximum draught
+        bits.push(AISBinaryEncoder._encode_string(destination, 20), 120)  # Destination (120 bits)
+        bits.push(dte, 1)  # DTE
+        bits.push(0, 1)  # Spare
+        
+        return bits.to_binary()
     
     @staticmethod
     def encode_type_5(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
@@ -235,40 +306,20 @@ class AISBinaryEncoder:
         static = vessel.static_data
         voyage = vessel.voyage_data
         
-        # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(5, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(vessel.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # AIS version
-        binary += AISBinaryEncoder._encode_bits(static.imo_number or 0, 30)  # IMO number
-        binary += AISBinaryEncoder._encode_string(static.callsign, 7)  # Call sign (42 bits)
-        binary += AISBinaryEncoder._encode_string(static.vessel_name, 20)  # Vessel name (120 bits)
-        binary += AISBinaryEncoder._encode_bits(static.ship_type.value, 8)  # Ship type
-        
-        # Dimensions
         dims = static.dimensions.to_ais_format()
-        binary += AISBinaryEncoder._encode_bits(dims[0], 9)  # Dimension to bow
-        binary += AISBinaryEncoder._encode_bits(dims[1], 9)  # Dimension to stern
-        binary += AISBinaryEncoder._encode_bits(dims[2], 6)  # Dimension to port
-        binary += AISBinaryEncoder._encode_bits(dims[3], 6)  # Dimension to starboard
-        
-        binary += AISBinaryEncoder._encode_bits(static.epfd_type.value, 4)  # EPFD type
-        
-        # ETA
         eta = voyage.eta.to_ais_format()
-        binary += AISBinaryEncoder._encode_bits(eta[0], 4)  # ETA month
-        binary += AISBinaryEncoder._encode_bits(eta[1], 5)  # ETA day
-        binary += AISBinaryEncoder._encode_bits(eta[2], 5)  # ETA hour
-        binary += AISBinaryEncoder._encode_bits(eta[3], 6)  # ETA minute
+        
+        ship_type = static.ship_type.value
+        epfd_type = static.epfd_type.value
         
         # Draught
         draught_int = int(round(voyage.draught * 10)) if voyage.draught < 25.5 else 0
-        binary += AISBinaryEncoder._encode_bits(draught_int, 8)  # Maximum draught
         
-        binary += AISBinaryEncoder._encode_string(voyage.destination, 20)  # Destination (120 bits)
-        binary += AISBinaryEncoder._encode_bits(voyage.dte, 1)  # DTE
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Spare
+        binary = AISBinaryEncoder._encode_type_5_bits(
+            vessel.mmsi, static.imo_number or 0, static.callsign, static.vessel_name,
+            ship_type, dims, epfd_type, eta, draught_int,
+            voyage.destination, voyage.dte
+        )
         
         input_data = {
             'message_type': 5,
@@ -276,9 +327,9 @@ class AISBinaryEncoder:
             'imo_number': static.imo_number or 0,
             'callsign': static.callsign,
             'vessel_name': static.vessel_name,
-            'ship_type': static.ship_type.value,
+            'ship_type': ship_type,
             'dimensions': dims,
-            'epfd_type': static.epfd_type.value,
+            'epfd_type': epfd_type,
             'eta': eta,
             'draught': voyage.draught,
             'destination': voyage.destination,
@@ -293,27 +344,27 @@ class AISBinaryEncoder:
         nav = vessel.navigation_data
         
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(18, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(vessel.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(0, 8)  # Regional reserved
-        binary += AISBinaryEncoder._encode_sog(nav.sog)  # Speed over ground
-        binary += AISBinaryEncoder._encode_bits(nav.position_accuracy, 1)  # Position accuracy
-        binary += AISBinaryEncoder._encode_longitude(nav.position.longitude)  # Longitude
-        binary += AISBinaryEncoder._encode_latitude(nav.position.latitude)  # Latitude
-        binary += AISBinaryEncoder._encode_cog(nav.cog)  # Course over ground
-        binary += AISBinaryEncoder._encode_heading(nav.heading)  # True heading
-        binary += AISBinaryEncoder._encode_bits(nav.timestamp, 6)  # Time stamp
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Regional reserved
-        binary += AISBinaryEncoder._encode_bits(1, 1)  # CS unit (1 = Class B SOTDMA)
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Display flag
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # DSC flag
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Band flag
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Message 22 flag
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Assigned mode
-        binary += AISBinaryEncoder._encode_bits(nav.raim, 1)  # RAIM
-        binary += AISBinaryEncoder._encode_bits(nav.radio_status, 20)  # Radio status
+        bits = BitBuffer()
+        bits.push(18, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(vessel.mmsi, 30)  # MMSI
+        bits.push(0, 8)  # Regional reserved
+        bits.push(AISBinaryEncoder._encode_sog(nav.sog), 10)  # Speed over ground
+        bits.push(nav.position_accuracy, 1)  # Position accuracy
+        bits.push(AISBinaryEncoder._encode_longitude(nav.position.longitude), 28)  # Longitude
+        bits.push(AISBinaryEncoder._encode_latitude(nav.position.latitude), 27)  # Latitude
+        bits.push(AISBinaryEncoder._encode_cog(nav.cog), 12)  # Course over ground
+        bits.push(AISBinaryEncoder._encode_heading(nav.heading), 9)  # True heading
+        bits.push(nav.timestamp, 6)  # Time stamp
+        bits.push(0, 2)  # Regional reserved
+        bits.push(1, 1)  # CS unit (1 = Class B SOTDMA)
+        bits.push(0, 1)  # Display flag
+        bits.push(0, 1)  # DSC flag
+        bits.push(0, 1)  # Band flag
+        bits.push(0, 1)  # Message 22 flag
+        bits.push(0, 1)  # Assigned mode
+        bits.push(nav.raim, 1)  # RAIM
+        bits.push(nav.radio_status, 20)  # Radio status
         
         input_data = {
             'message_type': 18,
@@ -329,7 +380,7 @@ class AISBinaryEncoder:
             'radio_status': nav.radio_status
         }
         
-        return binary, input_data
+        return bits.to_binary(), input_data
     
     @staticmethod
     def encode_type_19(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
@@ -338,34 +389,34 @@ class AISBinaryEncoder:
         static = vessel.static_data
         
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(19, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(vessel.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(0, 8)  # Regional reserved
-        binary += AISBinaryEncoder._encode_sog(nav.sog)  # Speed over ground
-        binary += AISBinaryEncoder._encode_bits(nav.position_accuracy, 1)  # Position accuracy
-        binary += AISBinaryEncoder._encode_longitude(nav.position.longitude)  # Longitude
-        binary += AISBinaryEncoder._encode_latitude(nav.position.latitude)  # Latitude
-        binary += AISBinaryEncoder._encode_cog(nav.cog)  # Course over ground
-        binary += AISBinaryEncoder._encode_heading(nav.heading)  # True heading
-        binary += AISBinaryEncoder._encode_bits(nav.timestamp, 6)  # Time stamp
-        binary += AISBinaryEncoder._encode_bits(0, 4)  # Regional reserved
-        binary += AISBinaryEncoder._encode_string(static.vessel_name, 20)  # Ship name (120 bits)
-        binary += AISBinaryEncoder._encode_bits(static.ship_type.value, 8)  # Ship type
+        bits = BitBuffer()
+        bits.push(19, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(vessel.mmsi, 30)  # MMSI
+        bits.push(0, 8)  # Regional reserved
+        bits.push(AISBinaryEncoder._encode_sog(nav.sog), 10)  # Speed over ground
+        bits.push(nav.position_accuracy, 1)  # Position accuracy
+        bits.push(AISBinaryEncoder._encode_longitude(nav.position.longitude), 28)  # Longitude
+        bits.push(AISBinaryEncoder._encode_latitude(nav.position.latitude), 27)  # Latitude
+        bits.push(AISBinaryEncoder._encode_cog(nav.cog), 12)  # Course over ground
+        bits.push(AISBinaryEncoder._encode_heading(nav.heading), 9)  # True heading
+        bits.push(nav.timestamp, 6)  # Time stamp
+        bits.push(0, 4)  # Regional reserved
+        bits.push(AISBinaryEncoder._encode_string(static.vessel_name, 20), 120)  # Ship name (120 bits)
+        bits.push(static.ship_type.value, 8)  # Ship type
         
         # Dimensions
         dims = static.dimensions.to_ais_format()
-        binary += AISBinaryEncoder._encode_bits(dims[0], 9)  # Dimension to bow
-        binary += AISBinaryEncoder._encode_bits(dims[1], 9)  # Dimension to stern
-        binary += AISBinaryEncoder._encode_bits(dims[2], 6)  # Dimension to port
-        binary += AISBinaryEncoder._encode_bits(dims[3], 6)  # Dimension to starboard
+        bits.push(dims[0], 9)  # Dimension to bow
+        bits.push(dims[1], 9)  # Dimension to stern
+        bits.push(dims[2], 6)  # Dimension to port
+        bits.push(dims[3], 6)  # Dimension to starboard
         
-        binary += AISBinaryEncoder._encode_bits(static.epfd_type.value, 4)  # EPFD type
-        binary += AISBinaryEncoder._encode_bits(nav.raim, 1)  # RAIM
-        binary += AISBinaryEncoder._encode_bits(1, 1)  # DTE (not available)
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Assigned mode
-        binary += AISBinaryEncoder._encode_bits(0, 4)  # Spare
+        bits.push(static.epfd_type.value, 4)  # EPFD type
+        bits.push(nav.raim, 1)  # RAIM
+        bits.push(1, 1)  # DTE (not available)
+        bits.push(0, 1)  # Assigned mode
+        bits.push(0, 4)  # Spare
         
         input_data = {
             'message_type': 19,
@@ -384,41 +435,40 @@ class AISBinaryEncoder:
             'raim': nav.raim
         }
         
-        return binary, input_data
+        return bits.to_binary(), input_data
     
     @staticmethod
     def encode_type_21(aid_nav: AidToNavigationData) -> Tuple[str, Dict[str, Any]]:
         """Encode AIS Type 21: Aid-to-Navigation Report."""
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(21, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(aid_nav.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(aid_nav.aid_type, 5)  # Aid type
-        binary += AISBinaryEncoder._encode_string(aid_nav.name, 20)  # Name (120 bits)
-        binary += AISBinaryEncoder._encode_bits(aid_nav.position_accuracy, 1)  # Position accuracy
-        binary += AISBinaryEncoder._encode_longitude(aid_nav.position.longitude)  # Longitude
-        binary += AISBinaryEncoder._encode_latitude(aid_nav.position.latitude)  # Latitude
+        bits = BitBuffer()
+        bits.push(21, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(aid_nav.mmsi, 30)  # MMSI
+        bits.push(aid_nav.aid_type, 5)  # Aid type
+        bits.push(AISBinaryEncoder._encode_string(aid_nav.name, 20), 120)  # Name (120 bits)
+        bits.push(aid_nav.position_accuracy, 1)  # Position accuracy
+        bits.push(AISBinaryEncoder._encode_longitude(aid_nav.position.longitude), 28)  # Longitude
+        bits.push(AISBinaryEncoder._encode_latitude(aid_nav.position.latitude), 27)  # Latitude
         
         # Dimensions
         dims = aid_nav.dimensions.to_ais_format()
-        binary += AISBinaryEncoder._encode_bits(dims[0], 9)  # Dimension to bow
-        binary += AISBinaryEncoder._encode_bits(dims[1], 9)  # Dimension to stern
-        binary += AISBinaryEncoder._encode_bits(dims[2], 6)  # Dimension to port
-        binary += AISBinaryEncoder._encode_bits(dims[3], 6)  # Dimension to starboard
-        
-        binary += AISBinaryEncoder._encode_bits(aid_nav.epfd_type.value, 4)  # EPFD type
-        binary += AISBinaryEncoder._encode_bits(aid_nav.timestamp, 6)  # Time stamp
-        binary += AISBinaryEncoder._encode_bits(aid_nav.off_position, 1)  # Off position
-        binary += AISBinaryEncoder._encode_bits(aid_nav.regional, 8)  # Regional reserved
-        binary += AISBinaryEncoder._encode_bits(aid_nav.raim, 1)  # RAIM
-        binary += AISBinaryEncoder._encode_bits(aid_nav.virtual_aid, 1)  # Virtual aid
-        binary += AISBinaryEncoder._encode_bits(aid_nav.assigned, 1)  # Assigned mode
-        binary += AISBinaryEncoder._encode_bits(0, 1)  # Spare
+        bits.push(dims[0], 9)  # Dimension to bow
+        bits.push(dims[1], 9)  # Dimension to stern
+        bits.push(dims[2], 6)  # Dimension to port
+        bits.push(dims[3], 6)  # Dimension to starboard
+        
+        bits.push(aid_nav.epfd_type.value, 4)  # EPFD type
+        bits.push(aid_nav.timestamp, 6)  # Time stamp
+        bits.push(aid_nav.off_position, 1)  # Off position
+        bits.push(aid_nav.regional, 8)  # Regional reserved
+        bits.push(aid_nav.raim, 1)  # RAIM
+        bits.push(aid_nav.virtual_aid, 1)  # Virtual aid
+        bits.push(aid_nav.assigned, 1)  # Assigned mode
+        bits.push(0, 1)  # Spare
         
         # Pad to byte boundary if needed
-        while len(binary) % 8 != 0:
-            binary += "0"
+        bits.pad_to(8)
         
         input_data = {
             'message_type': 21,
@@ -437,7 +487,7 @@ class AISBinaryEncoder:
             'assigned': aid_nav.assigned
         }
         
-        return binary, input_data
+        return bits.to_binary(), input_data
     
     @staticmethod
     def encode_type_24_part_a(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
@@ -445,13 +495,13 @@ class AISBinaryEncoder:
         static = vessel.static_data
         
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(24, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(vessel.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Part number (0 = Part A)
-        binary += AISBinaryEncoder._encode_string(static.vessel_name, 20)  # Vessel name (120 bits)
-        binary += AISBinaryEncoder._encode_bits(0, 8)  # Spare
+        bits = BitBuffer()
+        bits.push(24, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(vessel.mmsi, 30)  # MMSI
+        bits.push(0, 2)  # Part number (0 = Part A)
+        bits.push(AISBinaryEncoder._encode_string(static.vessel_name, 20), 120)  # Vessel name (120 bits)
+        bits.push(0, 8)  # Spare
         
         input_data = {
             'message_type': 24,
@@ -460,7 +510,7 @@ class AISBinaryEncoder:
             'vessel_name': static.vessel_name
         }
         
-        return binary, input_data
+        return bits.to_binary(), input_data
     
     @staticmethod
     def encode_type_24_part_b(vessel: VesselState) -> Tuple[str, Dict[str, Any]]:
@@ -468,26 +518,26 @@ class AISBinaryEncoder:
         static = vessel.static_data
         
         # Build binary message
-        binary = ""
-        binary += AISBinaryEncoder._encode_bits(24, 6)  # Message type
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Repeat indicator
-        binary += AISBinaryEncoder._encode_bits(vessel.mmsi, 30)  # MMSI
-        binary += AISBinaryEncoder._encode_bits(1, 2)  # Part number (1 = Part B)
-        binary += AISBinaryEncoder._encode_bits(static.ship_type.value, 8)  # Ship type
-        binary += AISBinaryEncoder._encode_string("", 3)  # Vendor ID (18 bits)
-        binary += AISBinaryEncoder._encode_string("", 1)  # Unit model code (6 bits)
-        binary += AISBinaryEncoder._encode_bits(0, 20)  # Serial number
-        binary += AISBinaryEncoder._encode_string(static.callsign, 7)  # Call sign (42 bits)
+        bits = BitBuffer()
+        bits.push(24, 6)  # Message type
+        bits.push(0, 2)  # Repeat indicator
+        bits.push(vessel.mmsi, 30)  # MMSI
+        bits.push(1, 2)  # Part number (1 = Part B)
+        bits.push(static.ship_type.value, 8)  # Ship type
+        bits.push(AISBinaryEncoder._encode_string("", 3), 18)  # Vendor ID (18 bits)
+        bits.push(AISBinaryEncoder._encode_string("", 1), 6)  # Unit model code (6 bits)
+        bits.push(0, 20)  # Serial number
+        bits.push(AISBinaryEncoder._encode_string(static.callsign, 7), 42)  # Call sign (42 bits)
         
         # Dimensions
         dims = static.dimensions.to_ais_format()
-        binary += AISBinaryEncoder._encode_bits(dims[0], 9)  # Dimension to bow
-        binary += AISBinaryEncoder._encode_bits(dims[1], 9)  # Dimension to stern
-        binary += AISBinaryEncoder._encode_bits(dims[2], 6)  # Dimension to port
-        binary += AISBinaryEncoder._encode_bits(dims[3], 6)  # Dimension to starboard
+        bits.push(dims[0], 9)  # Dimension to bow
+        bits.push(dims[1], 9)  # Dimension to stern
+        bits.push(dims[2], 6)  # Dimension to port
+        bits.push(dims[3], 6)  # Dimension to starboard
         
-        binary += AISBinaryEncoder._encode_bits(0, 2)  # Mothership MMSI (not used)
-        binary += AISBinaryEncoder._encode_bits(0, 6)  # Spare
+        bits.push(0, 2)  # Mothership MMSI (not used)
+        bits.push(0, 6)  # Spare
         
         input_data = {
             'message_type': 24,
@@ -498,5 +548,5 @@ class AISBinaryEncoder:
             'dimensions': dims
         }
         
-        return binary, input_data
+        return bits.to_binary(), input_data
 
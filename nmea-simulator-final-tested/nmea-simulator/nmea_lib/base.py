@@ -5,6 +5,8 @@ from typing import List, Optional, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from .validator import SentenceValidator
+
 
 class TalkerId(Enum):
     """NMEA Talker ID enumeration."""
@@ -105,10 +107,7 @@ class Sentence(ABC):
     
     def calculate_checksum(self, sentence_body: str) -> str:
         """Calculate NMEA checksum for sentence body."""
-        checksum = 0
-        for char in sentence_body:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        return SentenceValidator.calculate_checksum(sentence_body)
     
     def validate_checksum(self, nmea_sentence: str) -> bool:
         """Validate NMEA sentence checksum."""
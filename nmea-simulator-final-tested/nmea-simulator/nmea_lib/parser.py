@@ -162,17 +162,26 @@ class SentenceBuilder:
     
     def add_float_field(self, value: Optional[float], precision: int = 1) -> 'SentenceBuilder':
         """Add a float field with specified precision."""
-        if value is not None:
-            format_str = f"{{:.{precision}f}}"
-            self.fields.append(format_str.format(value))
-        else:
-            self.fields.append("")
+        self.fields.append(SentenceBuilder.format_float(value, precision))
         return self
     
+    @staticmethod
+    def format_float(value: Optional[float], precision: int = 1) -> str:
+        """Format a float field with specified precision ("" when missing)."""
+        if value is None:
+            return ""
+        return f"{value:.{precision}f}"
+    
     def build(self) -> str:
         """Build the complete NMEA sentence."""
+        return SentenceBuilder.build_from_fields(self.talker_id, self.sentence_id, self.fields)
+    
+    @classmethod
+    def build_from_fields(cls, talker_id: TalkerId, sentence_id: SentenceId,
+                          fields: List[str]) -> str:
+        """Build a complete NMEA sentence from already formatted field strings."""
         # Build sentence body
-        sentence_body = f"{self.talker_id.value}{self.sentence_id.value},{','.join(self.fields)}"
+        sentence_body = f"{talker_id.value}{sentence_id.value},{','.join(fields)}"
         
         # Calculate checksum
         checksum = SentenceValidator.calculate_checksum(sentence_body)
@@ -1,10 +1,53 @@
 """AIVDM sentence generation for AIS messages."""
 
-from typing import List, Tuple, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Optional, Union
 from nmea_lib.ais.encoder import AIS6BitEncoder, AISMultiPartHandler
-from nmea_lib.ais.messages import AISBinaryEncoder
-from nmea_lib.ais.constants import AIS_CHANNELS
+from nmea_lib.ais.messages import AISBinaryEncoder, CNB_BITS
+from nmea_lib.ais.constants import AIS_CHANNELS, AIS_6BIT_ASCII_TABLE
 from nmea_lib.types.vessel import VesselState, BaseStationData, AidToNavigationData
+from nmea_lib.validator import xor_checksum
+
+
+# Byte sets used by validate_aivdm_sentence
+_CHANNEL_BYTES = frozenset(channel.encode('ascii') for channel in AIS_CHANNELS)
+_DIGIT_BYTES = b'0123456789'
+_HEX_BYTES = b'0123456789ABCDEFabcdef'
+
+
+@lru_cache(maxsize=64)
+def _header_xor(total_sentences: int, sentence_number: int,
+                sequential_message_id: str, channel: str) -> int:
+    """XOR of the fixed 'AIVDM,t,n,s,c,' prefix; only a handful of distinct headers occur."""
+    header = f"AIVDM,{total_sentences},{sentence_number},{sequential_message_id},{channel},"
+    return xor_checksum(header.encode('ascii'))
+
+
+@lru_cache(maxsize=1024)
+def _static_sentences(binary_data: str, channel: str) -> Tuple[str, ...]:
+    """
+    AIVDM strings for a message whose content only changes with static data.
+    
+    Type 24 reports repeat the same bits for a vessel all voyage, so the
+    6-bit encoding, splitting and checksums are done once per (bits, channel).
+    """
+    return tuple(str(s) for s in AIVDMSentence.from_binary_message(binary_data, channel))
+
+
+def _payload_parts(binary_data: str, channel: str) -> Tuple[Tuple[int, int, str, int], ...]:
+    """
+    Sequence-independent pieces of each AIVDM part of a message.
+    
+    Returns (total, number, 'payload,fill', XOR of 'payload,fill') per part,
+    so a sentence can be rebuilt for any sequential message ID from the
+    cached header XOR alone.
+    """
+    parts = []
+    for sentence in AIVDMSentence.from_binary_message(binary_data, channel):
+        body = f"{sentence.payload},{sentence.fill_bits}"
+        parts.append((sentence.total_sentences, sentence.sentence_number,
+                      body, xor_checksum(body.encode('ascii'))))
+    return tuple(parts)
 
 
 class AIVDMSentence:
@@ -23,27 +66,17 @@ class AIVDMSentence:
     
     def __str__(self) -> str:
         """Convert to NMEA sentence string."""
-        # Build sentence fields
-        fields = [
-            "AIVDM",
-            str(self.total_sentences),
-            str(self.sentence_number),
-            self.sequential_message_id,
-            self.channel,
-            self.payload,
-            str(self.fill_bits)
-        ]
-        
-        # Create sentence body
-        sentence_body = ",".join(fields)
+        fill = str(self.fill_bits)
         
-        # Calculate checksum
-        checksum = 0
-        for char in sentence_body:
-            checksum ^= ord(char)
+        # Checksum is folded together from the cached header XOR and the
+        # 'payload,fill' tail instead of rescanning the joined body
+        checksum = _header_xor(self.total_sentences, self.sentence_number,
+                               self.sequential_message_id, self.channel)
+        checksum ^= xor_checksum(f"{self.payload},{fill}".encode('ascii'))
         
-        # Return complete sentence
-        return f"!{sentence_body}*{checksum:02X}"
+        return (f"!AIVDM,{self.total_sentences},{self.sentence_number},"
+                f"{self.sequential_message_id},{self.channel},{self.payload},"
+                f"{fill}*{checksum:02X}")
     
     @classmethod
     def from_binary_message(cls, binary_data: str, channel: str = 'A',
@@ -131,32 +164,54 @@ class AIVDMSentence:
 class AISMessageGenerator:
     """Generates AIVDM sentences from vessel data."""
     
+    # Message type -> generator method name, resolved per instance in generate_message
+    _GENERATOR_METHODS: Dict[int, str] = {
+        1: 'generate_type_1',
+        2: 'generate_type_2',
+        3: 'generate_type_3',
+        4: 'generate_type_4',
+        5: 'generate_type_5',
+        18: 'generate_type_18',
+        19: 'generate_type_19',
+        21: 'generate_type_21',
+        24: 'generate_type_24',
+    }
+    
     def __init__(self):
         """Initialize AIS message generator."""
         self.sequence_counter = 0
+        # (mmsi, channel) -> (Type 5 bits, payload parts); refreshed when the bits change
+        self._type5_cache: Dict[Tuple[int, str], Tuple[str, Tuple[Tuple[int, int, str, int], ...]]] = {}
     
     def _get_next_sequence_id(self) -> str:
         """Get next sequential message ID for multi-part messages."""
         self.sequence_counter = (self.sequence_counter + 1) % 10
         return str(self.sequence_counter) if self.sequence_counter > 0 else ""
     
+    def _generate_cnb(self, vessel: VesselState, message_type: int,
+                      channel: str) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Class A position report (types 1-3) straight from the packed int.
+        
+        The 168-bit report always fits one sentence with no fill bits, so
+        the payload is armored from the int without a '0'/'1' string.
+        """
+        value, input_data = AISBinaryEncoder._encode_cnb_value(vessel, message_type)
+        body = f"{AIS6BitEncoder.encode_int_to_6bit(value, CNB_BITS)},0"
+        checksum = _header_xor(1, 1, "", channel) ^ xor_checksum(body.encode('ascii'))
+        return [f"!AIVDM,1,1,,{channel},{body}*{checksum:02X}"], input_data
+    
     def generate_type_1(self, vessel: VesselState, channel: str = 'A') -> Tuple[List[str], Dict[str, Any]]:
         """Generate Type 1 Position Report."""
-        binary_data, input_data = AISBinaryEncoder.encode_type_1(vessel)
-        sentences = AIVDMSentence.from_binary_message(binary_data, channel)
-        return [str(s) for s in sentences], input_data
+        return self._generate_cnb(vessel, 1, channel)
     
     def generate_type_2(self, vessel: VesselState, channel: str = 'A') -> Tuple[List[str], Dict[str, Any]]:
         """Generate Type 2 Position Report (Scheduled)."""
-        binary_data, input_data = AISBinaryEncoder.encode_type_2(vessel)
-        sentences = AIVDMSentence.from_binary_message(binary_data, channel)
-        return [str(s) for s in sentences], input_data
+        return self._generate_cnb(vessel, 2, channel)
     
     def generate_type_3(self, vessel: VesselState, channel: str = 'A') -> Tuple[List[str], Dict[str, Any]]:
         """Generate Type 3 Position Report (Response)."""
-        binary_data, input_data = AISBinaryEncoder.encode_type_3(vessel)
-        sentences = AIVDMSentence.from_binary_message(binary_data, channel)
-        return [str(s) for s in sentences], input_data
+        return self._generate_cnb(vessel, 3, channel)
     
     def generate_type_4(self, base_station: BaseStationData, channel: str = 'A') -> Tuple[List[str], Dict[str, Any]]:
         """Generate Type 4 Base Station Report."""
@@ -168,8 +223,20 @@ class AISMessageGenerator:
         """Generate Type 5 Static and Voyage Data."""
         binary_data, input_data = AISBinaryEncoder.encode_type_5(vessel)
         seq_id = self._get_next_sequence_id()
-        sentences = AIVDMSentence.from_binary_message(binary_data, channel, seq_id)
-        return [str(s) for s in sentences], input_data
+        
+        # Static and voyage data rarely change, so the encoded parts are kept
+        # per vessel and only the sequence ID and checksum vary per emission
+        key = (vessel.mmsi, channel)
+        cached = self._type5_cache.get(key)
+        if cached is None or cached[0] != binary_data:
+            cached = self._type5_cache[key] = (binary_data, _payload_parts(binary_data, channel))
+        
+        sentences = [
+            f"!AIVDM,{total},{number},{seq_id},{channel},{body}"
+            f"*{_header_xor(total, number, seq_id, channel) ^ body_xor:02X}"
+            for total, number, body, body_xor in cached[1]
+        ]
+        return sentences, input_data
     
     def generate_type_18(self, vessel: VesselState, channel: str = 'B') -> Tuple[List[str], Dict[str, Any]]:
         """Generate Type 18 Class B Position Report."""
@@ -193,14 +260,12 @@ class AISMessageGenerator:
         """Generate Type 24 Static Data Report (both parts)."""
         # Generate Part A
         binary_a, input_a = AISBinaryEncoder.encode_type_24_part_a(vessel)
-        sentences_a = AIVDMSentence.from_binary_message(binary_a, channel)
         
         # Generate Part B
         binary_b, input_b = AISBinaryEncoder.encode_type_24_part_b(vessel)
-        sentences_b = AIVDMSentence.from_binary_message(binary_b, channel)
         
         # Combine sentences
-        all_sentences = [str(s) for s in sentences_a] + [str(s) for s in sentences_b]
+        all_sentences = [*_static_sentences(binary_a, channel), *_static_sentences(binary_b, channel)]
         
         # Combine input data
         combined_input = {
@@ -213,19 +278,8 @@ class AISMessageGenerator:
     def generate_message(self, message_type: int, vessel_data: Any, 
                         channel: str = 'A') -> Tuple[List[str], Dict[str, Any]]:
         """Generate AIS message of specified type."""
-        generators = {
-            1: self.generate_type_1,
-            2: self.generate_type_2,
-            3: self.generate_type_3,
-            4: self.generate_type_4,
-            5: self.generate_type_5,
-            18: self.generate_type_18,
-            19: self.generate_type_19,
-            21: self.generate_type_21,
-            24: self.generate_type_24,
-        }
-        
-        if message_type not in generators:
+        method_name = self._GENERATOR_METHODS.get(message_type)
+        if method_name is None:
             raise ValueError(f"Unsupported AIS message type: {message_type}")
 
         # Prepare appropriate data object based on message type
@@ -238,9 +292,9 @@ class AISMessageGenerator:
                     position=vessel_data.navigation_data.position,
                     timestamp=vessel_data.timestamp_sim, # or datetime.now()
                     epfd_type=vessel_data.static_data.epfd_type,
-                    # raim and radio_status can be defaulted or taken from vessel_data if available/applicable
-                    raim=getattr(vessel_data.navigation_data, 'raim', 0),
-                    radio_status=getattr(vessel_data.navigation_data, 'radio_status', 0)
+                    # raim and radio_status are VesselNavigationData fields, always present
+                    raim=vessel_data.navigation_data.raim,
+                    radio_status=vessel_data.navigation_data.radio_status
                 )
             elif not isinstance(vessel_data, BaseStationData):
                 raise TypeError(f"AIS Type 4 requires BaseStationData, got {type(vessel_data)}")
@@ -260,48 +314,66 @@ class AISMessageGenerator:
                     # Other fields can be defaulted
                     off_position=0,
                     regional=0,
-                    raim=getattr(vessel_data.navigation_data, 'raim', 0),
+                    raim=vessel_data.navigation_data.raim,
                     virtual_aid=0,
                     assigned=0,
-                    position_accuracy=getattr(vessel_data.navigation_data, 'position_accuracy', 0)
+                    position_accuracy=vessel_data.navigation_data.position_accuracy
                 )
             elif not isinstance(vessel_data, AidToNavigationData):
                 raise TypeError(f"AIS Type 21 requires AidToNavigationData, got {type(vessel_data)}")
 
-        return generators[message_type](actual_data, channel)
+        return getattr(self, method_name)(actual_data, channel)
 
 
 # Utility functions for testing and validation
-def validate_aivdm_sentence(sentence: str) -> bool:
-    """Validate an AIVDM sentence string."""
-    try:
-        # Parse sentence
-        if not sentence.startswith('!AIVDM,'):
-            return False
-        
-        # Basic format check
-        if '*' not in sentence:
-            return False
-        
-        # Parse fields
-        parts = sentence.split(',')
-        if len(parts) < 7:
+def validate_aivdm_sentence(sentence: Union[str, bytes]) -> bool:
+    """Validate an AIVDM sentence (str or raw bytes), including its checksum."""
+    if isinstance(sentence, (bytes, bytearray, memoryview)):
+        data = bytes(sentence).rstrip(b'\r\n')
+    else:
+        try:
+            data = sentence.encode('ascii').rstrip(b'\r\n')
+        except UnicodeEncodeError:
             return False
-        
-        # Validate AIVDM-specific fields
-        total_sentences = int(parts[1])
-        sentence_number = int(parts[2])
-        channel = parts[4]
-        payload = parts[5]
-        fill_bits = int(parts[6].split('*')[0])
-        
-        # Create AIVDM object for validation
-        aivdm = AIVDMSentence(total_sentences, sentence_number, parts[3], 
-                             channel, payload, fill_bits)
-        return aivdm.validate()
-        
-    except (ValueError, IndexError):
+    
+    if not data.startswith(b'!AIVDM,'):
         return False
+    
+    # Fixed header: !AIVDM,<total>,<number>,<seq id>,<channel>,
+    # Walk the field separators once instead of splitting the whole sentence
+    c1 = data.find(b',', 7)
+    c2 = data.find(b',', c1 + 1)
+    c3 = data.find(b',', c2 + 1)
+    c4 = data.find(b',', c3 + 1)
+    c5 = data.find(b',', c4 + 1)
+    star = data.find(b'*', c5 + 1)
+    if c1 < 0 or c2 < 0 or c3 < 0 or c4 < 0 or c5 < 0 or star < 0:
+        return False
+    
+    total = data[7:c1]
+    number = data[c1 + 1:c2]
+    seq_id = data[c2 + 1:c3]
+    channel = data[c3 + 1:c4]
+    payload = data[c4 + 1:c5]
+    fill = data[c5 + 1:star]
+    checksum = data[star + 1:]
+    
+    if len(total) != 1 or not b'1' <= total <= b'9':
+        return False
+    if len(number) != 1 or not b'1' <= number <= total:
+        return False
+    if len(seq_id) > 1 or seq_id.translate(None, _DIGIT_BYTES):
+        return False
+    if channel not in _CHANNEL_BYTES:
+        return False
+    if payload.translate(None, AIS_6BIT_ASCII_TABLE):
+        return False
+    if len(fill) != 1 or not b'0' <= fill <= b'5':
+        return False
+    if len(checksum) != 2 or checksum.translate(None, _HEX_BYTES):
+        return False
+    
+    return xor_checksum(data[1:star]) == int(checksum, 16)
 
 
 def decode_aivdm_payload(payload: str, fill_bits: int = 0) -> str:
@@ -138,52 +138,39 @@ class GGASentence(PositionSentence, TimeSentence):
     
     def to_sentence(self) -> str:
         """Convert to NMEA sentence string."""
-        builder = SentenceBuilder(self.talker_id, self.sentence_id)
+        format_float = SentenceBuilder.format_float
         
         # Time
-        if self._time:
-            builder.add_field(self._time.to_nmea())
-        else:
-            builder.add_field("")
+        fields = [self._time.to_nmea() if self._time else ""]
         
         # Position
         if self._position:
-            lat_str, lat_hem, lon_str, lon_hem = self._position.to_nmea()
-            builder.add_field(lat_str)
-            builder.add_field(lat_hem)
-            builder.add_field(lon_str)
-            builder.add_field(lon_hem)
+            fields.extend(self._position.to_nmea())
         else:
-            builder.add_field("").add_field("").add_field("").add_field("")
-        
-        # Fix quality
-        builder.add_field(self._fix_quality.value)
+            fields += ("", "", "", "")
         
-        # Satellites in use
-        builder.add_field(self._satellites_in_use if self._satellites_in_use > 0 else "")
-        
-        # Horizontal dilution
-        builder.add_float_field(self._horizontal_dilution, 1)
+        fields += (
+            str(self._fix_quality.value),  # Fix quality
+            str(self._satellites_in_use) if self._satellites_in_use > 0 else "",  # Satellites in use
+            format_float(self._horizontal_dilution),  # Horizontal dilution
+        )
         
         # Altitude
         if self._altitude:
-            builder.add_float_field(self._altitude.value, 1)
-            builder.add_field("M")
+            fields += (format_float(self._altitude.value), "M")
         else:
-            builder.add_field("").add_field("")
+            fields += ("", "")
         
         # Geoidal height
         if self._geoidal_height:
-            builder.add_float_field(self._geoidal_height.value, 1)
-            builder.add_field("M")
+            fields += (format_float(self._geoidal_height.value), "M")
         else:
-            builder.add_field("").add_field("")
+            fields += ("", "")
         
         # DGPS data
-        builder.add_float_field(self._dgps_age, 1)
-        builder.add_field(self._dgps_station_id or "")
+        fields += (format_float(self._dgps_age), self._dgps_station_id or "")
         
-        return builder.build()
+        return SentenceBuilder.build_from_fields(self.talker_id, self.sentence_id, fields)
     
     # Property accessors
     def get_time(self) -> Optional[str]:
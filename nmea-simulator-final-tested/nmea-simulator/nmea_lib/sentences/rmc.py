@@ -150,56 +150,33 @@ class RMCSentence(PositionSentence, TimeSentence, DateSentence):
     
     def to_sentence(self) -> str:
         """Convert to NMEA sentence string."""
-        builder = SentenceBuilder(self.talker_id, self.sentence_id)
+        format_float = SentenceBuilder.format_float
         
-        # Time
-        if self._time:
-            builder.add_field(self._time.to_nmea())
-        else:
-            builder.add_field("")
-        
-        # Status
-        builder.add_field(self._status.value)
+        # Time and status
+        fields = [self._time.to_nmea() if self._time else "", self._status.value]
         
         # Position
         if self._position:
-            lat_str, lat_hem, lon_str, lon_hem = self._position.to_nmea()
-            builder.add_field(lat_str)
-            builder.add_field(lat_hem)
-            builder.add_field(lon_str)
-            builder.add_field(lon_hem)
-        else:
-            builder.add_field("").add_field("").add_field("").add_field("")
-        
-        # Speed over ground
-        if self._speed:
-            builder.add_float_field(self._speed.value, 1)
-        else:
-            builder.add_field("")
-        
-        # Course over ground
-        if self._course:
-            builder.add_float_field(self._course.value, 1)
+            fields.extend(self._position.to_nmea())
         else:
-            builder.add_field("")
+            fields += ("", "", "", "")
         
-        # Date
-        if self._date:
-            builder.add_field(self._date.to_nmea())
-        else:
-            builder.add_field("")
+        fields += (
+            format_float(self._speed.value) if self._speed else "",  # Speed over ground
+            format_float(self._course.value) if self._course else "",  # Course over ground
+            self._date.to_nmea() if self._date else "",  # Date
+        )
         
         # Magnetic variation
         if self._magnetic_variation is not None and self._variation_direction:
-            builder.add_float_field(abs(self._magnetic_variation), 1)
-            builder.add_field(self._variation_direction.value)
+            fields += (format_float(abs(self._magnetic_variation)), self._variation_direction.value)
         else:
-            builder.add_field("").add_field("")
+            fields += ("", "")
         
         # Mode indicator
-        builder.add_field(self._mode_indicator.value)
+        fields.append(self._mode_indicator.value)
         
-        return builder.build()
+        return SentenceBuilder.build_from_fields(self.talker_id, self.sentence_id, fields)
     
     # Property accessors
     def get_time(self) -> Optional[str]:
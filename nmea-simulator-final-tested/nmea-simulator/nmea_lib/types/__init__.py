@@ -1,6 +1,9 @@
 """Data types and utilities for NMEA sentence handling."""
 
-from .position import Position, Hemisphere
+from .position import (
+    Position, Hemisphere, EARTH_RADIUS_M,
+    haversine_distance, initial_bearing, destination_point
+)
 from .datetime import NMEATime, NMEADate, NMEADateTime
 from .units import Speed, Bearing, Distance, SpeedUnit, BearingType, DistanceUnit
 from .enums import *
@@ -11,7 +14,8 @@ from .vessel import (
 )
 
 __all__ = [
-    'Position', 'Hemisphere',
+    'Position', 'Hemisphere', 'EARTH_RADIUS_M',
+    'haversine_distance', 'initial_bearing', 'destination_point',
     'NMEATime', 'NMEADate', 'NMEADateTime',
     'Speed', 'Bearing', 'Distance',
     'SpeedUnit', 'BearingType', 'DistanceUnit',
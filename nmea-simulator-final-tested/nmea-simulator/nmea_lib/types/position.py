@@ -6,6 +6,72 @@ from typing import Optional, Tuple
 import math
 
 
+EARTH_RADIUS_M = 6371000  # Mean Earth radius in meters
+_INV_EARTH_RADIUS_M = 1.0 / EARTH_RADIUS_M
+_NEAR_FIELD_DEG = 1e-3  # |dlat| + |dlon| below which distances use the flat-earth approximation
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two points given in decimal degrees."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2) - math.radians(lon1)
+    
+    # Points within ~100 m (consecutive fixes): an equirectangular projection agrees
+    # with haversine to well under a millimeter and needs one cosine instead of five
+    # transcendental calls
+    if abs(lat2 - lat1) + abs(lon2 - lon1) < _NEAR_FIELD_DEG:
+        return EARTH_RADIUS_M * math.hypot(dlat, math.cos((lat1_rad + lat2_rad) / 2) * dlon)
+    
+    a = (math.sin(dlat / 2) ** 2 + 
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
+    return EARTH_RADIUS_M * (2 * math.asin(math.sqrt(a)))
+
+
+def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial great-circle bearing in degrees (0-360) from the first point to the second."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlon = math.radians(lon2) - math.radians(lon1)
+    
+    y = math.sin(dlon) * math.cos(lat2_rad)
+    x = (math.cos(lat1_rad) * math.sin(lat2_rad) - 
+         math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon))
+    
+    # Normalize to 0-360 degrees
+    return (math.degrees(math.atan2(y, x)) + 360) % 360
+
+
+def destination_point(lat: float, lon: float, bearing_deg: float,
+                      distance_m: float) -> Tuple[float, float]:
+    """
+    Point reached by travelling distance_m along a great circle at bearing_deg.
+    
+    Works on plain floats so batch code can call it without building
+    Position objects; returns (latitude, longitude) in decimal degrees.
+    """
+    lat1_rad = math.radians(lat)
+    bearing_rad = math.radians(bearing_deg)
+    
+    # Each trig term appears twice in the formulas; evaluate it once
+    angular_distance = distance_m * _INV_EARTH_RADIUS_M
+    sin_d = math.sin(angular_distance)
+    cos_d = math.cos(angular_distance)
+    sin_lat1 = math.sin(lat1_rad)
+    cos_lat1 = math.cos(lat1_rad)
+    
+    sin_lat2 = sin_lat1 * cos_d + cos_lat1 * sin_d * math.cos(bearing_rad)
+    lat2_rad = math.asin(sin_lat2)
+    
+    lon2_rad = math.radians(lon) + math.atan2(
+        math.sin(bearing_rad) * sin_d * cos_lat1,
+        cos_d - sin_lat1 * sin_lat2
+    )
+    
+    return math.degrees(lat2_rad), math.degrees(lon2_rad)
+
+
 class Hemisphere(Enum):
     """Hemisphere enumeration for latitude and longitude."""
     NORTH = "N"
@@ -14,10 +80,20 @@ class Hemisphere(Enum):
     WEST = "W"
 
 
+# Hemisphere letters and DDMM.MMMM / DDDMM.MMMM layouts used by Position.to_nmea
+_NORTH, _SOUTH = Hemisphere.NORTH.value, Hemisphere.SOUTH.value
+_EAST, _WEST = Hemisphere.EAST.value, Hemisphere.WEST.value
+_NMEA_LAT_FORMAT = "%02d%07.4f"
+_NMEA_LON_FORMAT = "%03d%07.4f"
+
+
 @dataclass
 class Position:
     """Represents a geographic position with latitude and longitude."""
     
+    # Positions are created per vessel and updated every tick; slots keep them small
+    __slots__ = ('latitude', 'longitude')
+    
     latitude: float  # Decimal degrees
     longitude: float  # Decimal degrees
     
@@ -54,78 +130,32 @@ class Position:
     
     def to_nmea(self) -> Tuple[str, str, str, str]:
         """Convert position to NMEA format strings."""
-        # Latitude
-        lat_abs = abs(self.latitude)
+        # printf-style formatting with module-level layouts is measurably cheaper
+        # than f-string format specs here; this runs for every GPS fix
+        latitude = self.latitude
+        lat_abs = abs(latitude)
         lat_deg = int(lat_abs)
-        lat_min = (lat_abs - lat_deg) * 60.0
-        lat_str = f"{lat_deg:02d}{lat_min:07.4f}"
-        lat_hem = Hemisphere.NORTH.value if self.latitude >= 0 else Hemisphere.SOUTH.value
+        lat_str = _NMEA_LAT_FORMAT % (lat_deg, (lat_abs - lat_deg) * 60.0)
         
-        # Longitude
-        lon_abs = abs(self.longitude)
+        longitude = self.longitude
+        lon_abs = abs(longitude)
         lon_deg = int(lon_abs)
-        lon_min = (lon_abs - lon_deg) * 60.0
-        lon_str = f"{lon_deg:03d}{lon_min:07.4f}"
-        lon_hem = Hemisphere.EAST.value if self.longitude >= 0 else Hemisphere.WEST.value
+        lon_str = _NMEA_LON_FORMAT % (lon_deg, (lon_abs - lon_deg) * 60.0)
         
-        return lat_str, lat_hem, lon_str, lon_hem
+        return (lat_str, _NORTH if latitude >= 0 else _SOUTH,
+                lon_str, _EAST if longitude >= 0 else _WEST)
     
     def distance_to(self, other: 'Position') -> float:
         """Calculate distance to another position in meters using Haversine formula."""
-        lat1_rad = math.radians(self.latitude)
-        lon1_rad = math.radians(self.longitude)
-        lat2_rad = math.radians(other.latitude)
-        lon2_rad = math.radians(other.longitude)
-        
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = (math.sin(dlat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth's radius in meters
-        earth_radius = 6371000
-        return earth_radius * c
+        return haversine_distance(self.latitude, self.longitude, other.latitude, other.longitude)
     
     def bearing_to(self, other: 'Position') -> float:
         """Calculate bearing to another position in degrees."""
-        lat1_rad = math.radians(self.latitude)
-        lon1_rad = math.radians(self.longitude)
-        lat2_rad = math.radians(other.latitude)
-        lon2_rad = math.radians(other.longitude)
-        
-        dlon = lon2_rad - lon1_rad
-        
-        y = math.sin(dlon) * math.cos(lat2_rad)
-        x = (math.cos(lat1_rad) * math.sin(lat2_rad) - 
-             math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon))
-        
-        bearing_rad = math.atan2(y, x)
-        bearing_deg = math.degrees(bearing_rad)
-        
-        # Normalize to 0-360 degrees
-        return (bearing_deg + 360) % 360
+        return initial_bearing(self.latitude, self.longitude, other.latitude, other.longitude)
     
     def move_by_bearing_distance(self, bearing_deg: float, distance_m: float) -> 'Position':
         """Move position by bearing and distance to get new position."""
-        earth_radius = 6371000  # meters
-        
-        lat1_rad = math.radians(self.latitude)
-        lon1_rad = math.radians(self.longitude)
-        bearing_rad = math.radians(bearing_deg)
-        
-        lat2_rad = math.asin(
-            math.sin(lat1_rad) * math.cos(distance_m / earth_radius) +
-            math.cos(lat1_rad) * math.sin(distance_m / earth_radius) * math.cos(bearing_rad)
-        )
-        
-        lon2_rad = lon1_rad + math.atan2(
-            math.sin(bearing_rad) * math.sin(distance_m / earth_radius) * math.cos(lat1_rad),
-            math.cos(distance_m / earth_radius) - math.sin(lat1_rad) * math.sin(lat2_rad)
-        )
-        
-        return Position(math.degrees(lat2_rad), math.degrees(lon2_rad))
+        return Position(*destination_point(self.latitude, self.longitude, bearing_deg, distance_m))
     
     def __str__(self) -> str:
         """String representation of position."""
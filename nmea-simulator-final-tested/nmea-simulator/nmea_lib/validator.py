@@ -1,8 +1,40 @@
 """NMEA sentence validation utilities."""
 
 import re
+from functools import reduce
+from operator import xor
 from typing import Optional
 
+# Two-digit uppercase hex strings for every possible checksum byte
+_HEX = [f"{i:02X}" for i in range(256)]
+
+# Low-byte masks used by xor_checksum, indexed by the number of bytes kept
+_FOLD_MAX_BYTES = 256
+_FOLD_MASKS = [(1 << (n << 3)) - 1 for n in range(_FOLD_MAX_BYTES // 2 + 1)]
+
+
+def xor_checksum(data: bytes) -> int:
+    """
+    XOR of all bytes in data, i.e. the NMEA checksum of a sentence body.
+    
+    The bytes are read as one integer and folded in halves, so each XOR
+    works on many bytes at once instead of one per loop iteration. Inputs
+    longer than any NMEA sentence fall back to a plain byte loop.
+    """
+    n = len(data)
+    if n > _FOLD_MAX_BYTES:
+        return reduce(xor, data, 0)
+    
+    value = int.from_bytes(data, 'little')
+    while n > 8:
+        half = (n + 1) >> 1
+        value = (value >> (half << 3)) ^ (value & _FOLD_MASKS[half])
+        n = half
+    value ^= value >> 32
+    value ^= value >> 16
+    value ^= value >> 8
+    return value & 0xFF
+
 
 class SentenceValidator:
     """Validates NMEA sentence format and checksum."""
@@ -33,10 +65,7 @@ class SentenceValidator:
     @staticmethod
     def calculate_checksum(sentence_body: str) -> str:
         """Calculate NMEA checksum for sentence body (without $ and *)."""
-        checksum = 0
-        for char in sentence_body:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        return _HEX[xor_checksum(sentence_body.encode('ascii'))]
     
     @staticmethod
     def validate_checksum(sentence: str) -> bool:
@@ -60,8 +89,8 @@ class SentenceValidator:
             # Calculate expected checksum
             expected_checksum = SentenceValidator.calculate_checksum(sentence_body)
             
-            # Compare checksums (case insensitive)
-            return checksum_str.upper() == expected_checksum.upper()
+            # Compare checksums (case insensitive; the calculated one is already uppercase)
+            return checksum_str.upper() == expected_checksum
             
         except (ValueError, IndexError):
             return False
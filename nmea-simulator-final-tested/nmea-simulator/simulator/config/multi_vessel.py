@@ -2,6 +2,7 @@
 
 import yaml
 import json
+import random
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -328,8 +329,6 @@ class MultiVesselConfigManager:
     def create_random_fleet(self, name: str, vessel_count: int, area: Dict[str, float],
                            templates: Optional[List[str]] = None) -> ScenarioConfig:
         """Create a scenario with randomly positioned vessels."""
-        import random
-        
         if templates is None:
             templates = list(self.vessel_templates.keys())
         
@@ -9,6 +9,12 @@ from dataclasses import dataclass
 from nmea_lib import TalkerId
 from ..core.engine import SimulationConfig, SentenceConfig
 from ..outputs import FileOutputConfig, TCPOutputConfig, UDPOutputConfig
+from ..utils.json_io import dumps, loads, read_json
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 
 @dataclass
@@ -24,21 +30,62 @@ class ConfigParser:
     """Parser for YAML configuration files."""
     
     @staticmethod
-    def from_file(config_path: str) -> SimulationConfig:
-        """Load configuration from YAML file."""
+    def from_file(config_path: str, use_cache: bool = True) -> SimulationConfig:
+        """
+        Load configuration from YAML file.
+        
+        The parsed YAML is cached as JSON next to the file
+        (``<name>.cache.json``) together with the file's mtime and size, and
+        reused while they still match, so repeated runs skip YAML parsing.
+        Files holding values JSON cannot represent exactly (timestamps,
+        non-string keys, ...) are never cached, so a cached load always
+        sees the same data as a fresh parse.
+        """
         config_file = Path(config_path)
         
-        if not config_file.exists():
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in configuration file: {e}")
+        cache_file = config_file.with_name(config_file.name + '.cache.json')
+        source_key = [stat.st_mtime_ns, stat.st_size]
+        
+        config_data = ConfigParser._read_cache(cache_file, source_key) if use_cache else None
+        if config_data is None:
+            try:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config_data = yaml.load(f, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in configuration file: {e}")
+            
+            if use_cache:
+                ConfigParser._write_cache(cache_file, source_key, config_data)
         
         return ConfigParser.from_dict(config_data)
     
+    @staticmethod
+    def _read_cache(cache_file: Path, source_key: List[int]) -> Optional[Dict[str, Any]]:
+        """Return cached config data if it was built from the same file version."""
+        try:
+            cached = read_json(cache_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get('source') != source_key:
+            return None
+        return cached.get('data')
+    
+    @staticmethod
+    def _write_cache(cache_file: Path, source_key: List[int], config_data: Any) -> None:
+        """Store parsed config data; a read-only config directory just means no cache."""
+        payload = dumps({'source': source_key, 'data': config_data})
+        if loads(payload)['data'] != config_data:
+            return
+        try:
+            cache_file.write_bytes(payload)
+        except OSError:
+            pass
+    
     @staticmethod
     def from_dict(config_data: Dict[str, Any]) -> SimulationConfig:
         """Create configuration from dictionary."""
@@ -97,11 +144,15 @@ class ConfigParser:
                 sentence_config = ConfigParser._parse_sentence_config(sentence_data)
                 config.sentences.append(sentence_config)
         
+        # Socket tuning shared by the network outputs
+        network_config = config_data.get('network') or {}
+        sndbuf_bytes = network_config.get('sndbuf_bytes')
+        
         # Store output configurations for later use
         config.output_configs = []
         if 'outputs' in config_data:
             for output_data in config_data['outputs']:
-                output_config = ConfigParser._parse_output_config(output_data)
+                output_config = ConfigParser._parse_output_config(output_data, sndbuf_bytes)
                 config.output_configs.append(output_config)
         
         return config
@@ -129,8 +180,15 @@ class ConfigParser:
         )
     
     @staticmethod
-    def _parse_output_config(output_data: Dict[str, Any]) -> OutputConfig:
-        """Parse output configuration."""
+    def _parse_output_config(output_data: Dict[str, Any],
+                             sndbuf_bytes: Optional[int] = None) -> OutputConfig:
+        """
+        Parse output configuration.
+        
+        sndbuf_bytes (from ``network.sndbuf_bytes``) sets the socket send
+        buffer of the TCP/UDP outputs; a per-output ``send_buffer_size``
+        takes precedence.
+        """
         output_type = output_data.get('type', 'file').lower()
         enabled = bool(output_data.get('enabled', True))
         
@@ -150,7 +208,9 @@ class ConfigParser:
                 port=int(output_data.get('port', 10110)),
                 max_clients=int(output_data.get('max_clients', 10)),
                 client_timeout=float(output_data.get('client_timeout', 30.0)),
-                send_timeout=float(output_data.get('send_timeout', 5.0))
+                send_timeout=float(output_data.get('send_timeout', 5.0)),
+                send_buffer_size=int(output_data.get(
+                    'send_buffer_size', sndbuf_bytes or TCPOutputConfig.send_buffer_size))
             )
         
         elif output_type == 'udp':
@@ -160,7 +220,9 @@ class ConfigParser:
                 broadcast=bool(output_data.get('broadcast', True)),
                 multicast_group=output_data.get('multicast_group'),
                 multicast_ttl=int(output_data.get('multicast_ttl', 1)),
-                send_timeout=float(output_data.get('send_timeout', 1.0))
+                send_timeout=float(output_data.get('send_timeout', 1.0)),
+                send_buffer_size=int(output_data.get(
+                    'send_buffer_size', sndbuf_bytes or UDPOutputConfig.send_buffer_size))
             )
         
         else:
@@ -3,11 +3,11 @@
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 
 from nmea_lib import GGASentence, RMCSentence, TalkerId, GpsFixQuality
-from nmea_lib.types import DataStatus, ModeIndicator, Distance, DistanceUnit
+from nmea_lib.types import DataStatus, ModeIndicator, Distance, DistanceUnit, Position
 from .time_manager import TimeManager
 from ..generators.position import PositionGenerator, PositionState
 from ..outputs.base import OutputHandler
@@ -83,7 +83,6 @@ class SimulationEngine:
             time_factor=config.time_factor
         )
         
-        from nmea_lib.types import Position
         initial_position = Position(config.initial_latitude, config.initial_longitude)
         self.position_generator = PositionGenerator(
             initial_position=initial_position,
@@ -111,6 +110,7 @@ class SimulationEngine:
         self.running = False
         self.simulation_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
+        self.finished_event = threading.Event()  # Set when the simulation stops running
         
         # Statistics
         self.total_sentences_generated = 0
@@ -133,6 +133,7 @@ class SimulationEngine:
         
         self.running = True
         self.stop_event.clear()
+        self.finished_event.clear()
         self.simulation_start_time = datetime.now()
         
         # Start output handlers
@@ -153,6 +154,7 @@ class SimulationEngine:
         
         self.running = False
         self.stop_event.set()
+        self.finished_event.set()
         
         # Wait for simulation thread to finish
         if self.simulation_thread:
@@ -165,6 +167,16 @@ class SimulationEngine:
             except Exception as e:
                 print(f"Warning: Failed to stop output handler {handler}: {e}")
     
+    def request_shutdown(self) -> None:
+        """
+        Ask the simulation loop to finish without waiting for it.
+        
+        Only sets events, so it is safe to call from a signal handler;
+        stop() still joins the thread and stops the output handlers.
+        """
+        self.stop_event.set()
+        self.finished_event.set()
+    
     def _simulation_loop(self) -> None:
         """Main simulation loop."""
         last_update_time = self.time_manager.get_current_time()
@@ -197,9 +209,11 @@ class SimulationEngine:
                 time.sleep(0.1)
         
         self.running = False
+        self.finished_event.set()
     
     def _generate_sentences(self, current_time: datetime, position_state: PositionState) -> None:
-        """Generate NMEA sentences based on configuration."""
+        """Generate NMEA sentences based on configuration and send them as one batch."""
+        batch: List[str] = []
         for sentence_config in self.config.sentences:
             if sentence_config.should_update(current_time):
                 try:
@@ -208,8 +222,7 @@ class SimulationEngine:
                     if generator:
                         sentence = generator(sentence_config, current_time, position_state)
                         if sentence:
-                            # Send to all output handlers
-                            self._send_sentence(sentence)
+                            batch.append(sentence)
                             
                             # Update statistics
                             self.total_sentences_generated += 1
@@ -221,14 +234,18 @@ class SimulationEngine:
                     
                 except Exception as e:
                     print(f"Error generating {sentence_config.sentence_type} sentence: {e}")
+        
+        if batch:
+            # Send to all output handlers
+            self._send_sentences(batch)
     
-    def _send_sentence(self, sentence: str) -> None:
-        """Send sentence to all output handlers."""
+    def _send_sentences(self, sentences: List[str]) -> None:
+        """Send sentences to all output handlers."""
         for handler in self.output_handlers:
             try:
-                handler.send_sentence(sentence)
+                handler.send_sentences(sentences)
             except Exception as e:
-                print(f"Error sending sentence to {handler}: {e}")
+                print(f"Error sending sentences to {handler}: {e}")
     
     def _generate_gga_sentence(self, config: SentenceConfig, current_time: datetime, 
                              position_state: PositionState) -> Optional[str]:
@@ -300,10 +317,26 @@ class SimulationEngine:
             print(f"Error generating RMC sentence: {e}")
             return None
     
+    def wait_until_finished(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for the simulation to stop.
+        
+        Monitoring loops use this instead of time.sleep() so they wake up as
+        soon as the run ends. Returns True if the simulation has stopped.
+        """
+        return self.finished_event.wait(timeout)
+    
+    def get_position_snapshot(self) -> Tuple[float, float, float, float]:
+        """Get (latitude, longitude, speed_knots, heading_degrees) of the vessel."""
+        generator = self.position_generator
+        position = generator.current_position
+        return (position.latitude, position.longitude,
+                generator.current_speed.value, generator.current_heading.value)
+    
     def get_status(self) -> Dict:
         """Get simulation status."""
         current_time = self.time_manager.get_current_time()
-        position_state = self.position_generator.get_current_state(current_time)
+        latitude, longitude, speed_knots, heading_degrees = self.get_position_snapshot()
         
         # Calculate runtime
         runtime = 0.0
@@ -315,10 +348,10 @@ class SimulationEngine:
             'simulation_time': current_time.isoformat(),
             'time_factor': self.time_manager.time_factor,
             'position': {
-                'latitude': position_state.position.latitude,
-                'longitude': position_state.position.longitude,
-                'speed_knots': position_state.speed.value,
-                'heading_degrees': position_state.heading.value
+                'latitude': latitude,
+                'longitude': longitude,
+                'speed_knots': speed_knots,
+                'heading_degrees': heading_degrees
             },
             'statistics': {
                 'total_sentences': self.total_sentences_generated,
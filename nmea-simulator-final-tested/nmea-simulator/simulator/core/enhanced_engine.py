@@ -1,7 +1,6 @@
 """Enhanced simulation engine with AIS and GPS integration."""
 
 import threading
-import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
@@ -10,6 +9,7 @@ import logging
 from simulator.core.time_manager import TimeManager
 from simulator.core.ais_scheduler import AISMessageScheduler
 from simulator.generators.vessel import EnhancedVesselGenerator
+from simulator.generators.fleet import VesselFleet
 from simulator.outputs.base import OutputHandler
 from nmea_lib.sentences.gga import GGASentence, GpsFixQuality
 from nmea_lib.sentences.rmc import RMCSentence
@@ -46,6 +46,52 @@ class SimulationConfig:
     enable_trace_logging: bool = False
 
 
+class SimulationStats:
+    """
+    Engine counters, shared by the simulation, GPS and AIS threads.
+    
+    Counters are changed through increment(), which holds the lock, and
+    readers take a consistent copy with snapshot().
+    """
+    
+    __slots__ = ('start_time', 'sentences_sent', 'gps_sentences', 'ais_sentences',
+                 'errors', 'vessels_active', 'runtime_seconds', 'sentences_per_second',
+                 'ais_scheduler_stats', '_lock')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start_time: Optional[datetime] = None
+        self.sentences_sent = 0
+        self.gps_sentences = 0
+        self.ais_sentences = 0
+        self.errors = 0
+        self.vessels_active = 0
+        self.runtime_seconds = 0.0
+        self.sentences_per_second = 0.0
+        self.ais_scheduler_stats: Dict[str, Any] = {}
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add amount to the named counter under the lock."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+    
+    def snapshot(self) -> 'SimulationStats':
+        """Return a detached copy taken under the lock."""
+        copy = SimulationStats()
+        with self._lock:
+            for name in _STATS_FIELDS:
+                setattr(copy, name, getattr(self, name))
+        return copy
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict copy, e.g. for JSON reports."""
+        with self._lock:
+            return {name: getattr(self, name) for name in _STATS_FIELDS}
+
+
+_STATS_FIELDS = tuple(name for name in SimulationStats.__slots__ if name != '_lock')
+
+
 class EnhancedSimulationEngine:
     """Enhanced simulation engine supporting both GPS and AIS."""
     
@@ -60,6 +106,14 @@ class EnhancedSimulationEngine:
         
         # Vessel management
         self.vessel_generators: Dict[int, EnhancedVesselGenerator] = {}
+        
+        # Linear-movement vessels are advanced together as one fleet; other
+        # movement patterns keep stepping through their own generator.
+        # Built lazily on the first update, then vessels are added and removed
+        # in place so the fleet's random stream and course-change clock carry on.
+        self._fleet: Optional[VesselFleet] = None
+        self._patterned_generators: List[EnhancedVesselGenerator] = []
+        self._fleet_lock = threading.Lock()
         self.base_stations: Dict[int, BaseStationData] = {}
         self.aids_to_navigation: Dict[int, AidToNavigationData] = {}
         
@@ -71,23 +125,18 @@ class EnhancedSimulationEngine:
         self.simulation_thread: Optional[threading.Thread] = None
         self.gps_thread: Optional[threading.Thread] = None
         self.ais_thread: Optional[threading.Thread] = None
+        # Set when the simulation stops for any reason; setting it requests a stop
+        self.stop_event = threading.Event()
         
         # Statistics
-        self.stats = {
-            'start_time': None,
-            'sentences_sent': 0,
-            'gps_sentences': 0,
-            'ais_sentences': 0,
-            'errors': 0,
-            'vessels_active': 0
-        }
+        self.stats = SimulationStats()
         
         # Logging
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(getattr(logging, config.log_level.upper()))
         
         # Trace logging callback
-        self.trace_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        self.trace_callback: Optional[Callable[[int, int, List[str], Dict[str, Any]], None]] = None
     
     def add_vessel(self, vessel_config: Dict) -> int:
         """Add a vessel to the simulation."""
@@ -96,7 +145,17 @@ class EnhancedSimulationEngine:
         mmsi = vessel_state.mmsi
         
         # Add to vessel generators
-        self.vessel_generators[mmsi] = vessel_generator
+        with self._fleet_lock:
+            self.vessel_generators[mmsi] = vessel_generator
+            if self._fleet is not None:
+                if self._is_patterned(vessel_generator):
+                    self._patterned_generators.append(vessel_generator)
+                else:
+                    self._fleet.add(
+                        vessel_state,
+                        max_speed=vessel_generator.max_speed,
+                        position_noise=vessel_generator.movement_pattern.position_noise
+                    )
         
         # Add to AIS scheduler
         if self.config.enable_ais:
@@ -141,7 +200,13 @@ class EnhancedSimulationEngine:
     def remove_vessel(self, mmsi: int):
         """Remove a vessel from the simulation."""
         if mmsi in self.vessel_generators:
-            del self.vessel_generators[mmsi]
+            with self._fleet_lock:
+                generator = self.vessel_generators.pop(mmsi)
+                if self._fleet is not None:
+                    if generator in self._patterned_generators:
+                        self._patterned_generators.remove(generator)
+                    else:
+                        self._fleet.remove(mmsi)
             self.ais_scheduler.remove_vessel(mmsi)
             self.logger.info(f"Removed vessel {mmsi}")
     
@@ -156,8 +221,8 @@ class EnhancedSimulationEngine:
             self.output_handlers.remove(handler)
             self.logger.info(f"Removed output handler: {type(handler).__name__}")
     
-    def set_trace_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
-        """Set callback for trace logging."""
+    def set_trace_callback(self, callback: Callable[[int, int, List[str], Dict[str, Any]], None]):
+        """Set callback for trace logging, called as (mmsi, message_type, sentences, input_data)."""
         self.trace_callback = callback
     
     def start(self):
@@ -167,8 +232,9 @@ class EnhancedSimulationEngine:
             return
         
         self.running = True
-        self.stats['start_time'] = datetime.now()
-        self.stats['vessels_active'] = len(self.vessel_generators)
+        self.stop_event.clear()
+        self.stats.start_time = datetime.now()
+        self.stats.vessels_active = len(self.vessel_generators)
         
         self.logger.info("Starting enhanced simulation engine")
         
@@ -198,6 +264,7 @@ class EnhancedSimulationEngine:
         
         self.logger.info("Stopping simulation engine")
         self.running = False
+        self.stop_event.set()
         
         # No explicit stop needed for time manager
         # It will stop tracking when simulation ends
@@ -225,7 +292,7 @@ class EnhancedSimulationEngine:
         """Main simulation loop."""
         start_time = datetime.now()
         
-        while self.running:
+        while self.running and not self.stop_event.is_set():
             try:
                 current_time = self.time_manager.get_current_time()
                 elapsed = (datetime.now() - start_time).total_seconds()
@@ -242,20 +309,21 @@ class EnhancedSimulationEngine:
                 self._update_ais_intervals()
                 
                 # Sleep for update interval
-                time.sleep(self.config.update_interval)
+                self.stop_event.wait(self.config.update_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in simulation loop: {e}")
-                self.stats['errors'] += 1
-                time.sleep(1.0)
+                self.stats.increment('errors')
+                self.stop_event.wait(1.0)
         
         self.running = False
+        self.stop_event.set()
     
     def _gps_loop(self):
         """GPS sentence generation loop."""
         last_gps_update = datetime.now()
         
-        while self.running:
+        while self.running and not self.stop_event.is_set():
             try:
                 current_time = datetime.now()
                 
@@ -264,16 +332,16 @@ class EnhancedSimulationEngine:
                     self._generate_gps_sentences(current_time)
                     last_gps_update = current_time
                 
-                time.sleep(0.1)  # Check every 100ms
+                self.stop_event.wait(0.1)  # Check every 100ms
                 
             except Exception as e:
                 self.logger.error(f"Error in GPS loop: {e}")
-                self.stats['errors'] += 1
-                time.sleep(1.0)
+                self.stats.increment('errors')
+                self.stop_event.wait(1.0)
     
     def _ais_loop(self):
         """AIS sentence generation loop."""
-        while self.running:
+        while self.running and not self.stop_event.is_set():
             try:
                 current_time = self.time_manager.get_current_time()
                 
@@ -286,50 +354,84 @@ class EnhancedSimulationEngine:
                 # Clean up old schedules periodically
                 self.ais_scheduler.cleanup_old_schedules(current_time)
                 
-                time.sleep(self.config.ais_update_interval)
+                self.stop_event.wait(self.config.ais_update_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in AIS loop: {e}")
-                self.stats['errors'] += 1
-                time.sleep(1.0)
+                self.stats.increment('errors')
+                self.stop_event.wait(1.0)
+    
+    @staticmethod
+    def _is_patterned(generator: EnhancedVesselGenerator) -> bool:
+        """True if the vessel steps through its own generator rather than the fleet."""
+        return generator.movement_pattern.pattern_type in ('circular', 'waypoint', 'random_walk')
+    
+    def _build_fleet(self) -> VesselFleet:
+        """Split vessels into the batched linear fleet and per-generator patterns."""
+        linear = []
+        patterned = []
+        for generator in self.vessel_generators.values():
+            if self._is_patterned(generator):
+                patterned.append(generator)
+            else:
+                linear.append(generator)
+        
+        self._fleet = VesselFleet(
+            [generator.get_current_state() for generator in linear],
+            max_speed=[generator.max_speed for generator in linear],
+            position_noise=[generator.movement_pattern.position_noise for generator in linear]
+        )
+        self._patterned_generators = patterned
+        return self._fleet
     
     def _update_vessel_positions(self, current_time: datetime):
         """Update positions for all vessels."""
-        for mmsi, generator in self.vessel_generators.items():
+        # Held for the whole step so add/remove can't change the rows mid-loop
+        with self._fleet_lock:
+            fleet = self._fleet
+            if fleet is None:
+                fleet = self._build_fleet()
+            
             try:
-                # Update vessel state
-                vessel_state = generator.update_vessel_state(
-                    self.config.update_interval, current_time
-                )
-                
-                # Update AIS scheduler with new speed
-                self.ais_scheduler.update_vessel_intervals(
-                    mmsi, vessel_state.navigation_data.sog
-                )
-                
+                fleet.step(self.config.update_interval, current_time)
+            except Exception as e:
+                self.logger.error(f"Error updating vessel fleet: {e}")
+                self.stats.increment('errors')
+            
+            patterned = list(self._patterned_generators)
+        
+        for generator in patterned:
+            try:
+                generator.update_vessel_state(self.config.update_interval, current_time)
             except Exception as e:
-                self.logger.error(f"Error updating vessel {mmsi}: {e}")
-                self.stats['errors'] += 1
+                self.logger.error(f"Error updating vessel {generator.get_current_state().mmsi}: {e}")
+                self.stats.increment('errors')
+        
+        # Update AIS scheduler with new speeds
+        for mmsi, generator in self.vessel_generators.items():
+            self.ais_scheduler.update_vessel_intervals(
+                mmsi, generator.get_current_state().navigation_data.sog
+            )
     
     def _generate_gps_sentences(self, current_time: datetime):
-        """Generate GPS sentences for all vessels."""
+        """Generate GPS sentences for all vessels and send them as one batch."""
+        batch: List[str] = []
         for mmsi, generator in self.vessel_generators.items():
             try:
                 vessel_state = generator.get_current_state()
                 
-                # Generate GGA sentence
+                # Generate GGA and RMC sentences
                 gga_sentence = self._create_gga_sentence(vessel_state, current_time)
-                self._send_sentence(str(gga_sentence), 'GPS')
-                
-                # Generate RMC sentence
                 rmc_sentence = self._create_rmc_sentence(vessel_state, current_time)
-                self._send_sentence(str(rmc_sentence), 'GPS')
+                batch += (gga_sentence.to_sentence(), rmc_sentence.to_sentence())
                 
-                self.stats['gps_sentences'] += 2
+                self.stats.increment('gps_sentences', 2)
                 
             except Exception as e:
                 self.logger.error(f"Error generating GPS sentences for vessel {mmsi}: {e}")
-                self.stats['errors'] += 1
+                self.stats.increment('errors')
+        
+        self._send_sentences(batch)
     
     def _generate_ais_message(self, vessel_mmsi: int, message_type: int, current_time: datetime):
         """Generate AIS message for a specific vessel and message type."""
@@ -353,28 +455,20 @@ class EnhancedSimulationEngine:
             )
             
             # Send sentences
-            for sentence in sentences:
-                self._send_sentence(sentence, 'AIS')
+            self._send_sentences(sentences)
             
             # Mark message as sent
             self.ais_scheduler.mark_message_sent(vessel_mmsi, message_type, current_time)
             
             # Trace logging
             if self.config.enable_trace_logging and self.trace_callback:
-                trace_data = {
-                    'timestamp': current_time.isoformat(),
-                    'vessel_mmsi': vessel_mmsi,
-                    'message_type': message_type,
-                    'sentences': sentences,
-                    'input_data': input_data
-                }
-                self.trace_callback('ais_message_generated', trace_data)
+                self.trace_callback(vessel_mmsi, message_type, sentences, input_data)
             
-            self.stats['ais_sentences'] += len(sentences)
+            self.stats.increment('ais_sentences', len(sentences))
             
         except Exception as e:
             self.logger.error(f"Error generating AIS message type {message_type} for vessel {vessel_mmsi}: {e}")
-            self.stats['errors'] += 1
+            self.stats.increment('errors')
     
     def _create_gga_sentence(self, vessel_state: VesselState, current_time: datetime) -> GGASentence:
         """Create GGA sentence from vessel state."""
@@ -416,18 +510,19 @@ class EnhancedSimulationEngine:
         
         return rmc
     
-    def _send_sentence(self, sentence: str, sentence_type: str):
-        """Send sentence to all output handlers."""
+    def _send_sentences(self, sentences: List[str]):
+        """Send sentences to all output handlers, letting each batch its writes."""
+        if not sentences:
+            return
         for handler in self.output_handlers:
             try:
-                success = handler.send_sentence(sentence)
-                if success:
-                    self.stats['sentences_sent'] += 1
-                else:
-                    self.stats['errors'] += 1
+                sent = handler.send_sentences(sentences)
+                self.stats.increment('sentences_sent', sent)
+                if sent < len(sentences):
+                    self.stats.increment('errors', len(sentences) - sent)
             except Exception as e:
-                self.logger.error(f"Error sending sentence via {type(handler).__name__}: {e}")
-                self.stats['errors'] += 1
+                self.logger.error(f"Error sending sentences via {type(handler).__name__}: {e}")
+                self.stats.increment('errors')
     
     def _update_ais_intervals(self):
         """Update AIS transmission intervals based on vessel speeds."""
@@ -437,15 +532,23 @@ class EnhancedSimulationEngine:
             self.ais_scheduler.update_vessel_intervals(mmsi, speed)
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get simulation statistics."""
+        """Get simulation statistics as a dict."""
+        return self.get_stats_snapshot().to_dict()
+    
+    def get_stats_snapshot(self) -> SimulationStats:
+        """
+        Get simulation statistics as a SimulationStats snapshot.
+        
+        The snapshot is detached, so the running threads do not change it.
+        """
+        stats = self.stats.snapshot()
         runtime = 0
-        if self.stats['start_time']:
-            runtime = (datetime.now() - self.stats['start_time']).total_seconds()
+        if stats.start_time:
+            runtime = (datetime.now() - stats.start_time).total_seconds()
         
-        stats = self.stats.copy()
-        stats['runtime_seconds'] = runtime
-        stats['sentences_per_second'] = stats['sentences_sent'] / max(1, runtime)
-        stats['ais_scheduler_stats'] = self.ais_scheduler.get_transmission_statistics()
+        stats.runtime_seconds = runtime
+        stats.sentences_per_second = stats.sentences_sent / max(1, runtime)
+        stats.ais_scheduler_stats = self.ais_scheduler.get_transmission_statistics()
         
         return stats
     
@@ -464,10 +567,12 @@ class EnhancedSimulationEngine:
         """Check if simulation is running."""
         return self.running
     
-    def wait_for_completion(self):
-        """Wait for simulation to complete."""
-        if self.simulation_thread:
-            self.simulation_thread.join()
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """Wait for simulation to complete; returns False if the timeout expired first."""
+        if not self.simulation_thread:
+            return True
+        self.simulation_thread.join(timeout)
+        return not self.simulation_thread.is_alive()
 
 
 # Utility functions
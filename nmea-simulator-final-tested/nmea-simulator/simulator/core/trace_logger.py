@@ -2,12 +2,15 @@
 
 import json
 import logging
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional, TextIO
+from typing import Dict, Any, List, Optional, BinaryIO, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import threading
-from queue import Queue, Empty
+
+from simulator.utils.json_io import dumps as _dumps
 
 
 @dataclass
@@ -24,6 +27,14 @@ class TraceEntry:
     errors: Optional[List[str]] = None
 
 
+# Raw records queued by the log_* methods, in TraceEntry field order except that
+# the timestamp is kept as a time.time() float until the worker formats it
+_TRACE_FIELDS = tuple(f.name for f in fields(TraceEntry))
+RawTraceRecord = Tuple[float, str, int, Optional[int], Optional[Dict[str, Any]],
+                       Optional[List[str]], Optional[Dict[str, Any]],
+                       Optional[float], Optional[List[str]]]
+
+
 class AISTraceLogger:
     """Comprehensive trace logging for AIS message generation and processing."""
     
@@ -35,13 +46,14 @@ class AISTraceLogger:
         self.enable_console = enable_console
         self.max_queue_size = max_queue_size
         
-        # Logging queue for thread-safe operation
-        self.log_queue: Queue = Queue(maxsize=max_queue_size)
+        # Raw records waiting for the worker; deque append/popleft are thread-safe
+        self.log_queue: deque = deque()
+        self._wakeup = threading.Event()
         self.running = False
         self.log_thread: Optional[threading.Thread] = None
         
         # File handle
-        self.file_handle: Optional[TextIO] = None
+        self.file_handle: Optional[BinaryIO] = None
         
         # Statistics
         self.stats = {
@@ -66,7 +78,7 @@ class AISTraceLogger:
         
         # Open log file if specified
         if self.log_file:
-            self.file_handle = open(self.log_file, 'w', encoding='utf-8')
+            self.file_handle = open(self.log_file, 'wb', buffering=1 << 20)
             self.logger.info(f"Opened trace log file: {self.log_file}")
         
         # Start logging thread
@@ -81,6 +93,7 @@ class AISTraceLogger:
             return
         
         self.running = False
+        self._wakeup.set()
         
         # Wait for log thread to finish
         if self.log_thread and self.log_thread.is_alive():
@@ -97,153 +110,113 @@ class AISTraceLogger:
                              sentences: List[str], input_data: Dict[str, Any],
                              processing_time_ms: float = None):
         """Log AIS message generation."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='message_generated',
-            vessel_mmsi=vessel_mmsi,
-            message_type=message_type,
-            sentences=sentences,
-            input_data=input_data,
-            processing_time_ms=processing_time_ms
-        )
-        
-        self._queue_entry(entry)
+        self._queue_entry((time.time(), 'message_generated', vessel_mmsi, message_type,
+                           None, sentences, input_data, processing_time_ms, None))
     
     def log_message_transmission(self, vessel_mmsi: int, message_type: int,
                                sentences: List[str], channel: str = None):
         """Log AIS message transmission."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='message_transmitted',
-            vessel_mmsi=vessel_mmsi,
-            message_type=message_type,
-            sentences=sentences,
-            data={'channel': channel} if channel else None
-        )
-        
-        self._queue_entry(entry)
+        self._queue_entry((time.time(), 'message_transmitted', vessel_mmsi, message_type,
+                           {'channel': channel} if channel else None, sentences,
+                           None, None, None))
     
     def log_vessel_update(self, vessel_mmsi: int, position_data: Dict[str, Any]):
         """Log vessel position/state update."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='vessel_updated',
-            vessel_mmsi=vessel_mmsi,
-            data=position_data
-        )
-        
-        self._queue_entry(entry)
+        self._queue_entry((time.time(), 'vessel_updated', vessel_mmsi, None,
+                           position_data, None, None, None, None))
     
     def log_scheduling_event(self, vessel_mmsi: int, message_type: int,
                            event_data: Dict[str, Any]):
         """Log AIS message scheduling event."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='message_scheduled',
-            vessel_mmsi=vessel_mmsi,
-            message_type=message_type,
-            data=event_data
-        )
-        
-        self._queue_entry(entry)
+        self._queue_entry((time.time(), 'message_scheduled', vessel_mmsi, message_type,
+                           event_data, None, None, None, None))
     
     def log_error(self, vessel_mmsi: int, error_message: str,
                   context: Optional[Dict[str, Any]] = None):
         """Log error event."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='error',
-            vessel_mmsi=vessel_mmsi,
-            errors=[error_message],
-            data=context
-        )
-        
-        self._queue_entry(entry)
+        self._queue_entry((time.time(), 'error', vessel_mmsi, None,
+                           context, None, None, None, [error_message]))
         self.stats['errors'] += 1
     
     def log_binary_encoding(self, vessel_mmsi: int, message_type: int,
                           binary_data: str, encoded_payload: str,
                           encoding_details: Dict[str, Any]):
         """Log binary encoding process."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='binary_encoded',
-            vessel_mmsi=vessel_mmsi,
-            message_type=message_type,
-            data={
-                'binary_length': len(binary_data),
-                'encoded_length': len(encoded_payload),
-                'binary_data': binary_data[:100] + '...' if len(binary_data) > 100 else binary_data,
-                'encoded_payload': encoded_payload,
-                **encoding_details
-            }
-        )
-        
-        self._queue_entry(entry)
+        data = {
+            'binary_length': len(binary_data),
+            'encoded_length': len(encoded_payload),
+            'binary_data': binary_data[:100] + '...' if len(binary_data) > 100 else binary_data,
+            'encoded_payload': encoded_payload,
+            **encoding_details
+        }
+        self._queue_entry((time.time(), 'binary_encoded', vessel_mmsi, message_type,
+                           data, None, None, None, None))
     
     def log_sentence_validation(self, sentence: str, is_valid: bool,
                               validation_errors: Optional[List[str]] = None):
         """Log sentence validation results."""
-        entry = TraceEntry(
-            timestamp=datetime.now().isoformat(),
-            event_type='sentence_validated',
-            vessel_mmsi=0,  # Not vessel-specific
-            data={
-                'sentence': sentence,
-                'is_valid': is_valid,
-                'validation_errors': validation_errors or []
-            }
-        )
-        
-        self._queue_entry(entry)
+        data = {
+            'sentence': sentence,
+            'is_valid': is_valid,
+            'validation_errors': validation_errors or []
+        }
+        # Not vessel-specific
+        self._queue_entry((time.time(), 'sentence_validated', 0, None,
+                           data, None, None, None, None))
     
-    def _queue_entry(self, entry: TraceEntry):
-        """Queue a trace entry for logging."""
-        try:
-            self.log_queue.put_nowait(entry)
-        except:
+    def _queue_entry(self, record: RawTraceRecord):
+        """Queue a raw trace record; serialization happens on the worker thread."""
+        if len(self.log_queue) >= self.max_queue_size:
             # Queue is full, drop the entry
             self.stats['entries_dropped'] += 1
+            return
+        self.log_queue.append(record)
+        self._wakeup.set()
     
     def _log_worker(self):
         """Worker thread for processing log entries."""
-        while self.running or not self.log_queue.empty():
+        queue = self.log_queue
+        while self.running or queue:
+            if not queue:
+                self._wakeup.wait(timeout=1.0)
+                self._wakeup.clear()
+                continue
+            
             try:
-                # Get entry from queue with timeout
-                entry = self.log_queue.get(timeout=1.0)
-                self._write_entry(entry)
-                self.log_queue.task_done()
+                while queue:
+                    self._write_entry(queue.popleft())
                 
-            except Empty:
-                continue
+                # One flush per drained batch instead of one per line
+                if self.file_handle:
+                    self.file_handle.flush()
+                    
             except Exception as e:
                 self.logger.error(f"Error in log worker: {e}")
     
-    def _write_entry(self, entry: TraceEntry):
-        """Write a single trace entry."""
+    def _write_entry(self, record: RawTraceRecord):
+        """Serialize and write a single raw trace record."""
         try:
             # Update statistics
+            vessel_mmsi, msg_type = record[2], record[3]
             self.stats['entries_logged'] += 1
-            self.stats['vessels'].add(entry.vessel_mmsi)
+            self.stats['vessels'].add(vessel_mmsi)
             
-            if entry.message_type:
-                msg_type = entry.message_type
-                if msg_type not in self.stats['message_types']:
-                    self.stats['message_types'][msg_type] = 0
-                self.stats['message_types'][msg_type] += 1
+            if msg_type:
+                message_types = self.stats['message_types']
+                message_types[msg_type] = message_types.get(msg_type, 0) + 1
             
-            # Convert to JSON
-            entry_dict = asdict(entry)
-            json_line = json.dumps(entry_dict, separators=(',', ':'))
+            # Build the TraceEntry-shaped dict directly, skipping asdict()'s deep copy
+            entry_dict = dict(zip(_TRACE_FIELDS, record))
+            entry_dict['timestamp'] = datetime.fromtimestamp(record[0]).isoformat()
+            json_line = _dumps(entry_dict)
             
             # Write to file
             if self.file_handle:
-                self.file_handle.write(json_line + '\n')
-                self.file_handle.flush()
+                self.file_handle.write(json_line + b'\n')
             
             # Write to console if enabled
             if self.enable_console:
-                print(f"TRACE: {json_line}")
+                print(f"TRACE: {json_line.decode('utf-8')}")
                 
         except Exception as e:
             self.logger.error(f"Error writing trace entry: {e}")
@@ -273,6 +246,8 @@ class TraceAnalyzer:
         """Initialize trace analyzer."""
         self.trace_file = trace_file
         self.entries: List[TraceEntry] = []
+        # MMSI -> that vessel's entries in file order, so per-vessel queries skip the full scan
+        self._entries_by_mmsi: Dict[int, List[TraceEntry]] = {}
         self._load_entries()
     
     def _load_entries(self):
@@ -286,12 +261,14 @@ class TraceAnalyzer:
                     data = json.loads(line.strip())
                     entry = TraceEntry(**data)
                     self.entries.append(entry)
+                    self._entries_by_mmsi.setdefault(entry.vessel_mmsi, []).append(entry)
                 except Exception as e:
                     print(f"Error parsing line {line_num}: {e}")
     
     def get_vessel_messages(self, vessel_mmsi: int) -> List[TraceEntry]:
         """Get all messages for a specific vessel."""
-        return [entry for entry in self.entries if entry.vessel_mmsi == vessel_mmsi]
+        # A copy, since callers such as get_vessel_timeline sort the result in place
+        return list(self._entries_by_mmsi.get(vessel_mmsi, ()))
     
     def get_message_type_stats(self) -> Dict[int, Dict[str, Any]]:
         """Get statistics by message type."""
@@ -0,0 +1,175 @@
+"""Structure-of-arrays kinematics for simulating many vessels at once."""
+
+import math
+import random
+from array import array
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Union
+
+from nmea_lib.types import Position, EARTH_RADIUS_M
+from nmea_lib.types.vessel import VesselState
+from nmea_lib.ais.constants import NavigationStatus
+
+
+KNOTS_TO_MS = 0.514444
+
+
+def _column(value: Union[float, Sequence[float]], count: int) -> array:
+    """Expand a scalar or per-vessel sequence into a float column."""
+    if isinstance(value, (int, float)):
+        return array('d', [value]) * count
+    column = array('d', value)
+    if len(column) != count:
+        raise ValueError(f"Expected {count} per-vessel values, got {len(column)}")
+    return column
+
+
+class VesselFleet:
+    """
+    Advances a group of vessels with linear movement in one batched step.
+
+    Kinematic state lives in parallel columns (lat, lon, sog, cog) instead of
+    one generator object per vessel, so a tick is a single loop over plain
+    floats. The VesselState objects are refreshed from the columns after
+    each step so sentence generators can keep reading them.
+    """
+
+    def __init__(self, vessels: List[VesselState], seed: int = 42,
+                 max_speed: Union[float, Sequence[float]] = 25.0,
+                 position_noise: Union[float, Sequence[float]] = 0.00001,
+                 course_change_interval: timedelta = timedelta(minutes=5)):
+        """
+        Initialize fleet columns from the given vessel states.
+        
+        max_speed and position_noise may be a single value for the whole
+        fleet or one value per vessel.
+        """
+        self.vessels = vessels
+        self.max_speed = _column(max_speed, len(vessels))
+        self.position_noise = _column(position_noise, len(vessels))
+        self.course_change_interval = course_change_interval
+        self.rng = random.Random(seed)
+
+        self.lat = array('d', (v.navigation_data.position.latitude for v in vessels))
+        self.lon = array('d', (v.navigation_data.position.longitude for v in vessels))
+        self.sog = array('d', (v.navigation_data.sog for v in vessels))
+        self.cog = array('d', (v.navigation_data.cog for v in vessels))
+        # Course only changes on the shared interval, so the bearing's sine/cosine
+        # are kept as columns and recomputed only when it does
+        self.sin_cog = array('d', (math.sin(math.radians(c)) for c in self.cog))
+        self.cos_cog = array('d', (math.cos(math.radians(c)) for c in self.cog))
+
+        # step() updates positions in place, so each vessel gets a Position it
+        # owns rather than one that may be shared with its config
+        for v in vessels:
+            nav = v.navigation_data
+            nav.position = Position(nav.position.latitude, nav.position.longitude)
+
+        self.last_course_change: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self.vessels)
+
+    def add(self, vessel: VesselState, max_speed: float = 25.0,
+            position_noise: float = 0.00001) -> None:
+        """
+        Append a vessel as a new row.
+
+        The random stream and course-change clock carry on unchanged, so
+        adding a vessel does not reset the vessels already in the fleet.
+        """
+        nav = vessel.navigation_data
+        nav.position = Position(nav.position.latitude, nav.position.longitude)
+        brg = math.radians(nav.cog)
+
+        self.vessels.append(vessel)
+        self.max_speed.append(max_speed)
+        self.position_noise.append(position_noise)
+        self.lat.append(nav.position.latitude)
+        self.lon.append(nav.position.longitude)
+        self.sog.append(nav.sog)
+        self.cog.append(nav.cog)
+        self.sin_cog.append(math.sin(brg))
+        self.cos_cog.append(math.cos(brg))
+
+    def remove(self, mmsi: int) -> bool:
+        """Drop the row for the given MMSI. Returns False if it is not in the fleet."""
+        for i, vessel in enumerate(self.vessels):
+            if vessel.mmsi == mmsi:
+                break
+        else:
+            return False
+
+        for column in (self.vessels, self.max_speed, self.position_noise, self.lat,
+                       self.lon, self.sog, self.cog, self.sin_cog, self.cos_cog):
+            del column[i]
+        return True
+
+    def step(self, elapsed_seconds: float, current_time: datetime) -> None:
+        """Advance every vessel by elapsed_seconds and refresh its VesselState."""
+        if self.last_course_change is None:
+            self.last_course_change = current_time
+        change_course = current_time - self.last_course_change > self.course_change_interval
+        if change_course:
+            self.last_course_change = current_time
+
+        # Hoist everything the loop touches into locals
+        lat, lon, sog, cog = self.lat, self.lon, self.sog, self.cog
+        sin_cog, cos_cog = self.sin_cog, self.cos_cog
+        uniform = self.rng.uniform
+        gauss = self.rng.gauss
+        noise = self.position_noise
+        max_speed = self.max_speed
+        sin, cos, asin, atan2 = math.sin, math.cos, math.asin, math.atan2
+        radians, degrees = math.radians, math.degrees
+        distance_factor = KNOTS_TO_MS * elapsed_seconds / EARTH_RADIUS_M
+        utc_second = current_time.second
+        wall_clock = datetime.now()
+
+        for i, vessel in enumerate(self.vessels):
+            # Speed random walk, course change on the shared interval
+            new_sog = min(max(0.0, sog[i] + uniform(-0.5, 0.5)), max_speed[i])
+            old_cog = cog[i]
+            if change_course:
+                new_cog = (old_cog + uniform(-10.0, 10.0)) % 360.0
+                brg = radians(new_cog)
+                sin_brg = sin_cog[i] = sin(brg)
+                cos_brg = cos_cog[i] = cos(brg)
+            else:
+                new_cog = old_cog
+                sin_brg, cos_brg = sin_cog[i], cos_cog[i]
+
+            # Great-circle dead reckoning
+            lat1 = radians(lat[i])
+            angular = new_sog * distance_factor
+            sin_lat1, cos_lat1 = sin(lat1), cos(lat1)
+            sin_ang, cos_ang = sin(angular), cos(angular)
+            lat2 = asin(sin_lat1 * cos_ang + cos_lat1 * sin_ang * cos_brg)
+            lon2 = radians(lon[i]) + atan2(sin_brg * sin_ang * cos_lat1,
+                                           cos_ang - sin_lat1 * sin(lat2))
+
+            # GPS noise, clamped to valid ranges
+            sigma = noise[i]
+            new_lat = max(-90.0, min(90.0, degrees(lat2) + gauss(0, sigma)))
+            new_lon = max(-180.0, min(180.0, degrees(lon2) + gauss(0, sigma)))
+
+            lat[i], lon[i], sog[i], cog[i] = new_lat, new_lon, new_sog, new_cog
+
+            # Materialize into the vessel state read by the sentence generators
+            nav = vessel.navigation_data
+            position = nav.position
+            position.latitude = new_lat
+            position.longitude = new_lon
+            nav.sog = new_sog
+            nav.cog = new_cog
+            nav.heading = int(new_cog) % 360
+            nav.timestamp = utc_second
+            if elapsed_seconds > 0:
+                course_diff = (new_cog - old_cog + 180.0) % 360.0 - 180.0
+                nav.rot = int(round(course_diff / elapsed_seconds * 60.0))
+            else:
+                nav.rot = 0
+            nav.nav_status = (NavigationStatus.AT_ANCHOR if new_sog < 0.1
+                              else NavigationStatus.UNDER_WAY_USING_ENGINE)
+            vessel.timestamp_sim = current_time
+            vessel.last_update = wall_clock
@@ -1,12 +1,12 @@
 """Position generation for NMEA simulation."""
 
-import math
 import random
-from datetime import datetime
+from array import array
+from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from nmea_lib.types import Position, Speed, Bearing, SpeedUnit, BearingType
+from nmea_lib.types import Position, Speed, Bearing, SpeedUnit, BearingType, destination_point
 
 
 @dataclass
@@ -22,6 +22,40 @@ class PositionState:
         return f"PositionState({self.position}, {self.speed.value:.1f}kts, {self.heading.value:.1f}°)"
 
 
+@dataclass
+class PositionTrack:
+    """
+    Trajectory stored column-wise, one float array per field.
+    
+    Entry i is the state after update i + 1, at start_time + (i + 1) * step.
+    Code that walks long traces reads the numbers directly instead of going
+    through PositionState/Position/Speed/Bearing objects for every step.
+    """
+    
+    start_time: datetime
+    step: timedelta
+    latitude: array = field(default_factory=lambda: array('d'))
+    longitude: array = field(default_factory=lambda: array('d'))
+    speed: array = field(default_factory=lambda: array('d'))    # knots
+    heading: array = field(default_factory=lambda: array('d'))  # degrees true
+    
+    def __len__(self) -> int:
+        return len(self.latitude)
+    
+    def timestamp(self, index: int) -> datetime:
+        """Simulation time of entry index."""
+        return self.start_time + self.step * (index + 1)
+    
+    def state(self, index: int) -> PositionState:
+        """Build a PositionState for entry index."""
+        return PositionState(
+            position=Position(self.latitude[index], self.longitude[index]),
+            speed=Speed(self.speed[index], SpeedUnit.KNOTS),
+            heading=Bearing(self.heading[index], BearingType.TRUE),
+            timestamp=self.timestamp(index)
+        )
+
+
 class PositionGenerator:
     """Generates realistic GPS position data."""
     
@@ -106,6 +140,100 @@ class PositionGenerator:
         
         return state
     
+    def update_positions_batch(self, steps: int, elapsed_seconds: float,
+                               start_time: datetime) -> List[PositionState]:
+        """
+        Run several position updates in one call.
+        
+        Equivalent to calling update_position() steps times with timestamps
+        start_time + elapsed_seconds, start_time + 2 * elapsed_seconds, ...
+        (same random draws, same results), but speed, heading and position
+        are advanced as plain floats and objects are only built for the
+        returned states.
+        
+        Args:
+            steps: Number of updates to run
+            elapsed_seconds: Time between consecutive updates
+            start_time: Simulation time before the first update
+            
+        Returns:
+            Position state after each update
+        """
+        track = self.update_positions_track(steps, elapsed_seconds, start_time)
+        states = [track.state(i) for i in range(len(track))]
+        
+        # Same history limit as update_position
+        history = self.position_history
+        for state in states:
+            history.append(state)
+            if len(history) > 1000:
+                history = history[-500:]
+        self.position_history = history
+        
+        if states:
+            last = states[-1]
+            self.current_position = last.position
+            self.current_speed = last.speed
+            self.current_heading = last.heading
+        
+        return states
+    
+    def update_positions_track(self, steps: int, elapsed_seconds: float,
+                               start_time: datetime) -> PositionTrack:
+        """
+        Run several position updates and return them as a PositionTrack.
+        
+        Draws the same random numbers and produces the same values as
+        update_positions_batch(), but keeps them in float arrays and builds
+        no per-step objects. The generator's current position, speed and
+        heading are advanced; the steps are not added to position_history.
+        
+        Args:
+            steps: Number of updates to run
+            elapsed_seconds: Time between consecutive updates
+            start_time: Simulation time before the first update
+        """
+        gauss = self.random.gauss
+        speed_sigma = self.speed_variation / 3 if self.speed_variation > 0 else 0.0
+        course_sigma = self.course_variation / 3 if self.course_variation > 0 else 0.0
+        noise = self.position_noise
+        
+        speed = self.current_speed.to_knots()
+        heading = self.current_heading.value
+        lat, lon = self.current_position.latitude, self.current_position.longitude
+        
+        track = PositionTrack(start_time, timedelta(seconds=elapsed_seconds))
+        lats, lons, speeds, headings = track.latitude, track.longitude, track.speed, track.heading
+        
+        for _ in range(steps):
+            # Same variation as _apply_movement_variation
+            if speed_sigma:
+                speed = max(0, speed + gauss(0, speed_sigma) * 0.1)
+            if course_sigma:
+                heading = (heading + gauss(0, course_sigma) * 0.1) % 360
+            
+            # Same dead reckoning as Position.move_by_bearing_distance, on plain floats
+            distance_m = speed * 0.514444 * elapsed_seconds
+            if distance_m > 0:
+                lat, lon = destination_point(lat, lon, heading, distance_m)
+                
+                # Same noise and clamping as _add_gps_noise
+                if noise > 0:
+                    lat = max(-90, min(90, lat + gauss(0, noise)))
+                    lon = max(-180, min(180, lon + gauss(0, noise)))
+            
+            lats.append(lat)
+            lons.append(lon)
+            speeds.append(speed)
+            headings.append(heading)
+        
+        if steps > 0:
+            self.current_position = Position(lat, lon)
+            self.current_speed = Speed(speed, SpeedUnit.KNOTS)
+            self.current_heading = Bearing(heading, BearingType.TRUE)
+        
+        return track
+    
     def _apply_movement_variation(self) -> None:
         """Apply realistic variations to speed and heading."""
         # Speed variation
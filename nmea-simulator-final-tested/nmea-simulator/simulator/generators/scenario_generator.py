@@ -8,6 +8,7 @@ from pathlib import Path
 from dataclasses import dataclass, asdict
 import random
 
+from nmea_lib import GpsFixQuality
 from nmea_lib.types import Position, create_vessel_state
 from nmea_lib.types.vessel import VesselState, VesselClass, ShipType, NavigationStatus
 from nmea_lib.sentences.aivdm import AISMessageGenerator
@@ -16,7 +17,46 @@ from nmea_lib.sentences.rmc import RMCSentence
 from nmea_lib.types import NMEATime, NMEADate
 from nmea_lib.types.units import Distance, DistanceUnit, Speed, SpeedUnit, Bearing, BearingType
 from nmea_lib.types.enums import DataStatus
-from simulator.generators.vessel import EnhancedVesselGenerator
+from simulator.generators.fleet import VesselFleet
+from simulator.utils.json_io import write_json
+
+
+# Human-readable record templates, filled with str.format on plain values
+_GGA_TEMPLATE = (
+    "GPS Fix Data - Vessel {mmsi} ({name})\n"
+    "  Position: {lat:.6f}, {lon:.6f}\n"
+    "  Sentence: {sentence}\n"
+)
+_RMC_TEMPLATE = (
+    "GPS Recommended Minimum - Vessel {mmsi}\n"
+    "  Speed: {sog:.1f} knots, Course: {cog:.1f}°\n"
+    "  Sentence: {sentence}\n"
+)
+_AIS_HEADER_TEMPLATE = "AIS Type {msg_type} - Vessel {mmsi} ({name})\n"
+_CLASS_A_POSITION_TEMPLATE = (
+    "  Position Report Class A\n"
+    "  Position: {lat:.6f}, {lon:.6f}\n"
+    "  Speed: {sog:.1f} knots, Course: {cog:.1f}°\n"
+    "  Heading: {heading}°\n"
+)
+_AIS_BODY_TEMPLATES = {
+    1: _CLASS_A_POSITION_TEMPLATE,
+    2: _CLASS_A_POSITION_TEMPLATE,
+    3: _CLASS_A_POSITION_TEMPLATE,
+    4: "  Base Station Report\n",
+    5: (
+        "  Static and Voyage Data\n"
+        "  Call Sign: {callsign}\n"
+        "  Destination: {destination}\n"
+        "  Draught: {draught:.1f}m\n"
+    ),
+    18: (
+        "  Position Report Class B\n"
+        "  Position: {lat:.6f}, {lon:.6f}\n"
+        "  Speed: {sog:.1f} knots\n"
+    ),
+    24: "  Static Data Report Class B\n",
+}
 
 
 @dataclass
@@ -90,7 +130,7 @@ class CompleteScenarioGenerator:
         self.config = config
         self.ais_generator = AISMessageGenerator()
         self.vessels: List[VesselState] = []
-        self.vessel_generators: Dict[int, EnhancedVesselGenerator] = {}
+        self.fleet: Optional[VesselFleet] = None
         self.reference_data: List[MessageReference] = []
         self.message_count = 0
         
@@ -152,23 +192,9 @@ class CompleteScenarioGenerator:
                 vessel.voyage_data.eta_minute = random.randint(0, 59)
             
             self.vessels.append(vessel)
-            
-            # Create vessel generator for movement
-            vessel_config = {
-                'mmsi': mmsi,
-                'name': vessel.static_data.vessel_name,
-                'initial_position': {'latitude': lat, 'longitude': lon},
-                'initial_speed': vessel.navigation_data.sog,
-                'initial_heading': vessel.navigation_data.heading,
-                'movement': {
-                    'pattern': 'linear',
-                    'speed_variation': 2.0,
-                    'course_variation': 5.0
-                }
-            }
-            
-            generator = EnhancedVesselGenerator(vessel_config)
-            self.vessel_generators[mmsi] = generator
+        
+        # Kinematic state for all vessels is advanced together
+        self.fleet = VesselFleet(self.vessels)
     
     def generate_scenario(self) -> Dict[str, str]:
         """Generate complete scenario with all output files."""
@@ -184,60 +210,65 @@ class CompleteScenarioGenerator:
              open(human_readable_path, 'w') as human_file:
             
             # Write headers
-            human_file.write("NMEA 0183 Scenario Generation - Human Readable Output\\n")
-            human_file.write("=" * 80 + "\\n")
-            human_file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\\n")
-            human_file.write(f"Scenario duration: {self.config.duration_minutes} minutes\\n")
-            human_file.write(f"Vessels: {self.config.vessel_count}\\n")
-            human_file.write("=" * 80 + "\\n\\n")
+            human_file.write("NMEA 0183 Scenario Generation - Human Readable Output\n")
+            human_file.write("=" * 80 + "\n")
+            human_file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            human_file.write(f"Scenario duration: {self.config.duration_minutes} minutes\n")
+            human_file.write(f"Vessels: {self.config.vessel_count}\n")
+            human_file.write("=" * 80 + "\n\n")
             
-            # Generate time series
-            current_time = self.config.start_time
-            end_time = current_time + timedelta(minutes=self.config.duration_minutes)
+            # Generate time series. Cadence is tracked as integer microseconds
+            # since start; a datetime is only built once per step for output.
+            start_time = self.config.start_time
+            current_time = start_time
+            step_us = round(self.config.time_step_seconds * 1_000_000)
+            end_us = self.config.duration_minutes * 60 * 1_000_000
+            gps_interval_us = self.config.gps_interval_seconds * 1_000_000
+            ais_intervals_us = [(msg_type, interval * 1_000_000)
+                                for msg_type, interval in self.config.ais_intervals.items()]
             
             # Track last message times for each vessel and message type
-            last_message_times: Dict[Tuple[int, int], datetime] = {}
-            last_gps_time = current_time
+            last_message_us: Dict[Tuple[int, int], int] = {}
+            last_gps_us = 0
             
+            elapsed_us = 0
             step_count = 0
-            while current_time < end_time:
+            while elapsed_us < end_us:
                 step_count += 1
                 
                 # Update vessel positions
                 self._update_vessel_positions(current_time)
                 
                 # Generate GPS messages
-                if self.config.include_gps and \
-                   (current_time - last_gps_time).total_seconds() >= self.config.gps_interval_seconds:
+                if self.config.include_gps and elapsed_us - last_gps_us >= gps_interval_us:
                     
                     for vessel in self.vessels:
                         gps_sentences = self._generate_gps_sentences(vessel, current_time)
                         for sentence in gps_sentences:
-                            nmea_file.write(sentence + "\\n")
+                            nmea_file.writelines((sentence, "\n"))
                             self._add_reference_data(sentence, 'GPS', current_time, vessel.mmsi)
                             self._write_human_readable(human_file, sentence, 'GPS', current_time, vessel)
                     
-                    last_gps_time = current_time
+                    last_gps_us = elapsed_us
                 
                 # Generate AIS messages
                 if self.config.include_ais:
                     for vessel in self.vessels:
-                        for msg_type, interval in self.config.ais_intervals.items():
+                        for msg_type, interval_us in ais_intervals_us:
                             key = (vessel.mmsi, msg_type)
                             
-                            if key not in last_message_times:
-                                last_message_times[key] = current_time
+                            if key not in last_message_us:
+                                last_message_us[key] = elapsed_us
                                 should_send = True
                             else:
-                                time_since_last = (current_time - last_message_times[key]).total_seconds()
-                                should_send = time_since_last >= interval
+                                should_send = elapsed_us - last_message_us[key] >= interval_us
                             
                             if should_send:
                                 try:
                                     sentences, input_data = self.ais_generator.generate_message(msg_type, vessel)
                                     
                                     for sentence in sentences:
-                                        nmea_file.write(sentence + "\\n")
+                                        nmea_file.writelines((sentence, "\n"))
                                         self._add_reference_data(
                                             sentence, 'AIS', current_time, vessel.mmsi, 
                                             msg_type, input_data
@@ -247,18 +278,19 @@ class CompleteScenarioGenerator:
                                             msg_type, input_data
                                         )
                                     
-                                    last_message_times[key] = current_time
+                                    last_message_us[key] = elapsed_us
                                     
                                 except Exception as e:
                                     print(f"Error generating AIS type {msg_type} for vessel {vessel.mmsi}: {e}")
                 
                 # Progress indicator
                 if step_count % 100 == 0:
-                    progress = (current_time - self.config.start_time).total_seconds() / (self.config.duration_minutes * 60) * 100
+                    progress = elapsed_us / end_us * 100
                     print(f"Progress: {progress:.1f}% - Generated {self.message_count} messages")
                 
                 # Advance time
-                current_time += timedelta(seconds=self.config.time_step_seconds)
+                elapsed_us += step_us
+                current_time = start_time + timedelta(microseconds=elapsed_us)
         
         # Save reference data and summary
         self._save_reference_data()
@@ -273,17 +305,8 @@ class CompleteScenarioGenerator:
         }
     
     def _update_vessel_positions(self, current_time: datetime):
-        """Update vessel positions using generators."""
-        for vessel in self.vessels:
-            if vessel.mmsi in self.vessel_generators:
-                generator = self.vessel_generators[vessel.mmsi]
-                updated_state = generator.update_vessel_state(
-                    self.config.time_step_seconds, current_time
-                )
-                
-                # Update vessel state
-                vessel.navigation_data = updated_state.navigation_data
-                vessel.timestamp = current_time
+        """Advance all vessel positions in one batched fleet step."""
+        self.fleet.step(self.config.time_step_seconds, current_time)
     
     def _generate_gps_sentences(self, vessel: VesselState, current_time: datetime) -> List[str]:
         """Generate GPS sentences for a vessel."""
@@ -294,12 +317,12 @@ class CompleteScenarioGenerator:
         gga = GGASentence()
         gga.set_time(NMEATime.from_datetime(current_time))
         gga.set_position(nav.position.latitude, nav.position.longitude)
-        gga.set_fix_quality(1)  # GPS fix
+        gga.set_fix_quality(GpsFixQuality.GPS)
         gga.set_satellites_in_use(8)
         gga.set_horizontal_dilution(1.2)
         gga.set_altitude(Distance(0.0, DistanceUnit.METERS))
         gga.set_geoidal_height(Distance(19.6, DistanceUnit.METERS))
-        sentences.append(str(gga))
+        sentences.append(gga.to_sentence().rstrip("\r\n"))
         
         # RMC sentence
         rmc = RMCSentence()
@@ -308,9 +331,9 @@ class CompleteScenarioGenerator:
         rmc.set_position(nav.position.latitude, nav.position.longitude)
         rmc.set_speed(Speed(nav.sog, SpeedUnit.KNOTS))
         rmc.set_course(Bearing(nav.cog, BearingType.TRUE))
-        rmc.set_date(NMEADate.from_datetime(current_time))
+        rmc.set_date(NMEADate.from_date(current_time.date()))
         rmc.set_magnetic_variation(0.0)  # East variation is positive or zero
-        sentences.append(str(rmc))
+        sentences.append(rmc.to_sentence().rstrip("\r\n"))
         
         return sentences
     
@@ -350,47 +373,39 @@ class CompleteScenarioGenerator:
                              vessel: VesselState, ais_msg_type: Optional[int] = None,
                              input_data: Optional[Dict[str, Any]] = None):
         """Write human-readable explanation of the message."""
-        
-        file.write(f"[{timestamp.strftime('%H:%M:%S')}] ")
+        nav = vessel.navigation_data
+        parts = ["[%02d:%02d:%02d] " % (timestamp.hour, timestamp.minute, timestamp.second)]
         
         if msg_type == 'GPS':
             if sentence.startswith('$GPGGA'):
-                file.write(f"GPS Fix Data - Vessel {vessel.mmsi} ({vessel.static_data.vessel_name})\\n")
-                file.write(f"  Position: {vessel.navigation_data.position.latitude:.6f}, {vessel.navigation_data.position.longitude:.6f}\\n")
-                file.write(f"  Sentence: {sentence}\\n")
+                parts.append(_GGA_TEMPLATE.format(
+                    mmsi=vessel.mmsi, name=vessel.static_data.vessel_name,
+                    lat=nav.position.latitude, lon=nav.position.longitude,
+                    sentence=sentence))
             elif sentence.startswith('$GPRMC'):
-                file.write(f"GPS Recommended Minimum - Vessel {vessel.mmsi}\\n")
-                file.write(f"  Speed: {vessel.navigation_data.sog:.1f} knots, Course: {vessel.navigation_data.cog:.1f}°\\n")
-                file.write(f"  Sentence: {sentence}\\n")
+                parts.append(_RMC_TEMPLATE.format(
+                    mmsi=vessel.mmsi, sog=nav.sog, cog=nav.cog, sentence=sentence))
         
         elif msg_type == 'AIS':
-            file.write(f"AIS Type {ais_msg_type} - Vessel {vessel.mmsi} ({vessel.static_data.vessel_name})\\n")
+            parts.append(_AIS_HEADER_TEMPLATE.format(
+                msg_type=ais_msg_type, mmsi=vessel.mmsi, name=vessel.static_data.vessel_name))
             
-            if ais_msg_type in [1, 2, 3]:
-                file.write(f"  Position Report Class A\\n")
-                file.write(f"  Position: {vessel.navigation_data.position.latitude:.6f}, {vessel.navigation_data.position.longitude:.6f}\\n")
-                file.write(f"  Speed: {vessel.navigation_data.sog:.1f} knots, Course: {vessel.navigation_data.cog:.1f}°\\n")
-                file.write(f"  Heading: {vessel.navigation_data.heading}°\\n")
-            elif ais_msg_type == 4:
-                file.write(f"  Base Station Report\\n")
-            elif ais_msg_type == 5:
-                file.write(f"  Static and Voyage Data\\n")
-                file.write(f"  Call Sign: {vessel.static_data.callsign}\\n")
-                file.write(f"  Destination: {vessel.voyage_data.destination}\\n")
-                file.write(f"  Draught: {vessel.voyage_data.draught:.1f}m\\n")
-            elif ais_msg_type == 18:
-                file.write(f"  Position Report Class B\\n")
-                file.write(f"  Position: {vessel.navigation_data.position.latitude:.6f}, {vessel.navigation_data.position.longitude:.6f}\\n")
-                file.write(f"  Speed: {vessel.navigation_data.sog:.1f} knots\\n")
-            elif ais_msg_type == 24:
-                file.write(f"  Static Data Report Class B\\n")
+            body = _AIS_BODY_TEMPLATES.get(ais_msg_type)
+            if body is not None:
+                parts.append(body.format(
+                    lat=nav.position.latitude, lon=nav.position.longitude,
+                    sog=nav.sog, cog=nav.cog, heading=nav.heading,
+                    callsign=vessel.static_data.callsign,
+                    destination=vessel.voyage_data.destination,
+                    draught=vessel.voyage_data.draught))
             
-            file.write(f"  Sentence: {sentence}\\n")
+            parts.append(f"  Sentence: {sentence}\n")
             
             if input_data:
-                file.write(f"  Input Data: {json.dumps(input_data, indent=4)}\\n")
+                parts.append(f"  Input Data: {json.dumps(input_data, indent=4)}\n")
         
-        file.write("\\n")
+        parts.append("\n")
+        file.write("".join(parts))
     
     def _save_reference_data(self):
         """Save reference data to JSON file."""
@@ -432,8 +447,7 @@ class CompleteScenarioGenerator:
                     data['statistics']['message_types'][msg_type] = 0
                 data['statistics']['message_types'][msg_type] += 1
         
-        with open(reference_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json(reference_path, data, indent=True)
         
         print(f"Reference data saved to: {reference_path}")
     
@@ -508,7 +522,7 @@ if __name__ == "__main__":
     
     files = generate_complete_scenario(config)
     
-    print("\\nGenerated files:")
+    print("\nGenerated files:")
     for file_type, file_path in files.items():
         print(f"  {file_type}: {file_path}")
 
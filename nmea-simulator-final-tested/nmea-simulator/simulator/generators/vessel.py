@@ -50,6 +50,7 @@ class EnhancedVesselGenerator:
         # Navigation state tracking
         self.last_course_change = datetime.now()
         self.course_change_interval = timedelta(minutes=5)  # Change course every 5 minutes
+        self.max_speed = vessel_config.get('max_speed', 25.0)
         
     def _create_initial_vessel_state(self) -> VesselState:
         """Create initial vessel state from configuration."""
@@ -170,14 +171,12 @@ class EnhancedVesselGenerator:
         """Apply realistic movement variations."""
         nav = self.vessel_state.navigation_data
         previous_cog_for_rot = nav.cog  # Store current COG before it's potentially changed
-        previous_sog = nav.sog
 
         # Speed variation: random walk around current SOG
-        # Allow SOG to change by up to 0.5 knots per update_interval
-        sog_change = self.rng.uniform(-0.5, 0.5)
-        nav.sog = max(0, previous_sog + sog_change)
-        # Simple cap for realism, can be configurable later
-        nav.sog = min(nav.sog, self.vessel_config.get('max_speed', 25.0))
+        # Allow SOG to change by up to 0.5 knots per update_interval,
+        # capped at the configured max_speed
+        sog = min(max(0, nav.sog + self.rng.uniform(-0.5, 0.5)), self.max_speed)
+        nav.sog = sog
 
         # Course variation: random walk around current COG
         # Allow COG to change by up to 5 degrees per update_interval
@@ -207,10 +206,8 @@ class EnhancedVesselGenerator:
             nav.rot = 0 # No time elapsed, no turn
 
         # Update navigation status based on speed
-        if nav.sog < 0.1:
+        if sog < 0.1:
             nav.nav_status = NavigationStatus.AT_ANCHOR
-        elif nav.sog > 23.0:  # High speed
-            nav.nav_status = NavigationStatus.UNDER_WAY_USING_ENGINE
         else:
             nav.nav_status = NavigationStatus.UNDER_WAY_USING_ENGINE
     
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class OutputHandler(ABC):
@@ -38,6 +38,18 @@ class OutputHandler(ABC):
         """
         pass
     
+    def send_sentences(self, sentences: List[str]) -> int:
+        """
+        Send several NMEA sentences.
+        
+        Handlers that can batch writes override this; the default sends
+        them one at a time.
+        
+        Returns:
+            Number of sentences sent successfully
+        """
+        return sum(1 for sentence in sentences if self.send_sentence(sentence))
+    
     def get_status(self) -> Dict[str, Any]:
         """Get output handler status information."""
         now = datetime.now()
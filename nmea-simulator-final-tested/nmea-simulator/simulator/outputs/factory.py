@@ -1,14 +1,25 @@
 """Factory for creating output handlers from configuration."""
 
-from typing import List
+from typing import Dict, List, Type
 from .base import OutputHandler
 from .file import FileOutput
 from .tcp import TCPOutput
 from .udp import UDPOutput
-from .serial import SerialOutput, SerialOutputConfig # Added SerialOutput
+from .serial import SerialOutput
 from ..config.parser import OutputConfig
 
 
+# Output type -> handler class, resolved once at import time. The config
+# object in OutputConfig.config is expected to already be the matching
+# *OutputConfig instance (see ConfigParser._parse_output_config).
+_HANDLER_CLASSES: Dict[str, Type[OutputHandler]] = {
+    'file': FileOutput,
+    'tcp': TCPOutput,
+    'udp': UDPOutput,
+    'serial': SerialOutput,
+}
+
+
 class OutputFactory:
     """Factory for creating output handlers."""
     
@@ -18,30 +29,11 @@ class OutputFactory:
         if not output_config.enabled:
             raise ValueError("Output handler is disabled")
         
-        if output_config.type == 'file':
-            return FileOutput(output_config.config)
-        elif output_config.type == 'tcp':
-            return TCPOutput(output_config.config)
-        elif output_config.type == 'udp':
-            return UDPOutput(output_config.config)
-        elif output_config.type == 'serial': # Added serial output type
-            # Assuming config is already a SerialOutputConfig instance
-            # If not, you might need to parse it here or ensure it's correctly passed
-            if not isinstance(output_config.config, SerialOutputConfig):
-                 # This is a basic way to handle it; you might need a more robust conversion
-                 # depending on how output_config.config is structured.
-                 # For now, assuming it's directly compatible or already the correct type.
-                 # If it's a dict, you would do: SerialOutputConfig(**output_config.config)
-                 # However, the structure of OutputConfig suggests output_config.config
-                 # is already the specific config object (e.g. TCPOutputConfig, UDPOutputConfig)
-                 # So, we expect it to be SerialOutputConfig for type 'serial'.
-                 # This check is more of a safeguard.
-                 # A better approach would be to ensure the config parsing upstream
-                 # correctly instantiates SerialOutputConfig when type is 'serial'.
-                pass # Placeholder for potential config conversion if needed
-            return SerialOutput(output_config.config)
-        else:
+        handler_class = _HANDLER_CLASSES.get(output_config.type)
+        if handler_class is None:
             raise ValueError(f"Unknown output type: {output_config.type}")
+        
+        return handler_class(output_config.config)
     
     @staticmethod
     def create_output_handlers(output_configs: List[OutputConfig]) -> List[OutputHandler]:
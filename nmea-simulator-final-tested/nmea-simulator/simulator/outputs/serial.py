@@ -16,7 +16,7 @@ class SerialOutputConfig:
 
 import serial
 from .base import OutputHandler
-from typing import Optional
+from typing import List, Optional
 
 class SerialOutput(OutputHandler):
     """Serial output handler for NMEA sentences."""
@@ -65,15 +65,35 @@ class SerialOutput(OutputHandler):
 
     def send_sentence(self, sentence: str) -> bool:
         """Send NMEA sentence via serial port."""
+        # NMEA sentences should end with \r\n
+        if not sentence.endswith('\r\n'):
+            sentence += '\r\n'
+        return self.send_bytes(sentence.encode('utf-8'))
+
+    def send_sentences(self, sentences: List[str]) -> int:
+        """Send several NMEA sentences in a single serial write."""
+        if not sentences:
+            return 0
+        data = ''.join(s if s.endswith('\r\n') else s + '\r\n' for s in sentences)
+        return len(sentences) if self.send_bytes(data.encode('utf-8'), len(sentences)) else 0
+
+    def send_bytes(self, data: bytes, sentence_count: int = 1) -> bool:
+        """
+        Send already encoded NMEA data via serial port.
+
+        Callers that build sentences as bytes skip the str round-trip;
+        a missing \r\n terminator is still added. data may hold several
+        CRLF-terminated sentences written at once; sentence_count is how
+        many, for the statistics.
+        """
         if not self.is_running or not self.serial_port or not self.serial_port.is_open:
             return False
 
         try:
-            # NMEA sentences should end with \r\n
-            if not sentence.endswith('\r\n'):
-                sentence += '\r\n'
-            self.serial_port.write(sentence.encode('utf-8'))
-            self.sentences_sent += 1
+            if not data.endswith(b'\r\n'):
+                data += b'\r\n'
+            self.serial_port.write(data)
+            self.sentences_sent += sentence_count
             return True
         except serial.SerialTimeoutException:
             print(f"Serial write timeout on {self.config.port}")
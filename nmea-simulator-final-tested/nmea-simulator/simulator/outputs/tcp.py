@@ -18,6 +18,8 @@ class TCPOutputConfig:
     max_clients: int = 10
     client_timeout: float = 30.0  # seconds
     send_timeout: float = 5.0  # seconds
+    no_delay: bool = True  # Disable Nagle so each sentence goes out immediately
+    send_buffer_size: int = 1 << 20  # SO_SNDBUF for client sockets, sized for bursts
 
 
 class TCPClient:
@@ -181,6 +183,8 @@ class TCPOutput(OutputHandler):
                             client_socket.close()
                             continue
                         
+                        self._configure_client_socket(client_socket)
+                        
                         # Add new client
                         client = TCPClient(client_socket, client_address)
                         self.clients.append(client)
@@ -197,6 +201,17 @@ class TCPOutput(OutputHandler):
                     print(f"TCP server error: {e}")
                 time.sleep(1)
     
+    def _configure_client_socket(self, client_socket: socket.socket) -> None:
+        """Apply latency and buffer options to a newly accepted client socket."""
+        try:
+            if self.config.no_delay:
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.config.send_buffer_size:
+                client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF,
+                                         self.config.send_buffer_size)
+        except OSError:
+            pass  # Options are best effort; the connection still works without them
+    
     def _client_manager_loop(self) -> None:
         """Client management loop for cleanup."""
         while self.is_running and not self.stop_event.is_set():
@@ -17,6 +17,8 @@ class UDPOutputConfig:
     multicast_group: Optional[str] = None  # e.g., "224.0.0.1"
     multicast_ttl: int = 1
     send_timeout: float = 1.0  # seconds
+    max_datagram_size: int = 1472  # Ethernet MTU minus IP/UDP headers
+    send_buffer_size: int = 1 << 20  # SO_SNDBUF, sized for bursts at high sentence rates
 
 
 class UDPOutput(OutputHandler):
@@ -45,6 +47,13 @@ class UDPOutput(OutputHandler):
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.settimeout(self.config.send_timeout)
             
+            if self.config.send_buffer_size:
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF,
+                                           self.config.send_buffer_size)
+                except OSError:
+                    pass  # Best effort; the kernel caps the value at net.core.wmem_max
+            
             # Configure socket for broadcast/multicast
             if self.config.broadcast and not self.config.multicast_group:
                 self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
@@ -109,6 +118,51 @@ class UDPOutput(OutputHandler):
             print(f"UDP output error: {e}")
             return False
     
+    def send_sentences(self, sentences: List[str]) -> int:
+        """
+        Send several NMEA sentences, packing as many as fit into each datagram.
+        
+        Sentences are joined with CRLF terminators up to max_datagram_size so a
+        burst costs one sendto per datagram instead of one per sentence.
+        
+        Returns:
+            Number of sentences delivered to at least one target
+        """
+        if not self.is_running or not self.socket:
+            return 0
+        
+        limit = self.config.max_datagram_size
+        delivered = 0
+        batch: List[bytes] = []
+        batch_size = 0
+        
+        for sentence in sentences:
+            data = sentence.encode('utf-8')
+            if not data.endswith(b'\r\n'):
+                data += b'\r\n'
+            if batch and batch_size + len(data) > limit:
+                delivered += self._send_datagram(b''.join(batch), len(batch))
+                batch, batch_size = [], 0
+            batch.append(data)
+            batch_size += len(data)
+        
+        if batch:
+            delivered += self._send_datagram(b''.join(batch), len(batch))
+        
+        self.sentences_sent += delivered
+        return delivered
+    
+    def _send_datagram(self, datagram: bytes, sentence_count: int) -> int:
+        """Send one datagram to every target; returns sentence_count if any target got it."""
+        sent = False
+        for address in self.target_addresses:
+            try:
+                self.socket.sendto(datagram, address)
+                sent = True
+            except socket.error as e:
+                print(f"UDP send error to {address}: {e}")
+        return sentence_count if sent else 0
+    
     def add_target(self, host: str, port: int) -> None:
         """Add additional UDP target."""
         target = (host, port)
@@ -0,0 +1,49 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Non-string dict keys are converted to strings and unknown types are
+    written via str(), matching what the stdlib fallback does.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = False) -> None:
+    """Serialize obj and write it to path in one call."""
+    Path(path).write_bytes(dumps(obj, indent=indent))
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and deserialize a JSON file without text-mode decoding."""
+    return loads(Path(path).read_bytes())
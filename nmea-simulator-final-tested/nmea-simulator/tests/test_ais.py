@@ -0,0 +1,139 @@
+"""Unit tests for AIS encoding and AIVDM validation."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nmea_lib.types import Position
+from nmea_lib.types.vessel import create_vessel_state, VesselDimensions, VesselETA
+from nmea_lib.ais.constants import NavigationStatus, ShipType, EPFDType
+from nmea_lib.ais.encoder import BitBuffer, AIS6BitEncoder
+from nmea_lib.sentences.aivdm import AISMessageGenerator, validate_aivdm_sentence
+
+
+# Reference Type 1 report (MMSI 477553000) as published with common AIS decoders
+TYPE_1_SENTENCE = "!AIVDM,1,1,,B,177KQJ5000G?tO`K>RA1wUbN0TKH,0*5C"
+
+# Reference Type 5 payload (MMSI 351759000, "EVER DIADEM"), both fragments joined
+TYPE_5_PAYLOAD = (
+    "55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8"
+    "88888888880"
+)
+
+
+class TestValidateAivdmSentence(unittest.TestCase):
+    """Test AIVDM sentence validation."""
+
+    def test_valid_sentence(self):
+        """Test validation of a valid single-part sentence."""
+        self.assertTrue(validate_aivdm_sentence(TYPE_1_SENTENCE))
+
+    def test_wrong_checksum(self):
+        """Test validation with a wrong checksum."""
+        self.assertFalse(validate_aivdm_sentence(TYPE_1_SENTENCE[:-2] + "5D"))
+
+    def test_missing_checksum_delimiter(self):
+        """Test validation without the '*' delimiter."""
+        self.assertFalse(validate_aivdm_sentence(TYPE_1_SENTENCE.replace("*", "")))
+
+    def test_bytes_input(self):
+        """Test validation of raw bytes."""
+        self.assertTrue(validate_aivdm_sentence(TYPE_1_SENTENCE.encode("ascii")))
+        self.assertTrue(validate_aivdm_sentence(bytearray(TYPE_1_SENTENCE, "ascii")))
+
+    def test_crlf_terminated(self):
+        """Test validation of a CRLF-terminated sentence."""
+        self.assertTrue(validate_aivdm_sentence(TYPE_1_SENTENCE + "\r\n"))
+        self.assertTrue(validate_aivdm_sentence((TYPE_1_SENTENCE + "\r\n").encode("ascii")))
+
+    def test_bad_channel(self):
+        """Test validation with an unknown radio channel."""
+        self.assertFalse(validate_aivdm_sentence(TYPE_1_SENTENCE.replace(",B,", ",C,")))
+
+    def test_bad_fill_bits(self):
+        """Test validation with an out-of-range fill bit count."""
+        self.assertFalse(validate_aivdm_sentence(TYPE_1_SENTENCE.replace(",0*", ",6*")))
+
+
+class TestBitBuffer(unittest.TestCase):
+    """Test fixed-width field accumulation."""
+
+    def test_push_and_to_binary(self):
+        """Test fields are packed MSB first at their widths."""
+        bits = BitBuffer()
+        bits.push(1, 6)
+        bits.push(3, 2)
+        bits.push(5, 4)
+        self.assertEqual(bits.to_binary(), "000001110101")
+        self.assertEqual(len(bits), 12)
+
+    def test_negative_values_wrap(self):
+        """Test negative values are stored as two's complement."""
+        bits = BitBuffer()
+        bits.push(-1, 8)
+        bits.push(-128, 8)
+        self.assertEqual(bits.to_binary(), "1111111110000000")
+
+    def test_oversized_values_truncate(self):
+        """Test values wider than the field keep only their low bits."""
+        bits = BitBuffer()
+        bits.push(0x1FF, 4)
+        self.assertEqual(bits.to_binary(), "1111")
+
+    def test_pad_to(self):
+        """Test zero padding up to a multiple of the given width."""
+        bits = BitBuffer()
+        bits.push(1, 1)
+        bits.pad_to(6)
+        self.assertEqual(bits.to_binary(), "100000")
+        bits.pad_to(6)
+        self.assertEqual(len(bits), 6)
+
+    def test_empty_buffer(self):
+        """Test an empty buffer renders as an empty string."""
+        self.assertEqual(BitBuffer().to_binary(), "")
+
+
+class TestAISEncoding(unittest.TestCase):
+    """Test AIS payload armoring and message encoding against reference output."""
+
+    def test_6bit_round_trip(self):
+        """Test every 6-bit value survives encoding and decoding."""
+        binary = "".join(format(v, "06b") for v in range(64))
+        encoded = AIS6BitEncoder.encode_binary_to_6bit(binary)
+        self.assertEqual(encoded[:40], "0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVW")
+        self.assertEqual(encoded[40:], "`abcdefghijklmnopqrstuvw")
+        self.assertEqual(AIS6BitEncoder.decode_6bit_to_binary(encoded), binary)
+
+    def test_type_1_golden(self):
+        """Test a Type 1 position report matches the reference sentence."""
+        vessel = create_vessel_state(
+            477553000, "", Position(28549700 / 600000, -73407500 / 600000),
+            nav_status=NavigationStatus(5), rot=0, sog=0.0, cog=51.0,
+            heading=181, timestamp=15, radio_status=149208
+        )
+        sentences, _ = AISMessageGenerator().generate_message(1, vessel, 'B')
+        self.assertEqual(sentences, [TYPE_1_SENTENCE])
+
+    def test_type_5_golden(self):
+        """Test a Type 5 static report matches the reference payload."""
+        vessel = create_vessel_state(
+            351759000, "EVER DIADEM", Position(0.0, 0.0),
+            callsign="3FOF8", ship_type=ShipType(70), imo_number=9134270,
+            dimensions=VesselDimensions(225, 70, 1, 31), epfd_type=EPFDType(1),
+            destination="NEW YORK", draught=12.2, dte=0, eta=VesselETA(5, 15, 14, 0)
+        )
+        sentences, _ = AISMessageGenerator().generate_message(5, vessel, 'A')
+
+        self.assertEqual(len(sentences), 2)
+        for sentence in sentences:
+            self.assertTrue(validate_aivdm_sentence(sentence))
+        payload = "".join(sentence.split(",")[5] for sentence in sentences)
+        self.assertEqual(payload, TYPE_5_PAYLOAD)
+        self.assertTrue(sentences[-1].endswith(",2*53"))
+
+
+if __name__ == '__main__':
+    unittest.main()
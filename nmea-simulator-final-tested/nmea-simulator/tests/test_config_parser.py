@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to allow imports from simulator and nmea_lib
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulator.config.parser import ConfigParser
+from simulator.utils.json_io import read_json, write_json
+
+CONFIG_YAML = """\
+vessel:
+  name: {name}
+  initial_speed: 12.5
+"""
+
+
+class TestConfigParserCache(unittest.TestCase):
+    """Tests for the parsed-YAML JSON cache used by ConfigParser.from_file."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.tmp_dir, 'sim.yaml')
+        self.cache_path = self.config_path + '.cache.json'
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write_config(self, text):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def _tamper_cache(self, name):
+        """Rewrite the cached vessel name, keeping the recorded source key."""
+        cached = read_json(self.cache_path)
+        cached['data']['vessel']['name'] = name
+        write_json(self.cache_path, cached)
+
+    def test_cache_hit_reuses_cached_data(self):
+        self._write_config(CONFIG_YAML.format(name='ALPHA'))
+        self.assertEqual(ConfigParser.from_file(self.config_path).vessel_name, 'ALPHA')
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        # Data served from the cache, not re-parsed from the YAML
+        self._tamper_cache('FROM_CACHE')
+        self.assertEqual(ConfigParser.from_file(self.config_path).vessel_name, 'FROM_CACHE')
+
+        # use_cache=False always parses the YAML
+        self.assertEqual(ConfigParser.from_file(self.config_path, use_cache=False).vessel_name, 'ALPHA')
+
+    def test_stale_cache_on_size_change(self):
+        self._write_config(CONFIG_YAML.format(name='ALPHA'))
+        ConfigParser.from_file(self.config_path)
+
+        self._write_config(CONFIG_YAML.format(name='BRAVO_LONGER'))
+        self.assertEqual(ConfigParser.from_file(self.config_path).vessel_name, 'BRAVO_LONGER')
+
+    def test_stale_cache_on_mtime_change(self):
+        self._write_config(CONFIG_YAML.format(name='ALPHA'))
+        ConfigParser.from_file(self.config_path)
+        self._tamper_cache('FROM_CACHE')
+
+        # Same size, newer mtime: the cache no longer matches the file
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(ConfigParser.from_file(self.config_path).vessel_name, 'ALPHA')
+
+    def test_values_without_json_round_trip_are_not_cached(self):
+        # YAML timestamps and integer keys would come back from JSON as strings
+        self._write_config(CONFIG_YAML.format(name='ALPHA') + "notes:\n  1: 2024-01-01T00:00:00Z\n")
+
+        first = ConfigParser.from_file(self.config_path)
+        self.assertFalse(os.path.exists(self.cache_path))
+        second = ConfigParser.from_file(self.config_path)
+        self.assertEqual(first.vessel_name, second.vessel_name)
+        self.assertEqual(first.initial_speed, 12.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
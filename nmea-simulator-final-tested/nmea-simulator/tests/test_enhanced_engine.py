@@ -0,0 +1,96 @@
+"""Unit tests for the enhanced simulation engine."""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulator.core.enhanced_engine import (
+    EnhancedSimulationEngine, SimulationConfig, SimulationStats
+)
+from simulator.generators.vessel import create_default_vessel_config
+from nmea_lib.types import Position
+
+
+class TestEngineStatistics(unittest.TestCase):
+    """Test engine statistics reporting."""
+
+    def setUp(self):
+        self.engine = EnhancedSimulationEngine(SimulationConfig())
+
+    def test_get_statistics_returns_dict(self):
+        """Test get_statistics keeps returning a plain dict."""
+        self.engine.stats.increment('sentences_sent', 3)
+        self.engine.stats.increment('errors')
+
+        stats = self.engine.get_statistics()
+
+        self.assertIsInstance(stats, dict)
+        self.assertEqual(stats['sentences_sent'], 3)
+        self.assertEqual(stats['errors'], 1)
+        for key in ('start_time', 'gps_sentences', 'ais_sentences', 'vessels_active',
+                    'runtime_seconds', 'sentences_per_second', 'ais_scheduler_stats'):
+            self.assertIn(key, stats)
+
+    def test_stats_snapshot_is_detached(self):
+        """Test the snapshot does not follow later counter changes."""
+        self.engine.stats.increment('sentences_sent', 2)
+
+        snapshot = self.engine.get_stats_snapshot()
+        self.engine.stats.increment('sentences_sent', 5)
+
+        self.assertIsInstance(snapshot, SimulationStats)
+        self.assertEqual(snapshot.sentences_sent, 2)
+        self.assertEqual(self.engine.get_statistics()['sentences_sent'], 7)
+
+
+class TestEngineFleet(unittest.TestCase):
+    """Test the batched fleet across vessel additions and removals."""
+
+    def _vessel_config(self, mmsi):
+        return create_default_vessel_config(
+            mmsi=mmsi,
+            name=f"FLEET {mmsi}",
+            position=Position(latitude=50.0, longitude=-1.0 + (mmsi % 100) * 0.01)
+        )
+
+    def _run(self, add_every_minute):
+        """Step one vessel for 20 simulated minutes and return its distinct courses."""
+        engine = EnhancedSimulationEngine(SimulationConfig(enable_ais=False))
+        mmsi = engine.add_vessel(self._vessel_config(235000001))
+        current_time = datetime(2025, 1, 1, 12, 0, 0)
+        courses = set()
+        for second in range(1, 20 * 60 + 1):
+            current_time += timedelta(seconds=1)
+            engine._update_vessel_positions(current_time)
+            courses.add(engine.vessel_generators[mmsi].get_current_state().navigation_data.cog)
+            if add_every_minute and second % 60 == 0:
+                engine.add_vessel(self._vessel_config(235000001 + second // 60))
+        return engine, courses
+
+    def test_course_changes_continue_after_adding_vessels(self):
+        """Test adding vessels mid-run does not restart the course-change clock."""
+        _, baseline_courses = self._run(add_every_minute=False)
+        engine, courses = self._run(add_every_minute=True)
+
+        self.assertGreater(len(courses), 1, "Vessel should still change course")
+        # Shared random stream, so the values differ but the clock does not
+        self.assertEqual(len(courses), len(baseline_courses))
+        self.assertEqual(len(engine._fleet), 21)
+        self.assertEqual(engine.stats.errors, 0)
+
+    def test_remove_vessel_drops_fleet_row(self):
+        """Test removing a vessel takes it out of the built fleet."""
+        engine, _ = self._run(add_every_minute=True)
+        engine.remove_vessel(235000005)
+
+        self.assertEqual(len(engine._fleet), 20)
+        self.assertNotIn(235000005, [vessel.mmsi for vessel in engine._fleet.vessels])
+        engine._update_vessel_positions(datetime(2025, 1, 1, 12, 30, 0))
+        self.assertEqual(engine.stats.errors, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
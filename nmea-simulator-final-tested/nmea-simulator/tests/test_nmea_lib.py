@@ -1,11 +1,14 @@
 """Unit tests for NMEA library core functionality."""
 
 import unittest
+from functools import reduce
+from operator import xor
 from nmea_lib import (
     SentenceValidator, SentenceParser, SentenceFactory,
     GGASentence, RMCSentence, TalkerId, SentenceId,
     Position, NMEATime, NMEADate, Speed, SpeedUnit
 )
+from nmea_lib.validator import xor_checksum
 
 
 class TestSentenceValidator(unittest.TestCase):
@@ -32,6 +35,21 @@ class TestSentenceValidator(unittest.TestCase):
         expected_checksum = "71"
         calculated = SentenceValidator.calculate_checksum(sentence_body)
         self.assertEqual(calculated, expected_checksum)
+    
+    def test_xor_checksum_known_values(self):
+        """Test the folded XOR checksum against known sentence bodies."""
+        self.assertEqual(xor_checksum(b""), 0)
+        self.assertEqual(xor_checksum(b"A"), 0x41)
+        self.assertEqual(
+            xor_checksum(b"GPGGA,120044,6011.552,N,02501.941,E,1,08,2.0,28.0,M,19.6,M,,"), 0x71
+        )
+        self.assertEqual(xor_checksum(b"AIVDM,1,1,,B,177KQJ5000G?tO`K>RA1wUbN0TKH,0"), 0x5C)
+    
+    def test_xor_checksum_matches_byte_loop(self):
+        """Test the folded XOR checksum agrees with a byte loop at every length."""
+        data = bytes(range(32, 127)) * 4
+        for n in range(len(data) + 1):
+            self.assertEqual(xor_checksum(data[:n]), reduce(xor, data[:n], 0), n)
 
 
 class TestSentenceParser(unittest.TestCase):
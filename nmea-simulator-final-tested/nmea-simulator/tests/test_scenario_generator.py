@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add project root to allow imports from simulator and nmea_lib
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nmea_lib.types import Position
+from nmea_lib.validator import SentenceValidator
+from simulator.generators.fleet import VesselFleet
+from simulator.generators.scenario_generator import CompleteScenarioGenerator, ScenarioGenerationConfig
+from simulator.generators.vessel import EnhancedVesselGenerator, create_default_vessel_config
+
+
+class TestScenarioGeneratorGPS(unittest.TestCase):
+    """Tests for the GPS lines written by CompleteScenarioGenerator."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_gps_lines_are_valid_gga_and_rmc(self):
+        config = ScenarioGenerationConfig(
+            start_time=datetime(2025, 7, 4, 12, 0, 0),
+            duration_minutes=8 / 60,
+            output_dir=self.tmp_dir,
+            vessel_count=4,
+            include_ais=False
+        )
+        generator = CompleteScenarioGenerator(config)
+        files = generator.generate_scenario()
+
+        with open(files['nmea_file'], 'r') as f:
+            lines = [line.rstrip('\n') for line in f]
+
+        self.assertTrue(lines)
+        gga = [line for line in lines if line.startswith('$GPGGA,')]
+        rmc = [line for line in lines if line.startswith('$GPRMC,')]
+        self.assertEqual(len(gga) + len(rmc), len(lines), f"Unexpected lines: {lines[:4]}")
+        self.assertEqual(len(gga), len(rmc))
+        for line in lines:
+            self.assertTrue(SentenceValidator.is_valid(line), f"Invalid sentence: {line!r}")
+
+
+class TestVesselFleet(unittest.TestCase):
+    """Tests that the batched fleet step matches per-vessel updates."""
+
+    def test_fleet_matches_vessel_generator(self):
+        config = create_default_vessel_config(
+            mmsi=235000001,
+            name="FLEET TEST",
+            position=Position(latitude=50.0, longitude=-1.0)
+        )
+        reference = EnhancedVesselGenerator(config)
+        fleet_vessel = EnhancedVesselGenerator(config)
+        fleet = VesselFleet(
+            [fleet_vessel.get_current_state()],
+            seed=config.get('seed', 42),
+            max_speed=fleet_vessel.max_speed,
+            position_noise=fleet_vessel.movement_pattern.position_noise
+        )
+
+        # Short course-change interval so the run covers several course changes
+        reference.course_change_interval = fleet.course_change_interval = timedelta(seconds=30)
+        current_time = datetime(2025, 1, 1, 12, 0, 0)
+        # Both course-change clocks start at the first step
+        reference.last_course_change = current_time + timedelta(seconds=1)
+        courses = set()
+        for _ in range(120):
+            current_time += timedelta(seconds=1)
+            expected = reference.update_vessel_state(1.0, current_time).navigation_data
+            fleet.step(1.0, current_time)
+            actual = fleet_vessel.get_current_state().navigation_data
+
+            self.assertAlmostEqual(actual.position.latitude, expected.position.latitude, places=9)
+            self.assertAlmostEqual(actual.position.longitude, expected.position.longitude, places=9)
+            self.assertEqual(actual.sog, expected.sog)
+            self.assertEqual(actual.cog, expected.cog)
+            self.assertEqual(actual.heading, expected.heading)
+            self.assertEqual(actual.rot, expected.rot)
+            self.assertEqual(actual.nav_status, expected.nav_status)
+            self.assertEqual(actual.timestamp, expected.timestamp)
+            courses.add(actual.cog)
+
+        self.assertGreater(len(courses), 1, "Run should include course changes")
+
+
+if __name__ == '__main__':
+    unittest.main()